@@ -0,0 +1,77 @@
+# Backend/base.py
+
+from Backend import constants
+
+class SimulationBackend:
+    """
+    Interface between the controllers and a traffic simulator.
+
+    A backend exposes the TraCI domains the project uses under their TraCI names, so that call sites
+    read the same for every implementation:
+
+        backend.vehicle     add, subscribe, getAllSubscriptionResults, getIDList, getPosition, getAngle,
+                            getLength, setSpeed, setSpeedMode, setLaneChangeMode, changeLane, moveToXY,
+                            setRouteID
+        backend.poi         add, setParameter, setPosition, remove, getIDList
+        backend.simulation  subscribe, getSubscriptionResults, convertRoad, getTime, saveState, loadState
+        backend.lane        getLength
+        backend.route       getIDList
+
+    Failed commands raise backend.TraCIException. Variable identifiers for subscriptions are
+    available as backend.constants.
+    """
+
+    name = "base"
+    constants = constants            # TraCI variable identifiers
+    TraCIException = Exception       # Exception type raised by failed commands
+
+    def __init__(self):
+        self.vehicle = None          # Vehicle domain
+        self.poi = None              # Point-of-interest domain
+        self.simulation = None       # Simulation domain
+        self.lane = None             # Lane domain
+        self.route = None            # Route domain
+        self.running = False         # Whether a simulation is currently loaded
+
+    def start(self, cmd):
+        """
+        Launch (or load) a simulation.
+
+        Args:
+            cmd (List[str]): SUMO command line, e.g. ["sumo", "-c", "Sim/temp.sumocfg"].
+        """
+        raise NotImplementedError
+
+    def simulationStep(self):
+        """
+        Advance the simulation by one time step.
+        """
+        raise NotImplementedError
+
+    def close(self):
+        """
+        Shut the simulation down. Does nothing if it is not running.
+        """
+        raise NotImplementedError
+
+    def get_vehicle_columns(self, veh_ids, var_ids):
+        """
+        Subscribed variables of several vehicles as columns, for controllers that process the whole fleet
+        with array operations. This default transposes vehicle.getAllSubscriptionResults(); backends that
+        keep their vehicle state in arrays return slices of those arrays instead.
+
+        Args:
+            veh_ids (List[str]): Vehicles to read.
+            var_ids (Iterable[int]): Subscribed variable IDs to return.
+
+        Returns:
+            Tuple[List[int], Dict[int, Sequence]]: Indices into veh_ids of the vehicles with subscription
+            results, and variable ID → values of those vehicles in the same order.
+        """
+        results = self.vehicle.getAllSubscriptionResults()
+        found = [i for i, veh_id in enumerate(veh_ids) if veh_id in results]
+        states = [results[veh_ids[i]] for i in found]
+        return found, {var_id: [state[var_id] for state in states] for var_id in var_ids}
+
+    def __repr__(self):
+        return f"{type(self).__name__}(running={self.running})"
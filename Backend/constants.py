@@ -0,0 +1,19 @@
+# Backend/constants.py
+
+# TraCI variable identifiers used by the project, with the values defined by SUMO's TraCI protocol
+# (traci.constants). Kept here so that code paths running on the in-memory backend need no SUMO install.
+
+# ===== Vehicle variables =====
+VAR_SPEED = 0x40
+VAR_POSITION = 0x42
+VAR_ANGLE = 0x43
+VAR_LENGTH = 0x44
+VAR_ROAD_ID = 0x50
+VAR_LANE_ID = 0x51
+VAR_ROUTE_ID = 0x53
+VAR_EDGES = 0x54
+VAR_LANEPOSITION = 0x56
+
+# ===== Simulation variables =====
+VAR_DEPARTED_VEHICLES_IDS = 0x74
+VAR_ARRIVED_VEHICLES_IDS = 0x7a
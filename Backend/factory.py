@@ -0,0 +1,121 @@
+# Backend/factory.py
+
+import importlib.util
+import os
+import shutil
+import threading
+
+BACKEND_NAMES = ("auto", "traci", "libsumo", "inmemory", "kinematic")
+
+_default_backend = None  # Backend used by code paths that were not given one explicitly
+_backend_lock = threading.Lock()  # Serializes "auto" resolution with the libsumo claim of the created backend
+
+
+def _sumo_installed():
+    """
+    Returns:
+        bool: Whether a SUMO binary can be found on PATH or under SUMO_HOME.
+    """
+    if shutil.which("sumo"):
+        return True
+    sumo_home = os.environ.get("SUMO_HOME")
+    return bool(sumo_home) and os.path.exists(os.path.join(sumo_home, "bin", "sumo"))
+
+
+def _module_available(name):
+    return importlib.util.find_spec(name) is not None
+
+
+def _libsumo_claimed():
+    """
+    Must be called with _backend_lock held, so that the libsumo backend module is fully imported
+    and no other thread can claim libsumo between this check and the creation of the backend.
+
+    Returns:
+        bool: Whether this process's single libsumo simulation is already held by a backend.
+    """
+    from Backend.libsumo_backend import LibsumoBackend
+    return LibsumoBackend.is_claimed()
+
+
+def resolve_backend_name(name="auto", gui=False):
+    """
+    Resolve "auto" to the fastest backend usable in this deployment:
+    libsumo (in-process) when no GUI is needed and no other backend of this process holds it,
+    TraCI when SUMO is installed, the in-memory stand-in otherwise. Falling back to the stand-in prints
+    a warning, since it has no car-following model; name "inmemory" explicitly to run on it on purpose.
+
+    Args:
+        name (str, optional): One of BACKEND_NAMES. Defaults to "auto".
+        gui (bool, optional): Whether sumo-gui will be used (libsumo cannot drive the GUI).
+
+    Returns:
+        str: A concrete backend name.
+    """
+    with _backend_lock:
+        return _resolve_backend_name(name, gui)
+
+
+def _resolve_backend_name(name, gui):
+    """
+    resolve_backend_name() for callers holding _backend_lock.
+    """
+    if name not in BACKEND_NAMES:
+        raise ValueError(f"Unknown simulation backend '{name}', expected one of {BACKEND_NAMES}")
+    if name != "auto":
+        return name
+    if not gui and _module_available("libsumo") and not _libsumo_claimed():
+        return "libsumo"
+    if _sumo_installed() and _module_available("traci"):
+        return "traci"
+    print("[WARN] Backend 'auto' found neither libsumo nor a SUMO installation with traci; falling back to "
+          "the in-memory stand-in, which has no car-following or collision model. Install SUMO (or set "
+          "SUMO_HOME), or set backend to 'inmemory' to use the stand-in deliberately.")
+    return "inmemory"
+
+
+def create_backend(name="auto", gui=False, net_file=None, route_file=None, label=None, cache_dir=None):
+    """
+    Create a simulation backend.
+
+    Args:
+        name (str, optional): "traci", "libsumo", "inmemory", "kinematic" or "auto". Defaults to "auto".
+        gui (bool, optional): Whether sumo-gui will be started; only relevant for "auto".
+        net_file (str, optional): Network file for the in-memory backends. Defaults to config value.
+        route_file (str, optional): Route file for the in-memory backends. Defaults to config value.
+        label (str, optional): TraCI connection label, giving the backend its own connection.
+            Defaults to None (traci's current connection). Ignored by the other backends.
+        cache_dir (str, optional): Compiled network cache of the in-memory backends. Defaults to None (no cache).
+
+    Returns:
+        SimulationBackend: The created backend (not yet started).
+    """
+    with _backend_lock:
+        # Environments may be created from several threads (see Env/async_env.py): the libsumo backend
+        # claims the process's simulation in its constructor, so resolve and claim in one critical section
+        name = _resolve_backend_name(name, gui)
+        if name == "libsumo":
+            from Backend.libsumo_backend import LibsumoBackend
+            return LibsumoBackend()
+    if name == "traci":
+        from Backend.traci_backend import TraciBackend
+        return TraciBackend(label=label)
+    if name == "kinematic":
+        from Backend.kinematic_backend import KinematicBackend
+        return KinematicBackend(net_file=net_file, route_file=route_file, cache_dir=cache_dir)
+    from Backend.inmemory_backend import InMemoryBackend
+    return InMemoryBackend(net_file=net_file, route_file=route_file, cache_dir=cache_dir)
+
+
+def get_default_backend():
+    """
+    Backend used when a controller or entity helper is not given one: the TraCI default connection,
+    matching the behaviour of code that calls traci directly.
+
+    Returns:
+        SimulationBackend: The shared default backend.
+    """
+    global _default_backend
+    if _default_backend is None:
+        _default_backend = create_backend("traci")
+    return _default_backend
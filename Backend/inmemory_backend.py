@@ -0,0 +1,578 @@
+# Backend/inmemory_backend.py
+
+import pickle
+import numpy as np
+from Backend.base import SimulationBackend
+from Entity.lane_geometry import LaneGeometry
+from Sumo.sumo_netxml_parser import NetXMLParser
+from Sumo.sumo_routexml_parser import RouteXMLParser
+from Config.config import default_config
+
+INVALID_DOUBLE_VALUE = -1073741824.0  # Returned by TraCI for vehicles that are not yet inserted
+
+
+class InMemoryTraCIError(Exception):
+    """
+    Raised by the in-memory backend where TraCI would raise traci.TraCIException.
+    """
+
+
+class SimVehicle:
+    __slots__ = ("id", "route_id", "edges", "edge_index", "lane_id", "lane_pos", "speed", "commanded_speed",
+                 "length", "max_speed", "accel", "speed_mode", "lane_change_mode", "pending_move")
+
+    def __init__(self, id, route_id, edges, lane_id, lane_pos, speed, vehicle_type):
+        """
+        State of one vehicle in the in-memory simulation. Positions refer to the vehicle front, as in SUMO.
+
+        Args:
+            id (str): Vehicle ID.
+            route_id (str): ID of the route the vehicle follows.
+            edges (Tuple[str]): Edge IDs of the route.
+            lane_id (str): Lane the vehicle departs on.
+            lane_pos (float): Front position along the lane.
+            speed (float): Departure speed (m/s).
+            vehicle_type (VehicleType): Physical properties of the vehicle.
+        """
+        self.id = id
+        self.route_id = route_id
+        self.edges = edges
+        self.edge_index = 0               # Index of the current edge in edges
+        self.lane_id = lane_id            # Current lane
+        self.lane_pos = lane_pos          # Front position along the current lane
+        self.speed = speed                # Current speed (m/s)
+        self.commanded_speed = None       # Speed fixed by setSpeed, None to follow the lane speed limit
+        self.length = vehicle_type.length
+        self.max_speed = vehicle_type.max_speed
+        self.accel = vehicle_type.accel
+        self.speed_mode = 31              # Stored only, the stand-in has no car-following checks
+        self.lane_change_mode = 1621      # Stored only, the stand-in never changes lanes on its own
+        self.pending_move = None          # (edge_id, lane_index, x, y) placement applied at the next step
+
+
+class InMemoryBackend(SimulationBackend):
+    """
+    Deterministic in-process stand-in for SUMO, built from the same .net.xml/.rou.xml files.
+
+    Vehicles drive along their route lane by lane at the speed set by setSpeed (or accelerate towards
+    the lane speed limit), follow the junction connections of the network, and arrive at the end of
+    the last edge. There is no car-following or collision model: the stand-in exists to run controller
+    logic, tests and benchmarks on machines without SUMO, not to reproduce SUMO's dynamics.
+    """
+
+    name = "inmemory"
+    TraCIException = InMemoryTraCIError
+
+    def __init__(self, net_file=None, route_file=None, step_length=None, cache_dir=None):
+        """
+        Args:
+            net_file (str, optional): Path to the .net.xml file. Defaults to config value.
+            route_file (str, optional): Path to the .rou.xml file. Defaults to config value.
+            step_length (float, optional): Simulated seconds per step. Defaults to config value.
+            cache_dir (str, optional): Directory of compiled network artifacts. Defaults to None (always parse the XML).
+        """
+        super().__init__()
+        net_parser = NetXMLParser(net_file or default_config["net_file"], cache_dir=cache_dir)
+        route_parser = RouteXMLParser(route_file or default_config["route_file"])
+        self.step_length = step_length if step_length is not None else default_config["time_step"]
+
+        self.lanes = {}           # Lane ID → Lane, junction-internal lanes excluded
+        self.geometries = {}      # Lane ID → single-lane LaneGeometry used for interpolation and projection
+        self.edge_lanes = {}      # Edge ID → lane IDs ordered by index
+        for lane_id, lane in net_parser.lane_dict.items():
+            if lane_id.startswith(":"):
+                continue
+            geometry = LaneGeometry(start_lane_id=lane_id)
+            geometry.add_lane(lane)
+            self.lanes[lane_id] = lane
+            self.geometries[lane_id] = geometry
+            self.edge_lanes.setdefault(lane_id.rsplit("_", 1)[0], []).append(lane_id)
+        for lane_ids in self.edge_lanes.values():
+            lane_ids.sort(key=lambda lane_id: self.lanes[lane_id].index)
+        self.lane_ids = list(self.lanes)  # Lane code → lane ID
+        self.lane_boxes = np.array([self.geometries[lane_id].get_bounding_box() for lane_id in self.lane_ids],
+                                   dtype=np.float64).reshape(-1, 4)  # Lane code → (xmin, ymin, xmax, ymax)
+        self.successors = net_parser.get_lane_connections()  # Lane ID → lane IDs reached through a junction
+
+        self.routes = {route_id: tuple(route.edges) for route_id, route in route_parser.get_routes().items()}
+        self.vehicle_types = route_parser.get_vehicle_types()
+        self.default_type_id = next(iter(self.vehicle_types), None)
+
+        self.vehicle = VehicleDomain(self)
+        self.poi = PoiDomain(self)
+        self.simulation = SimulationDomain(self)
+        self.lane = LaneDomain(self)
+        self.route = RouteDomain(self)
+        self._reset_state()
+
+    def _reset_state(self):
+        self.time = 0.0
+        self.vehicles = {}                 # Vehicle ID → SimVehicle, vehicles driving in the network
+        self.pending_vehicles = {}         # Vehicle ID → SimVehicle, added but not yet inserted
+        self.vehicle_subscriptions = {}    # Vehicle ID → subscribed variable IDs
+        self.simulation_subscriptions = ()  # Subscribed simulation variable IDs
+        self.departed = ()                 # Vehicles inserted during the last step
+        self.arrived = ()                  # Vehicles that left the network during the last step
+        self.pois = {}                     # POI ID → {"x", "y", "color", "layer", "params"}
+        self.moved_vehicle_ids = {}        # Vehicle ID → None, vehicles with a pending moveToXY (insertion order)
+
+    def start(self, cmd=None):
+        """
+        Reset the in-memory simulation. The SUMO command line is accepted for interface
+        compatibility and ignored; the network comes from the files given to the constructor.
+        """
+        self._reset_state()
+        self.running = True
+
+    def close(self):
+        self.running = False
+
+    # ===== Saved states =====
+
+    STATE_ATTRIBUTES = ("time", "vehicles", "pending_vehicles", "departed", "arrived", "moved_vehicle_ids")
+
+    def save_state(self, file_name):
+        """
+        Write the vehicle state of the simulation to a file (simulation.saveState).
+
+        Args:
+            file_name (str): Path of the state file.
+        """
+        with open(file_name, "wb") as f:
+            pickle.dump({name: getattr(self, name) for name in self.STATE_ATTRIBUTES}, f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+
+    def load_state(self, file_name):
+        """
+        Replace the vehicle state of the simulation by a saved one (simulation.loadState).
+        As in SUMO, POIs are kept while subscriptions, speed modes, lane change modes and
+        speeds set through setSpeed are dropped.
+
+        Args:
+            file_name (str): Path of a file written by save_state().
+        """
+        with open(file_name, "rb") as f:
+            state = pickle.load(f)
+        for name in self.STATE_ATTRIBUTES:
+            setattr(self, name, state[name])
+        self.vehicle_subscriptions = {}
+        self.simulation_subscriptions = ()
+        for veh in list(self.vehicles.values()) + list(self.pending_vehicles.values()):
+            veh.commanded_speed = None
+            veh.speed_mode = 31
+            veh.lane_change_mode = 1621
+
+    # ===== Simulation =====
+
+    def simulationStep(self):
+        """
+        Move every vehicle along its route, then insert the vehicles added since the last step
+        and apply pending moveToXY placements.
+        """
+        self.time += self.step_length
+        arrived = []
+        for veh in list(self.vehicles.values()):
+            self._advance(veh)
+            if veh.edge_index < 0:
+                arrived.append(veh.id)
+        for veh_id in arrived:
+            self._remove_vehicle(veh_id)
+
+        departed = list(self.pending_vehicles)
+        for veh in self.pending_vehicles.values():
+            self._insert_vehicle(veh)
+        self.pending_vehicles = {}
+        self._apply_moves()
+
+        self.departed = tuple(departed)
+        self.arrived = tuple(arrived)
+
+    def _insert_vehicle(self, veh):
+        """
+        Put an added vehicle into the network.
+
+        Args:
+            veh (SimVehicle): The vehicle leaving the pending state.
+        """
+        self.vehicles[veh.id] = veh
+
+    def _remove_vehicle(self, veh_id):
+        """
+        Take an arrived vehicle out of the network and drop its subscription.
+
+        Args:
+            veh_id (str): ID of the vehicle.
+        """
+        del self.vehicles[veh_id]
+        self.vehicle_subscriptions.pop(veh_id, None)
+
+    def _apply_moves(self):
+        """
+        Apply the moveToXY placements requested since the last step, in request order.
+        """
+        for veh_id in self.moved_vehicle_ids:
+            veh = self.vehicles.get(veh_id)
+            if veh is not None and veh.pending_move is not None:
+                self._apply_move(veh)
+        self.moved_vehicle_ids = {}
+
+    def _advance(self, veh):
+        """
+        Advance one vehicle by one step. Sets veh.edge_index to -1 when it reaches the end of its route.
+        """
+        if veh.commanded_speed is not None:
+            veh.speed = veh.commanded_speed
+        else:
+            target = min(self.lanes[veh.lane_id].speed, veh.max_speed)
+            veh.speed = min(target, veh.speed + veh.accel * self.step_length) if veh.speed < target else target
+        veh.lane_pos += veh.speed * self.step_length
+        self._follow_route(veh)
+
+    def _follow_route(self, veh):
+        """
+        Carry a vehicle whose position passed the end of its lane over to the next lanes of its route.
+        Sets veh.edge_index to -1 when it runs off the end of the route.
+        """
+        while veh.lane_pos > self.geometries[veh.lane_id].get_total_length():
+            overflow = veh.lane_pos - self.geometries[veh.lane_id].get_total_length()
+            if veh.edge_index + 1 >= len(veh.edges):
+                veh.edge_index = -1  # Arrived
+                return
+            veh.edge_index += 1
+            veh.lane_id = self._next_lane(veh.lane_id, veh.edges[veh.edge_index])
+            veh.lane_pos = overflow
+
+    def _next_lane(self, lane_id, next_edge):
+        """
+        Pick the lane of the next edge reached from a lane: its junction connection if it has one,
+        otherwise the lane of the next edge with the closest index.
+        """
+        for successor in self.successors.get(lane_id, ()):
+            if successor.rsplit("_", 1)[0] == next_edge:
+                return successor
+        candidates = self.edge_lanes.get(next_edge)
+        if not candidates:
+            raise InMemoryTraCIError(f"Edge '{next_edge}' is not known.")
+        index = self.lanes[lane_id].index
+        return min(candidates, key=lambda candidate: abs(self.lanes[candidate].index - index))
+
+    def _apply_move(self, veh):
+        edge_id, lane_index, x, y = veh.pending_move
+        veh.pending_move = None
+        lane_id = f"{edge_id}_{lane_index}"
+        if lane_id not in self.lanes:
+            return
+        if edge_id in veh.edges[max(veh.edge_index, 0):]:
+            veh.edge_index = veh.edges.index(edge_id, max(veh.edge_index, 0))
+        veh.lane_id = lane_id
+        veh.lane_pos, _ = self.geometries[lane_id].project_point(x, y)
+
+    def get_vehicle(self, veh_id):
+        """
+        Returns:
+            SimVehicle: The driving vehicle with the given ID.
+
+        Raises:
+            InMemoryTraCIError: If the vehicle is not in the network.
+        """
+        veh = self.vehicles.get(veh_id)
+        if veh is None:
+            raise InMemoryTraCIError(f"Vehicle '{veh_id}' is not known.")
+        return veh
+
+    def get_front_and_angle(self, veh):
+        """
+        Returns:
+            Tuple[Tuple[float, float], float]: Front (x, y) of the vehicle and its SUMO angle
+            (degrees clockwise from north).
+        """
+        position, heading = self.geometries[veh.lane_id].interpolate_position_and_heading(veh.lane_pos)
+        return position, (90.0 - heading) % 360.0
+
+    def get_vehicle_variable(self, veh, var_id):
+        """
+        Read one subscribable variable of a vehicle.
+        """
+        c = self.constants
+        if var_id == c.VAR_POSITION or var_id == c.VAR_ANGLE:
+            position, angle = self.get_front_and_angle(veh)
+            return position if var_id == c.VAR_POSITION else angle
+        if var_id == c.VAR_SPEED:
+            return veh.speed
+        if var_id == c.VAR_LENGTH:
+            return veh.length
+        if var_id == c.VAR_ROAD_ID:
+            return veh.edges[veh.edge_index]
+        if var_id == c.VAR_LANE_ID:
+            return veh.lane_id
+        if var_id == c.VAR_ROUTE_ID:
+            return veh.route_id
+        if var_id == c.VAR_EDGES:
+            return veh.edges
+        if var_id == c.VAR_LANEPOSITION:
+            return veh.lane_pos
+        raise InMemoryTraCIError(f"Vehicle variable 0x{var_id:02x} is not supported by the in-memory backend.")
+
+    def get_subscription_results(self):
+        """
+        Returns:
+            Dict[str, Dict[int, object]]: Vehicle ID → subscribed variable ID → value, for the
+            subscribed vehicles currently driving in the network.
+        """
+        results = {}
+        for veh_id, var_ids in self.vehicle_subscriptions.items():
+            veh = self.vehicles.get(veh_id)
+            if veh is not None:
+                results[veh_id] = {var_id: self.get_vehicle_variable(veh, var_id) for var_id in var_ids}
+        return results
+
+
+class VehicleDomain:
+    def __init__(self, backend):
+        self._backend = backend
+
+    def add(self, vehID, routeID, typeID="DEFAULT_VEHTYPE", depart="now", departLane="first",
+            departPos="base", departSpeed="0", **kwargs):
+        backend = self._backend
+        if vehID in backend.vehicles or vehID in backend.pending_vehicles:
+            raise InMemoryTraCIError(f"Vehicle '{vehID}' to add already exists.")
+        edges = backend.routes.get(routeID)
+        if edges is None:
+            raise InMemoryTraCIError(f"Invalid route '{routeID}' for vehicle '{vehID}'.")
+        vehicle_type = backend.vehicle_types.get(typeID) or backend.vehicle_types.get(backend.default_type_id)
+
+        lane_ids = backend.edge_lanes[edges[0]]
+        lane_index = int(departLane) if str(departLane).isdigit() else 0
+        lane_id = lane_ids[min(lane_index, len(lane_ids) - 1)]
+        lane_speed = min(backend.lanes[lane_id].speed, vehicle_type.max_speed)
+        try:
+            lane_pos = float(departPos)
+        except ValueError:
+            lane_pos = vehicle_type.length  # "base": back of the vehicle at the lane start
+        try:
+            speed = float(departSpeed)
+        except ValueError:
+            speed = lane_speed  # "max", "desired", ...
+
+        backend.pending_vehicles[vehID] = SimVehicle(vehID, routeID, edges, lane_id, lane_pos, speed, vehicle_type)
+
+    def _get(self, vehID):
+        return self._backend.get_vehicle(vehID)
+
+    def _get_inserted(self, vehID):
+        """
+        Returns:
+            SimVehicle or None: The vehicle, or None if it was added but is not yet inserted
+            (TraCI then answers with invalid values instead of an error).
+        """
+        if vehID in self._backend.pending_vehicles:
+            return None
+        return self._get(vehID)
+
+    def _get_any(self, vehID):
+        veh = self._backend.vehicles.get(vehID) or self._backend.pending_vehicles.get(vehID)
+        if veh is None:
+            raise InMemoryTraCIError(f"Vehicle '{vehID}' is not known.")
+        return veh
+
+    def getIDList(self):
+        return tuple(self._backend.vehicles)
+
+    def getPosition(self, vehID):
+        veh = self._get_inserted(vehID)
+        return (INVALID_DOUBLE_VALUE, INVALID_DOUBLE_VALUE) if veh is None else self._backend.get_front_and_angle(veh)[0]
+
+    def getAngle(self, vehID):
+        veh = self._get_inserted(vehID)
+        return INVALID_DOUBLE_VALUE if veh is None else self._backend.get_front_and_angle(veh)[1]
+
+    def getSpeed(self, vehID):
+        veh = self._get_inserted(vehID)
+        return INVALID_DOUBLE_VALUE if veh is None else veh.speed
+
+    def getLength(self, vehID):
+        return self._get_any(vehID).length
+
+    def getRoadID(self, vehID):
+        veh = self._get_inserted(vehID)
+        return "" if veh is None else veh.edges[veh.edge_index]
+
+    def getLaneID(self, vehID):
+        veh = self._get_inserted(vehID)
+        return "" if veh is None else veh.lane_id
+
+    def getLanePosition(self, vehID):
+        veh = self._get_inserted(vehID)
+        return INVALID_DOUBLE_VALUE if veh is None else veh.lane_pos
+
+    def getRouteID(self, vehID):
+        return self._get_any(vehID).route_id
+
+    def getRoute(self, vehID):
+        return self._get_any(vehID).edges
+
+    def setSpeed(self, vehID, speed):
+        self._get_any(vehID).commanded_speed = None if speed < 0 else speed
+
+    def setSpeedMode(self, vehID, speedMode):
+        self._get_any(vehID).speed_mode = speedMode
+
+    def setLaneChangeMode(self, vehID, laneChangeMode):
+        self._get_any(vehID).lane_change_mode = laneChangeMode
+
+    def changeLane(self, vehID, laneIndex, duration):
+        veh = self._get_any(vehID)
+        lane_ids = self._backend.edge_lanes[veh.edges[veh.edge_index]]
+        if 0 <= laneIndex < len(lane_ids):
+            veh.lane_id = lane_ids[laneIndex]
+            veh.lane_pos = min(veh.lane_pos, self._backend.geometries[veh.lane_id].get_total_length())
+
+    def moveToXY(self, vehID, edgeID, laneIndex, x, y, angle=-1073741824.0, keepRoute=1, **kwargs):
+        self._get_any(vehID).pending_move = (edgeID, laneIndex, x, y)
+        self._backend.moved_vehicle_ids[vehID] = None
+
+    def setRouteID(self, vehID, routeID):
+        veh = self._get_any(vehID)
+        edges = self._backend.routes.get(routeID)
+        if edges is None:
+            raise InMemoryTraCIError(f"The route '{routeID}' is not known.")
+        current_edge = veh.edges[max(veh.edge_index, 0)]
+        if current_edge not in edges:
+            raise InMemoryTraCIError(f"Route replacement failed for {vehID}: current edge not on route '{routeID}'.")
+        veh.edges = edges
+        veh.edge_index = edges.index(current_edge)
+        veh.route_id = routeID
+
+    def subscribe(self, objectID, varIDs=(), begin=None, end=None, parameters=None):
+        self._get_any(objectID)
+        self._backend.vehicle_subscriptions[objectID] = tuple(varIDs)
+
+    def getAllSubscriptionResults(self):
+        return self._backend.get_subscription_results()
+
+    def getSubscriptionResults(self, vehID):
+        return self.getAllSubscriptionResults().get(vehID, {})
+
+
+class PoiDomain:
+    def __init__(self, backend):
+        self._backend = backend
+
+    def _get(self, poiID):
+        poi = self._backend.pois.get(poiID)
+        if poi is None:
+            raise InMemoryTraCIError(f"POI '{poiID}' is not known")
+        return poi
+
+    def add(self, poiID, x, y, color=(255, 0, 0, 255), poiType="", layer=0, **kwargs):
+        if poiID in self._backend.pois:
+            raise InMemoryTraCIError(f"Could not add PoI '{poiID}'")
+        self._backend.pois[poiID] = {"x": x, "y": y, "color": color, "layer": layer, "params": {}}
+
+    def setPosition(self, poiID, x, y):
+        poi = self._get(poiID)
+        poi["x"], poi["y"] = x, y
+
+    def getPosition(self, poiID):
+        poi = self._get(poiID)
+        return poi["x"], poi["y"]
+
+    def setParameter(self, objID, key, value):
+        self._get(objID)["params"][key] = value
+
+    def remove(self, poiID, layer=0):
+        if self._backend.pois.pop(poiID, None) is None:
+            raise InMemoryTraCIError(f"Could not remove PoI '{poiID}'")
+
+    def getIDList(self):
+        return tuple(self._backend.pois)
+
+
+class SimulationDomain:
+    def __init__(self, backend):
+        self._backend = backend
+
+    def getTime(self):
+        return self._backend.time
+
+    def getDeltaT(self):
+        return self._backend.step_length
+
+    def getDepartedIDList(self):
+        return self._backend.departed
+
+    def getArrivedIDList(self):
+        return self._backend.arrived
+
+    def subscribe(self, varIDs=(), begin=None, end=None, parameters=None):
+        self._backend.simulation_subscriptions = tuple(varIDs)
+
+    def saveState(self, fileName):
+        self._backend.save_state(fileName)
+
+    def loadState(self, fileName):
+        self._backend.load_state(fileName)
+
+    def getSubscriptionResults(self, objectID=None):
+        backend = self._backend
+        c = backend.constants
+        values = {c.VAR_DEPARTED_VEHICLES_IDS: backend.departed, c.VAR_ARRIVED_VEHICLES_IDS: backend.arrived}
+        return {var_id: values[var_id] for var_id in backend.simulation_subscriptions if var_id in values}
+
+    def convertRoad(self, x, y, isGeo=False, vClass="ignoring"):
+        """
+        Map a network position to the closest lane.
+
+        Lanes are projected onto in order of the distance to their bounding box, stopping once
+        that lower bound exceeds the closest lane found, so only lanes near (x, y) are projected onto.
+
+        Returns:
+            Tuple[str, float, int]: (edge ID, position along the lane, lane index).
+        """
+        backend = self._backend
+        boxes = backend.lane_boxes
+        if not len(boxes):
+            raise InMemoryTraCIError("The network contains no lanes.")
+        dx = np.maximum(np.maximum(boxes[:, 0] - x, x - boxes[:, 2]), 0.0)
+        dy = np.maximum(np.maximum(boxes[:, 1] - y, y - boxes[:, 3]), 0.0)
+        bounds = np.hypot(dx, dy)
+
+        lane_ids = backend.lane_ids
+        best = None
+        for i in np.argsort(bounds, kind="stable").tolist():
+            if best is not None and bounds[i] > best[0]:
+                break
+            position, distance = backend.geometries[lane_ids[i]].project_point(x, y)
+            if best is None or distance < best[0]:
+                best = (distance, lane_ids[i], position)
+        _, lane_id, position = best
+        edge_id, lane_index = lane_id.rsplit("_", 1)
+        return edge_id, position, int(lane_index)
+
+
+class LaneDomain:
+    def __init__(self, backend):
+        self._backend = backend
+
+    def getLength(self, laneID):
+        geometry = self._backend.geometries.get(laneID)
+        if geometry is None:
+            raise InMemoryTraCIError(f"Lane '{laneID}' is not known")
+        return geometry.get_total_length()
+
+    def getIDList(self):
+        return tuple(self._backend.lanes)
+
+
+class RouteDomain:
+    def __init__(self, backend):
+        self._backend = backend
+
+    def getIDList(self):
+        return tuple(self._backend.routes)
+
+    def getEdges(self, routeID):
+        edges = self._backend.routes.get(routeID)
+        if edges is None:
+            raise InMemoryTraCIError(f"Route '{routeID}' is not known")
+        return edges
@@ -0,0 +1,408 @@
+# Backend/kinematic_backend.py
+
+import numpy as np
+from Backend.inmemory_backend import InMemoryBackend, InMemoryTraCIError
+from Entity.row_store import RowStore
+
+
+class LaneGeometryTable:
+    def __init__(self, lane_ids, geometries):
+        """
+        All lane polylines of the network concatenated into one segment table, so that positions on
+        many different lanes can be interpolated with a single searchsorted.
+        Each lane occupies its own interval of a global arc-length axis, separated from the next lane by a gap.
+
+        Args:
+            lane_ids (List[str]): Lane IDs; the list index is the lane code.
+            geometries (Dict[str, LaneGeometry]): Lane ID → single-lane LaneGeometry.
+        """
+        offsets, lengths, first_segments, last_segments = [], [], [], []
+        segment_starts, segment_ends, points, directions, headings = [], [], [], [], []
+        offset = 0.0
+        for lane_id in lane_ids:
+            geometry = geometries[lane_id]
+            cumulative = np.asarray(geometry.cumulative_lengths, dtype=np.float64)
+            first_segments.append(sum(len(ends) for ends in segment_ends))
+            last_segments.append(first_segments[-1] + len(cumulative) - 2)
+            offsets.append(offset)
+            lengths.append(cumulative[-1])
+            segment_starts.append(offset + cumulative[:-1])
+            segment_ends.append(offset + cumulative[1:])
+            points.append(np.asarray(geometry.full_shape[:-1], dtype=np.float64))
+            directions.append(np.asarray(geometry.segment_directions, dtype=np.float64))
+            headings.append(np.asarray(geometry.segment_headings, dtype=np.float64))
+            offset += cumulative[-1] + 1.0
+
+        self.offsets = np.array(offsets, dtype=np.float64)              # Lane code → lane start on the global axis
+        self.lengths = np.array(lengths, dtype=np.float64)              # Lane code → lane length
+        self.first_segments = np.array(first_segments, dtype=np.int64)  # Lane code → first segment of the lane
+        self.last_segments = np.array(last_segments, dtype=np.int64)    # Lane code → last segment of the lane
+        self.segment_starts = np.concatenate(segment_starts)            # Segment → start on the global axis
+        self.segment_ends = np.concatenate(segment_ends)                # Segment → end on the global axis
+        self.points = np.concatenate(points)                            # Segment → start point (x, y)
+        self.directions = np.concatenate(directions)                    # Segment → unit direction (ux, uy)
+        self.headings = np.concatenate(headings)                        # Segment → heading in degrees
+
+    def interpolate(self, lane_codes, positions):
+        """
+        Interpolate the positions and headings of many vehicles spread over many lanes at once.
+        Matches LaneGeometry.interpolate_position_and_heading for positions inside the lane.
+
+        Args:
+            lane_codes (np.ndarray): Lane code of each vehicle.
+            positions (np.ndarray): Arc length of each vehicle along its lane.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: X coordinates, Y coordinates and headings (in degrees).
+        """
+        global_positions = self.offsets[lane_codes] + np.clip(positions, 0.0, self.lengths[lane_codes])
+
+        # First segment whose end reaches the position, kept inside the vehicle's own lane
+        segments = np.searchsorted(self.segment_ends, global_positions, side="left")
+        segments = np.clip(segments, self.first_segments[lane_codes], self.last_segments[lane_codes])
+
+        offsets = global_positions - self.segment_starts[segments]
+        xs = self.points[segments, 0] + offsets * self.directions[segments, 0]
+        ys = self.points[segments, 1] + offsets * self.directions[segments, 1]
+        return xs, ys, self.headings[segments]
+
+
+class KinematicVehicleStore(RowStore):
+    COLUMNS = (
+        ("lane_code", np.int64, 0),                 # Code of the current lane
+        ("lane_pos", np.float64, 0.0),              # Front position along the current lane
+        ("speed", np.float64, 0.0),                 # Current speed (m/s)
+        ("commanded_speed", np.float64, np.nan),    # Speed fixed by setSpeed, NaN if free
+        ("length", np.float64, 0.0),                # Vehicle length
+        ("max_speed", np.float64, 0.0),             # Maximum speed of the vehicle type
+        ("accel", np.float64, 0.0),                 # Acceleration of the vehicle type
+        ("x", np.float64, 0.0),                     # Front X coordinate, see update_positions()
+        ("y", np.float64, 0.0),                     # Front Y coordinate
+        ("angle", np.float64, 0.0),                 # SUMO angle (degrees clockwise from north)
+    )
+
+    def __init__(self, lane_ids, capacity=64):
+        """
+        Struct-of-arrays storage for the vehicles driving in the kinematic simulation.
+        Each vehicle owns one row; KinematicVehicle objects are thin views that read and write their row,
+        so that all vehicles can be advanced and interpolated with single array operations.
+        The version is also bumped whenever a lane or position changes.
+
+        Args:
+            lane_ids (List[str]): Lane IDs indexed by lane code.
+            capacity (int, optional): Initial number of rows. The store grows automatically.
+        """
+        super().__init__(capacity)
+        self.lane_ids = lane_ids                                    # Lane code → lane ID
+        self.lane_codes = {lane_id: code for code, lane_id in enumerate(lane_ids)}  # Lane ID → lane code
+        self.positions_version = -1                                 # Version at the last update_positions()
+
+    def update_positions(self, table):
+        """
+        Recompute the front coordinates and angles of all vehicles if a lane or position changed
+        since the last call.
+
+        Args:
+            table (LaneGeometryTable): Geometry of the network lanes.
+        """
+        if self.positions_version == self.version:
+            return
+        rows = self.active_rows()
+        if rows.size:
+            xs, ys, headings = table.interpolate(self.lane_code[rows], self.lane_pos[rows])
+            self.x[rows] = xs
+            self.y[rows] = ys
+            self.angle[rows] = (90.0 - headings) % 360.0
+        self.positions_version = self.version
+
+
+class KinematicVehicle:
+    # Route bookkeeping stays on the view; the kinematic state lives in the KinematicVehicleStore row
+    __slots__ = ("id", "route_id", "edges", "edge_index", "speed_mode", "lane_change_mode", "pending_move",
+                 "store", "row")
+
+    def __init__(self, store, veh):
+        """
+        View over one row of a KinematicVehicleStore, with the same attributes as SimVehicle.
+
+        Args:
+            store (KinematicVehicleStore): Store holding the vehicle state.
+            veh (SimVehicle): The added vehicle whose state is copied into the store.
+        """
+        self.id = veh.id
+        self.route_id = veh.route_id
+        self.edges = veh.edges
+        self.edge_index = veh.edge_index
+        self.speed_mode = veh.speed_mode
+        self.lane_change_mode = veh.lane_change_mode
+        self.pending_move = veh.pending_move
+        self.store = store
+        self.row = store.allocate(self)
+        self.lane_id = veh.lane_id
+        self.lane_pos = veh.lane_pos
+        self.speed = veh.speed
+        self.commanded_speed = veh.commanded_speed
+        store.length[self.row] = veh.length
+        store.max_speed[self.row] = veh.max_speed
+        store.accel[self.row] = veh.accel
+
+    @property
+    def lane_id(self):
+        return self.store.lane_ids[self.store.lane_code[self.row]]
+
+    @lane_id.setter
+    def lane_id(self, value):
+        self.store.lane_code[self.row] = self.store.lane_codes[value]
+        self.store.version += 1
+
+    @property
+    def lane_pos(self):
+        return float(self.store.lane_pos[self.row])
+
+    @lane_pos.setter
+    def lane_pos(self, value):
+        self.store.lane_pos[self.row] = value
+        self.store.version += 1
+
+    @property
+    def speed(self):
+        return float(self.store.speed[self.row])
+
+    @speed.setter
+    def speed(self, value):
+        self.store.speed[self.row] = value
+
+    @property
+    def commanded_speed(self):
+        value = self.store.commanded_speed[self.row]
+        return None if np.isnan(value) else float(value)
+
+    @commanded_speed.setter
+    def commanded_speed(self, value):
+        self.store.commanded_speed[self.row] = np.nan if value is None else value
+
+    @property
+    def length(self):
+        return float(self.store.length[self.row])
+
+    @property
+    def max_speed(self):
+        return float(self.store.max_speed[self.row])
+
+    @property
+    def accel(self):
+        return float(self.store.accel[self.row])
+
+    def __repr__(self):
+        return f"KinematicVehicle(id={self.id}, lane={self.lane_id}, pos={self.lane_pos:.2f}, speed={self.speed:.2f})"
+
+
+class KinematicBackend(InMemoryBackend):
+    """
+    Vectorized variant of the in-memory backend, in which the simulation step itself is cheap.
+
+    Vehicle state is kept in NumPy columns: one step updates every speed and position with a handful
+    of array operations, and positions and angles of all vehicles are interpolated together the first
+    time they are read after a step. Only vehicles that pass the end of their lane are handled one by
+    one, to carry them over junctions (including on-ramp entries and off-ramp exits) along their route.
+    Commands, subscriptions and pending-vehicle semantics are those of InMemoryBackend, so the
+    controllers and SlotBasedEnv run unchanged; SUMO remains the reference for validation.
+
+    get_vehicle_columns() slices the subscribed variables of the whole fleet straight from the columns,
+    which VehicleController uses to synchronize vehicles and slots with array operations. On the default
+    scenario (about 20 vehicles) a full SlotBasedEnv step takes about 0.76 ms against 0.81 ms with
+    InMemoryBackend; with about 280 vehicles, 3.2 ms against 3.9 ms. The slot and merge controllers
+    and the observation building, shared by all backends, account for most of the remaining time.
+    """
+
+    name = "kinematic"
+    STATE_ATTRIBUTES = InMemoryBackend.STATE_ATTRIBUTES + ("store",)
+
+    def __init__(self, net_file=None, route_file=None, step_length=None, cache_dir=None):
+        """
+        Args:
+            net_file (str, optional): Path to the .net.xml file. Defaults to config value.
+            route_file (str, optional): Path to the .rou.xml file. Defaults to config value.
+            step_length (float, optional): Simulated seconds per step. Defaults to config value.
+            cache_dir (str, optional): Directory of compiled network artifacts. Defaults to None (always parse the XML).
+        """
+        super().__init__(net_file=net_file, route_file=route_file, step_length=step_length, cache_dir=cache_dir)
+        self.geometry_table = LaneGeometryTable(self.lane_ids, self.geometries)
+        self.lane_speeds = np.array([self.lanes[lane_id].speed for lane_id in self.lane_ids], dtype=np.float64)
+        self._reset_state()
+
+    def _reset_state(self):
+        super()._reset_state()
+        if hasattr(self, "lane_ids"):  # InMemoryBackend.__init__ resets once before the lane tables exist
+            self.store = KinematicVehicleStore(self.lane_ids)
+
+    # ===== Simulation =====
+
+    def simulationStep(self):
+        """
+        Advance every vehicle in one vectorized update, carry vehicles past lane ends along their route,
+        then insert the vehicles added since the last step and apply pending moveToXY placements.
+        """
+        self.time += self.step_length
+        store = self.store
+        dt = self.step_length
+        arrived = []
+
+        rows = store.active_rows()
+        if rows.size:
+            codes = store.lane_code[rows]
+            speeds = store.speed[rows]
+            targets = np.minimum(self.lane_speeds[codes], store.max_speed[rows])
+            free_speeds = np.where(speeds < targets, np.minimum(targets, speeds + store.accel[rows] * dt), targets)
+            commanded = store.commanded_speed[rows]
+            speeds = np.where(np.isnan(commanded), free_speeds, commanded)
+            positions = store.lane_pos[rows] + speeds * dt
+            store.speed[rows] = speeds
+            store.lane_pos[rows] = positions
+            store.version += 1
+
+            for row in rows[positions > self.geometry_table.lengths[codes]].tolist():
+                veh = store.views[row]
+                self._follow_route(veh)
+                if veh.edge_index < 0:
+                    arrived.append(veh.id)
+        for veh_id in arrived:
+            self._remove_vehicle(veh_id)
+
+        departed = list(self.pending_vehicles)
+        for veh in self.pending_vehicles.values():
+            self._insert_vehicle(veh)
+        self.pending_vehicles = {}
+        self._apply_moves()
+
+        self.departed = tuple(departed)
+        self.arrived = tuple(arrived)
+
+    def _insert_vehicle(self, veh):
+        self.vehicles[veh.id] = KinematicVehicle(self.store, veh)
+
+    def _remove_vehicle(self, veh_id):
+        veh = self.vehicles[veh_id]
+        super()._remove_vehicle(veh_id)
+        self.store.release(veh.row)
+
+    def get_front_and_angle(self, veh):
+        """
+        Returns:
+            Tuple[Tuple[float, float], float]: Front (x, y) of the vehicle and its SUMO angle
+            (degrees clockwise from north), read from the positions interpolated for the whole fleet.
+        """
+        store = self.store
+        store.update_positions(self.geometry_table)
+        row = veh.row
+        return (float(store.x[row]), float(store.y[row])), float(store.angle[row])
+
+    def get_subscription_results(self):
+        """
+        Subscription results read from the store columns: positions and angles are interpolated for
+        the whole fleet once, and every subscribed variable is turned into one row-indexed list, so
+        that per-vehicle results are plain list lookups instead of variable dispatch.
+
+        Returns:
+            Dict[str, Dict[int, object]]: Vehicle ID → subscribed variable ID → value.
+        """
+        store = self.store
+        store.update_positions(self.geometry_table)
+        columns = {}
+        results = {}
+        for veh_id, var_ids in self.vehicle_subscriptions.items():
+            veh = self.vehicles.get(veh_id)
+            if veh is None:
+                continue
+            row = veh.row
+            for var_id in var_ids:
+                if var_id not in columns:
+                    columns[var_id] = self._subscription_column(var_id)
+            results[veh_id] = {var_id: columns[var_id][row] for var_id in var_ids}
+        return results
+
+    def get_vehicle_columns(self, veh_ids, var_ids):
+        """
+        Subscribed variables of several vehicles sliced directly from the store columns, without
+        building per-vehicle result dictionaries.
+
+        Args:
+            veh_ids (List[str]): Vehicles to read.
+            var_ids (Iterable[int]): Subscribed variable IDs to return.
+
+        Returns:
+            Tuple[List[int], Dict[int, Sequence]]: Indices into veh_ids of the subscribed vehicles driving in
+            the network, and variable ID → values of those vehicles in the same order (NumPy arrays for
+            numeric variables, an (n, 2) array for positions, lists for string variables).
+        """
+        store = self.store
+        store.update_positions(self.geometry_table)
+        vehicles = self.vehicles
+        subscriptions = self.vehicle_subscriptions
+        found = []
+        views = []
+        for i, veh_id in enumerate(veh_ids):
+            veh = vehicles.get(veh_id)
+            if veh is not None and veh_id in subscriptions:
+                found.append(i)
+                views.append(veh)
+        rows = np.fromiter((veh.row for veh in views), dtype=np.int64, count=len(views))
+
+        c = self.constants
+        columns = {}
+        for var_id in var_ids:
+            if var_id == c.VAR_POSITION:
+                columns[var_id] = np.column_stack((store.x[rows], store.y[rows]))
+            elif var_id == c.VAR_ANGLE:
+                columns[var_id] = store.angle[rows]
+            elif var_id == c.VAR_SPEED:
+                columns[var_id] = store.speed[rows]
+            elif var_id == c.VAR_LENGTH:
+                columns[var_id] = store.length[rows]
+            elif var_id == c.VAR_LANEPOSITION:
+                columns[var_id] = store.lane_pos[rows]
+            elif var_id == c.VAR_LANE_ID:
+                lane_ids = store.lane_ids
+                columns[var_id] = [lane_ids[code] for code in store.lane_code[rows].tolist()]
+            elif var_id == c.VAR_ROAD_ID:
+                columns[var_id] = [veh.edges[veh.edge_index] for veh in views]
+            elif var_id == c.VAR_ROUTE_ID:
+                columns[var_id] = [veh.route_id for veh in views]
+            elif var_id == c.VAR_EDGES:
+                columns[var_id] = [veh.edges for veh in views]
+            else:
+                raise InMemoryTraCIError(f"Vehicle variable 0x{var_id:02x} is not supported by the in-memory backend.")
+        return found, columns
+
+    def _subscription_column(self, var_id):
+        """
+        Values of one subscribable variable for all store rows.
+
+        Args:
+            var_id (int): TraCI variable ID.
+
+        Returns:
+            List[object]: Row → value (None for free rows of object-valued variables).
+        """
+        store = self.store
+        c = self.constants
+        if var_id == c.VAR_SPEED:
+            return store.speed.tolist()
+        if var_id == c.VAR_ANGLE:
+            return store.angle.tolist()
+        if var_id == c.VAR_LENGTH:
+            return store.length.tolist()
+        if var_id == c.VAR_LANEPOSITION:
+            return store.lane_pos.tolist()
+        if var_id == c.VAR_POSITION:
+            return list(zip(store.x.tolist(), store.y.tolist()))
+        if var_id == c.VAR_LANE_ID:
+            lane_ids = store.lane_ids
+            return [lane_ids[code] for code in store.lane_code.tolist()]
+        if var_id == c.VAR_ROAD_ID:
+            return [veh.edges[veh.edge_index] if veh is not None else None for veh in store.views]
+        if var_id == c.VAR_ROUTE_ID:
+            return [veh.route_id if veh is not None else None for veh in store.views]
+        if var_id == c.VAR_EDGES:
+            return [veh.edges if veh is not None else None for veh in store.views]
+        raise InMemoryTraCIError(f"Vehicle variable 0x{var_id:02x} is not supported by the in-memory backend.")
@@ -0,0 +1,50 @@
+# Backend/libsumo_backend.py
+
+import weakref
+import libsumo
+from Backend.base import SimulationBackend
+
+class LibsumoBackend(SimulationBackend):
+    """
+    Backend running SUMO in-process through libsumo. Same API as TraCI without the socket
+    round trips, but only one simulation per process and no GUI.
+    """
+
+    name = "libsumo"
+    TraCIException = libsumo.TraCIException
+    _owner = None  # Weak reference to the backend holding this process's libsumo simulation
+
+    def __init__(self):
+        super().__init__()
+        self.vehicle = libsumo.vehicle
+        self.poi = libsumo.poi
+        self.simulation = libsumo.simulation
+        self.lane = libsumo.lane
+        self.route = libsumo.route
+        if not LibsumoBackend.is_claimed():
+            LibsumoBackend._owner = weakref.ref(self)
+
+    @classmethod
+    def is_claimed(cls):
+        """
+        Returns:
+            bool: Whether a live LibsumoBackend already holds the process's libsumo simulation.
+        """
+        return cls._owner is not None and cls._owner() is not None
+
+    def start(self, cmd):
+        owner = LibsumoBackend._owner() if LibsumoBackend._owner is not None else None
+        if owner is not None and owner is not self and owner.running:
+            raise RuntimeError("libsumo runs a single simulation per process; "
+                               "use the traci backend (labeled connections) for more")
+        LibsumoBackend._owner = weakref.ref(self)
+        libsumo.start(cmd)
+        self.running = True
+
+    def simulationStep(self):
+        libsumo.simulationStep()
+
+    def close(self):
+        if self.running:
+            libsumo.close()
+            self.running = False
@@ -0,0 +1,57 @@
+# Backend/traci_backend.py
+
+import traci
+from Backend.base import SimulationBackend
+
+class TraciBackend(SimulationBackend):
+    """
+    Backend talking to a SUMO (or sumo-gui) process over the TraCI socket protocol.
+
+    Without a label the backend drives traci's current (module-level) connection, like code that calls
+    traci directly. With a label it owns a separate connection started with traci.start(label=...)
+    and reached through traci.getConnection, so several simulations can run in one process.
+    """
+
+    name = "traci"
+    TraCIException = traci.TraCIException
+
+    def __init__(self, label=None):
+        """
+        Args:
+            label (str, optional): TraCI connection label. Defaults to None (the current connection).
+        """
+        super().__init__()
+        self.label = label
+        self.connection = traci if label is None else None  # Module or traci Connection serving the domains
+        self._bind_domains()
+
+    def _bind_domains(self):
+        source = self.connection if self.connection is not None else traci
+        self.vehicle = source.vehicle
+        self.poi = source.poi
+        self.simulation = source.simulation
+        self.lane = source.lane
+        self.route = source.route
+
+    def start(self, cmd):
+        if self.label is None:
+            traci.start(cmd)
+        else:
+            # Keep traci's current connection untouched, the labeled one is only used through this backend
+            traci.start(cmd, label=self.label, doSwitch=False)
+            self.connection = traci.getConnection(self.label)
+            self._bind_domains()
+        self.running = True
+
+    def simulationStep(self):
+        self.connection.simulationStep()
+
+    def close(self):
+        if self.running:
+            self.connection.close()
+            if self.label is not None:
+                self.connection = None
+            self.running = False
+
+    def __repr__(self):
+        return f"TraciBackend(label={self.label}, running={self.running})"
@@ -5,17 +5,31 @@ default_config = {
     "sumo_config": "Sim/temp.sumocfg",
     "net_file": "Sim/test.net.xml",
     "route_file": "Sim/test.rou.xml",
+    "net_cache_dir": "Sim/net_cache",  # Compiled network artifacts keyed by net file hash, None to always parse the XML
     "use_gui": True,
+    "backend": "auto",  # Simulator backend: "traci", "libsumo", "inmemory", "kinematic" or "auto" (fastest available)
+    "connection_label": None,  # TraCI connection label of the env, None for a unique one per env
 
     # ===== Environment Parameters =====
     "max_steps": 10000,
     "slot_length": 8.0,
     "slot_gap": 3.0,
     "time_step": 0.1,  # Unit: seconds
+    "pipelined_step": False,           # Overlap SUMO's simulationStep with slot advancement (TraCI backend)
+    "warm_reset": False,               # reset() reloads a saved simulation state instead of restarting SUMO
+    "warm_start_dir": None,            # Directory of Tools/warm_start.py snapshots episodes start from (None: empty roads)
+    "render_frame_interval": 1,        # GUI only: redraw slot POIs once every N steps
+    "render_position_tolerance": 0.01,  # GUI only: slot POIs that moved less than this (m) are not updated
+
+    # ===== Vectorized Environment =====
+    "vector_num_envs": 4,              # Worker processes of VectorSlotEnv, one SlotBasedEnv each
+    "vector_max_slots": 1024,          # Padded slot rows per agent in the shared observation array
+    "vector_start_method": "spawn",    # multiprocessing start method of the workers
 
     # ===== Vehicle Configuration =====
     "vehicle_spawn_rate": 30,     # Spawn one vehicle every N steps
     "max_vehicles": 200,          # Maximum number of vehicles in the environment at the same time
+    "command_speed_tolerance": 0.0,  # setSpeed calls within this many m/s of the last sent speed are dropped
     "vehicle_type": {
         "length": 5.0,
         "max_speed": 30.0
@@ -0,0 +1,164 @@
+# Controller/command_buffer.py
+
+from Config.config import default_config
+from Backend.factory import get_default_backend
+
+class CommandBuffer:
+    def __init__(self, speed_tolerance=None, deferred=True, backend=None):
+        """
+        Coalescing layer between the controllers and TraCI.
+
+        Remembers the last speed sent per vehicle and drops setSpeed calls that would not change it
+        (SUMO keeps a set speed until it is changed). Lane changes and placements are coalesced per step:
+        only the last one per vehicle is sent. Pending commands are collected during a step and sent
+        together by flush(), which the caller runs right before simulationStep.
+
+        Args:
+            speed_tolerance (float, optional): setSpeed calls within this many m/s of the last sent
+                speed are suppressed. Defaults to config value.
+            deferred (bool, optional): If False, every accepted command is sent immediately
+                (for callers that drive simulationStep themselves and never flush).
+            backend (SimulationBackend, optional): Simulator receiving the commands. Defaults to the TraCI default connection.
+        """
+        self.backend = backend if backend is not None else get_default_backend()
+        self.speed_tolerance = (speed_tolerance if speed_tolerance is not None
+                                else default_config["command_speed_tolerance"])
+        self.deferred = deferred
+        self.last_speeds = {}       # Vehicle ID → last speed sent
+        self.pending_speeds = {}    # Vehicle ID → speed to send at the next flush
+        self.pending_lanes = {}     # Vehicle ID → (lane index, duration) to send at the next flush
+        self.pending_moves = {}     # Vehicle ID → moveToXY keyword arguments to send at the next flush
+        self.suppressed = 0         # Commands dropped since the last end_step()
+        self.last_suppressed = 0    # Commands dropped during the last flushed step
+        self.total_suppressed = 0   # Commands dropped since creation
+        self.total_sent = 0         # Commands sent since creation
+
+    def set_speed(self, veh_id, speed):
+        """
+        Queue vehicle.setSpeed unless the speed equals the last one sent.
+
+        Args:
+            veh_id (str): ID of the vehicle.
+            speed (float): Target speed in m/s.
+        """
+        if veh_id in self.pending_speeds:
+            self.suppressed += 1  # Overwritten within the same step
+        else:
+            last = self.last_speeds.get(veh_id)
+            if last is not None and abs(last - speed) <= self.speed_tolerance:
+                self.suppressed += 1
+                return
+        self.pending_speeds[veh_id] = speed
+        if not self.deferred:
+            self.flush()
+
+    def change_lane(self, veh_id, lane_index, duration):
+        """
+        Queue vehicle.changeLane. Only the last request per vehicle and step is sent.
+
+        Args:
+            veh_id (str): ID of the vehicle.
+            lane_index (int): Target lane index.
+            duration (float): Duration in seconds for which the lane is kept.
+        """
+        if veh_id in self.pending_lanes:
+            self.suppressed += 1
+        self.pending_lanes[veh_id] = (lane_index, duration)
+        if not self.deferred:
+            self.flush()
+
+    def move_to_xy(self, veh_id, edge_id, lane_index, x, y, angle, keep_route=1):
+        """
+        Queue vehicle.moveToXY. Only the last placement per vehicle and step is sent.
+
+        Args:
+            veh_id (str): ID of the vehicle.
+            edge_id (str): Edge to place the vehicle on.
+            lane_index (int): Lane index on the edge.
+            x (float): Target X coordinate of the vehicle front.
+            y (float): Target Y coordinate of the vehicle front.
+            angle (float): Heading angle in degrees.
+            keep_route (int, optional): TraCI keepRoute flag. Defaults to 1.
+        """
+        if veh_id in self.pending_moves:
+            self.suppressed += 1
+        self.pending_moves[veh_id] = dict(edgeID=edge_id, laneIndex=lane_index, x=x, y=y,
+                                          angle=angle, keepRoute=keep_route)
+        if not self.deferred:
+            self.flush()
+
+    def forget(self, veh_id):
+        """
+        Drop all state of a vehicle that left the simulation.
+
+        Args:
+            veh_id (str): ID of the vehicle.
+        """
+        for table in (self.last_speeds, self.pending_speeds, self.pending_lanes, self.pending_moves):
+            table.pop(veh_id, None)
+
+    def reset_sent_speeds(self):
+        """
+        Forget the speeds sent so far, so that the next set_speed of every vehicle is sent even if unchanged.
+        Used after the simulation state was reloaded, which drops the speeds set through setSpeed.
+        """
+        self.last_speeds.clear()
+
+    def flush(self):
+        """
+        Send all pending commands. Call right before the backend's simulationStep().
+        Placements are sent first, then lane changes, then speeds.
+
+        Returns:
+            int: Number of commands sent.
+        """
+        sent = 0
+        vehicle = self.backend.vehicle
+        for veh_id, kwargs in self.pending_moves.items():
+            sent += self._send(veh_id, vehicle.moveToXY, veh_id, **kwargs)
+        for veh_id, (lane_index, duration) in self.pending_lanes.items():
+            sent += self._send(veh_id, vehicle.changeLane, veh_id, lane_index, duration)
+        for veh_id, speed in self.pending_speeds.items():
+            if self._send(veh_id, vehicle.setSpeed, veh_id, speed):
+                self.last_speeds[veh_id] = speed
+                sent += 1
+        self.pending_moves.clear()
+        self.pending_lanes.clear()
+        self.pending_speeds.clear()
+
+        self.total_sent += sent
+        if self.deferred:
+            self.end_step()
+        return sent
+
+    def end_step(self):
+        """
+        Close the per-step counters. Called by flush() in deferred mode; immediate-mode
+        owners call it once per simulation step.
+        """
+        self.last_suppressed = self.suppressed
+        self.total_suppressed += self.suppressed
+        self.suppressed = 0
+
+    def _send(self, veh_id, command, *args, **kwargs):
+        try:
+            command(*args, **kwargs)
+            return 1
+        except self.backend.TraCIException as e:
+            print(f"[WARN] Command {command.__name__} failed for {veh_id}: {e}")
+            return 0
+
+    def get_metrics(self):
+        """
+        Returns:
+            dict: Commands suppressed in the last step and totals since creation.
+        """
+        return {
+            "suppressed_last_step": self.last_suppressed,
+            "suppressed_total": self.total_suppressed,
+            "sent_total": self.total_sent,
+        }
+
+    def __repr__(self):
+        return (f"CommandBuffer(pending={len(self.pending_speeds) + len(self.pending_lanes) + len(self.pending_moves)}, "
+                f"suppressed_total={self.total_suppressed})")
@@ -1,7 +1,9 @@
 # Controller/merge_controller.py
 
+from Backend.factory import get_default_backend
+
 class MergeController:
-    def __init__(self, full_lanes, ramp_to_fulllane_map, safety_gap=5.0):
+    def __init__(self, full_lanes, ramp_to_fulllane_map, safety_gap=5.0, backend=None):
         """
         Initialize the MergeController.
 
@@ -11,11 +13,14 @@ class MergeController:
                 Example: {'on_ramp1': 'e3_0'}
             safety_gap (float): Maximum allowed distance (in meters) between the merging vehicle and slot center
                 to allow binding.
+            backend (SimulationBackend, optional): Simulator providing vehicle positions.
+                Defaults to the TraCI default connection.
         """
         self.full_lanes = full_lanes
         self.ramp_map = ramp_to_fulllane_map
         self.full_lane_dict = {fl.start_lane_id: fl for fl in full_lanes}
         self.safety_gap = safety_gap
+        self.backend = backend if backend is not None else get_default_backend()
 
     def step(self, vehicle_list):
         """
@@ -39,7 +44,7 @@ class MergeController:
                     if not fl:
                         continue  # Skip if target lane is not found
 
-                    veh_pos = veh.get_front_position()  # Assumes vehicle has this method implemented
+                    veh_pos = veh.get_front_position(self.backend)  # Assumes vehicle has this method implemented
                     candidate_slot = self._find_nearest_slot(fl, veh_pos)
 
                     if candidate_slot:
@@ -59,26 +64,4 @@ class MergeController:
         Returns:
             Slot: The closest unoccupied slot within the safety gap, or None if none found.
         """
-        best_slot = None
-        best_dist = float("inf")
-        for slot in full_lane.slots:
-            if not slot.occupied:
-                dist = self._euclidean_distance(veh_pos, slot.center)
-                if dist < best_dist and dist < self.safety_gap:
-                    best_dist = dist
-                    best_slot = slot
-        return best_slot
-
-    @staticmethod
-    def _euclidean_distance(p1, p2):
-        """
-        Compute the Euclidean distance between two 2D points.
-
-        Args:
-            p1 (tuple): (x, y) coordinates of point 1.
-            p2 (tuple): (x, y) coordinates of point 2.
-
-        Returns:
-            float: The Euclidean distance.
-        """
-        return ((p1[0] - p2[0]) ** 2 + (p1[1] - p2[1]) ** 2) ** 0.5
+        return full_lane.slot_index.nearest_free_slot(veh_pos[0], veh_pos[1], radius=self.safety_gap)
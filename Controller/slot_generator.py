@@ -1,56 +1,26 @@
 # Controller/slot_generator.py
 
-import math
 from Entity.slot import Slot
 from Entity.fulllane import FullLane
+from Entity.registry import SimulationRegistry
+from Controller.slot_pool import SlotPool
 from Config.config import default_config
 
 class SlotGenerator:
-    def __init__(self, slot_length=None, slot_gap=None):
+    def __init__(self, slot_length=None, slot_gap=None, registry=None):
         """
         Initializes the SlotGenerator with slot size configuration.
 
         Args:
             slot_length (float, optional): Length of a single slot. Defaults to config value.
             slot_gap (float, optional): Gap between consecutive slots. Defaults to config value.
+            registry (SimulationRegistry, optional): Registry tracking the generated slots. A new one is created if omitted.
         """
         self.slot_length = slot_length if slot_length is not None else default_config["slot_length"]
         self.slot_gap = slot_gap if slot_gap is not None else default_config["slot_gap"]
         self.global_index = 0  # Global index to assign unique IDs to slots
-
-    def interpolate_position_and_heading(self, shape, target_distance):
-        """
-        Interpolates position and heading along a given shape at the specified arc length.
-
-        Args:
-            shape (List[Tuple[float, float]]): Polyline shape of the lane.
-            target_distance (float): Arc distance along the shape.
-
-        Returns:
-            Tuple[Tuple[float, float], float]: Interpolated (x, y) position and heading in degrees.
-        """
-        accumulated = 0.0
-        for i in range(len(shape) - 1):
-            x1, y1 = shape[i]
-            x2, y2 = shape[i + 1]
-            dx = x2 - x1
-            dy = y2 - y1
-            segment_length = math.hypot(dx, dy)
-
-            if accumulated + segment_length >= target_distance:
-                ratio = (target_distance - accumulated) / segment_length
-                x = x1 + ratio * dx
-                y = y1 + ratio * dy
-                heading = math.degrees(math.atan2(dy, dx))
-                return (x, y), heading
-
-            accumulated += segment_length
-
-        # Fallback to the last segment's end
-        x1, y1 = shape[-2]
-        x2, y2 = shape[-1]
-        heading = math.degrees(math.atan2(y2 - y1, x2 - x1))
-        return shape[-1], heading
+        self.slot_pool = SlotPool()  # Expired slots recycled by generate_single_slot_on_full_lane
+        self.registry = registry if registry is not None else SimulationRegistry()  # Slot ID and binding lookups
 
     def generate_slots_for_full_lane(self, full_lane):
         """
@@ -63,8 +33,10 @@ class SlotGenerator:
             List[Slot]: List of generated Slot instances.
         """
         slots = []
+        full_lane.slot_store.clear()  # Drop slots left over from a previous generation
+        full_lane.slots.clear()
+        full_lane.attach_registry(self.registry)
         total_length = full_lane.get_total_length()
-        shape = full_lane.full_shape
         speed = full_lane.lanes[0].speed if full_lane.lanes else 0.0
         lane = full_lane.lanes[0] if full_lane.lanes else None
 
@@ -74,7 +46,7 @@ class SlotGenerator:
             self.global_index += 1
 
             center_pos = position + self.slot_length / 2
-            center_xy, heading = self.interpolate_position_and_heading(shape, center_pos)
+            center_xy, heading = full_lane.interpolate_position_and_heading(center_pos)
 
             slot = Slot(
                 id=slot_id,
@@ -87,20 +59,20 @@ class SlotGenerator:
                 speed=speed,
                 heading=heading,
                 full_lane=full_lane,
+                store=full_lane.slot_store,
             )
             slot.center = center_xy
             slots.append(slot)
+            full_lane.slots.push_back(slot)  # Positions increase, so the queue stays ordered
 
             position += self.slot_length + self.slot_gap
 
-        # Ensure slots are ordered from front to back
-        slots.sort(key=lambda s: s.position_start)
-        full_lane.slots = slots
         return slots
 
     def generate_single_slot_on_full_lane(self, full_lane: FullLane) -> Slot:
         """
         Generate a single new slot at the start of a FullLane.
+        A pooled slot is reset and reused when available; a new Slot is created otherwise.
 
         Args:
             full_lane (FullLane): The FullLane instance to place the slot on.
@@ -113,9 +85,9 @@ class SlotGenerator:
         lane = full_lane.lanes[0]
 
         center_pos = 0.0 + self.slot_length / 2
-        center_xy, heading = self.interpolate_position_and_heading(full_lane.full_shape, center_pos)
+        center_xy, heading = full_lane.interpolate_position_and_heading(center_pos)
 
-        slot = Slot(
+        slot_args = dict(
             id=slot_id,
             lane=lane,
             segment_id=lane.segment_id,
@@ -126,7 +98,13 @@ class SlotGenerator:
             speed=lane.speed,
             heading=heading,
             full_lane=full_lane,
+            store=full_lane.slot_store,
         )
+        slot = self.slot_pool.acquire()
+        if slot is None:
+            slot = Slot(**slot_args)
+        else:
+            slot.reset(**slot_args)
         slot.center = center_xy
         return slot
 
@@ -143,6 +121,5 @@ class SlotGenerator:
         all_slots = []
         for full_lane in full_lanes:
             slots = self.generate_slots_for_full_lane(full_lane)
-            full_lane.slots = slots
             all_slots.extend(slots)
         return all_slots
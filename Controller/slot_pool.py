@@ -0,0 +1,87 @@
+# Controller/slot_pool.py
+
+from Entity.slot_store import SlotStore
+
+class SlotPool:
+    def __init__(self, max_size=None):
+        """
+        Pool of expired Slot objects kept for reuse, so that regenerating slots does not
+        allocate new objects on every step.
+
+        Expired slots first move into the pool's retired store, where they keep their last state
+        while callers (or a bound vehicle) still use them. Their row is freed when they are pooled,
+        so pooled slots hold no store row at all.
+
+        Args:
+            max_size (int, optional): Maximum number of pooled slots. Unlimited if None.
+        """
+        self.free_slots = []      # Slots ready to be reset and reused
+        self.retired_store = SlotStore()  # Rows of expired slots not yet pooled
+        self.max_size = max_size
+        self.hits = 0             # Acquisitions served from the pool
+        self.misses = 0           # Acquisitions that required a new Slot
+
+    def acquire(self):
+        """
+        Take a slot from the pool.
+
+        Returns:
+            Slot or None: A recycled slot (to be reset by the caller), or None if the pool is empty.
+        """
+        if self.free_slots:
+            self.hits += 1
+            return self.free_slots.pop()
+        self.misses += 1
+        return None
+
+    def retire(self, slot):
+        """
+        Move a slot that left its FullLane into the retired store.
+
+        Args:
+            slot (Slot): The expired slot.
+        """
+        slot.detach(self.retired_store)
+
+    def release(self, slot):
+        """
+        Return a retired slot to the pool and free its retired row. Slots still bound to a vehicle
+        are not recycled, since the vehicle keeps tracking their last state; offer them again once
+        the vehicle has released them. Slots beyond max_size are dropped.
+
+        Args:
+            slot (Slot): The expired slot.
+
+        Returns:
+            bool: False if the slot is still bound to a vehicle and was kept retired.
+        """
+        if slot.occupied or slot.vehicle_id is not None:
+            return False
+        slot.release_row()
+        if self.max_size is None or len(self.free_slots) < self.max_size:
+            self.free_slots.append(slot)
+        return True
+
+    @property
+    def size(self):
+        return len(self.free_slots)
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def get_metrics(self):
+        """
+        Returns:
+            dict: Current pool size, hit/miss counters and hit rate.
+        """
+        return {
+            "size": self.size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+        }
+
+    def __repr__(self):
+        return f"SlotPool(size={self.size}, hit_rate={self.hit_rate:.2f})"
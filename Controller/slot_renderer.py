@@ -0,0 +1,134 @@
+# Controller/slot_renderer.py
+
+import math
+from Config.config import default_config
+from Backend.factory import get_default_backend
+
+class SlotRenderer:
+    def __init__(self, enabled=True, frame_interval=None, position_tolerance=None, poi_parameters=None,
+                 backend=None):
+        """
+        Draws slots as POIs in sumo-gui.
+
+        Rendering is differential: the renderer remembers the position last pushed for every POI and,
+        once per frame, adds POIs for new slots, removes POIs of slots that disappeared and moves only
+        the POIs whose slot moved by more than the tolerance. When disabled (headless runs) every call
+        returns immediately and no backend call is made.
+
+        Args:
+            enabled (bool, optional): Whether to draw at all. Pass False for headless runs.
+            frame_interval (int, optional): Draw once every this many steps. Defaults to config value.
+            position_tolerance (float, optional): Minimum movement (m) before a POI is moved. Defaults to config value.
+            poi_parameters (dict, optional): Extra POI parameters set on every added POI, e.g. {"imgWidth": "5"}.
+            backend (SimulationBackend, optional): Simulator drawing the POIs. Defaults to the TraCI default connection.
+        """
+        self.enabled = enabled
+        self.backend = (backend if backend is not None else get_default_backend()) if enabled else backend
+        self.frame_interval = max(1, frame_interval if frame_interval is not None
+                                  else default_config["render_frame_interval"])
+        self.position_tolerance = (position_tolerance if position_tolerance is not None
+                                   else default_config["render_position_tolerance"])
+        self.poi_parameters = dict(poi_parameters or {})
+        self.rendered = {}       # Slot ID → (x, y) last pushed to the simulator
+        self.step_count = 0      # Calls to update() since the last full draw
+        self.frames = 0          # Frames drawn
+        self.positions_sent = 0  # POI moves sent
+        self.added = 0           # POIs added
+        self.removed = 0         # POIs removed
+
+    def draw(self, full_lanes):
+        """
+        Draw a frame immediately, regardless of the frame interval.
+
+        Args:
+            full_lanes (List[FullLane]): FullLanes whose slots are drawn.
+        """
+        if not self.enabled:
+            return
+        self.step_count = 0
+        self.frames += 1
+
+        tolerance = self.position_tolerance
+        rendered = self.rendered
+        current = {}
+        moves = []
+        adds = []
+        for fl in full_lanes:
+            store = fl.slot_store
+            rows = [slot.row for slot in fl.slots]
+            xs = store.center_x[rows].tolist()
+            ys = store.center_y[rows].tolist()
+            for slot, x, y in zip(fl.slots, xs, ys):
+                if math.isnan(x) or math.isnan(y):
+                    continue
+                current[slot.id] = (x, y)
+                last = rendered.get(slot.id)
+                if last is None:
+                    adds.append((slot.id, x, y))
+                elif abs(last[0] - x) > tolerance or abs(last[1] - y) > tolerance:
+                    moves.append((slot.id, x, y))
+
+        poi = self.backend.poi
+        for slot_id in [slot_id for slot_id in rendered if slot_id not in current]:
+            if self._send(slot_id, poi.remove, slot_id):
+                self.removed += 1
+            del rendered[slot_id]
+        for slot_id, x, y in adds:
+            if self._send(slot_id, self._add_poi, slot_id, x, y):
+                rendered[slot_id] = (x, y)
+                self.added += 1
+        for slot_id, x, y in moves:
+            if self._send(slot_id, poi.setPosition, slot_id, x, y):
+                rendered[slot_id] = (x, y)
+                self.positions_sent += 1
+
+    def update(self, full_lanes):
+        """
+        Count one simulation step and draw a frame if the frame interval has elapsed.
+
+        Args:
+            full_lanes (List[FullLane]): FullLanes whose slots are drawn.
+        """
+        if not self.enabled:
+            return
+        self.step_count += 1
+        if self.step_count >= self.frame_interval:
+            self.draw(full_lanes)
+
+    def clear(self):
+        """
+        Forget every drawn POI, e.g. after the simulation was restarted and its POIs are gone.
+        """
+        self.rendered.clear()
+        self.step_count = 0
+
+    def _add_poi(self, slot_id, x, y):
+        poi = self.backend.poi
+        poi.add(slot_id, x, y, color=(255, 0, 0), layer=5)
+        poi.setParameter(slot_id, "label", slot_id)
+        for key, value in self.poi_parameters.items():
+            poi.setParameter(slot_id, key, value)
+
+    def _send(self, slot_id, command, *args):
+        try:
+            command(*args)
+            return True
+        except self.backend.TraCIException as e:
+            print(f"[WARN] Rendering {command.__name__} failed for {slot_id}: {e}")
+            return False
+
+    def get_metrics(self):
+        """
+        Returns:
+            dict: Frames drawn, POIs currently drawn and POI commands sent since creation.
+        """
+        return {
+            "frames": self.frames,
+            "drawn": len(self.rendered),
+            "positions_sent": self.positions_sent,
+            "added": self.added,
+            "removed": self.removed,
+        }
+
+    def __repr__(self):
+        return f"SlotRenderer(enabled={self.enabled}, drawn={len(self.rendered)}, frames={self.frames})"
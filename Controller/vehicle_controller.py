@@ -1,132 +1,378 @@
 # Controller/vehicle_controller.py
 
-import traci
-import math
+import numpy as np
+import Backend.constants as tc
+from Backend.factory import get_default_backend
+from Entity.registry import SimulationRegistry
+from Controller.command_buffer import CommandBuffer
+
+# Vehicle variables subscribed at insertion and read once per step via backend.get_vehicle_columns
+VEHICLE_SUBSCRIPTION_VARS = (
+    tc.VAR_POSITION,
+    tc.VAR_ANGLE,
+    tc.VAR_SPEED,
+    tc.VAR_ROAD_ID,
+    tc.VAR_ROUTE_ID,
+    tc.VAR_EDGES,
+    tc.VAR_LANE_ID,
+    tc.VAR_LANEPOSITION,
+)
+
+# Simulation variables subscribed once, driving the active-vehicle registry
+SIMULATION_SUBSCRIPTION_VARS = (
+    tc.VAR_DEPARTED_VEHICLES_IDS,
+    tc.VAR_ARRIVED_VEHICLES_IDS,
+)
 
 class VehicleController:
-    def __init__(self, vehicle_list, route_groups):
+    def __init__(self, vehicle_list, route_groups, registry=None, command_buffer=None, backend=None,
+                 route_group_index=None):
         """
         Initialize the VehicleController.
 
         Args:
             vehicle_list (List[Vehicle]): List of all active vehicles in the simulation.
             route_groups (dict): Grouped route IDs for rerouting logic based on direction and entry edge.
+            registry (SimulationRegistry, optional): Shared vehicle/slot registry. A new one is created if omitted;
+                vehicles appended to vehicle_list are registered at the next step.
+            command_buffer (CommandBuffer, optional): Buffer for setSpeed/changeLane commands, flushed by the
+                caller before simulationStep. If omitted, an immediate (non-deferred) buffer is used.
+            backend (SimulationBackend, optional): Simulator to control. Defaults to the TraCI default connection.
+            route_group_index (dict, optional): Route ID → (group name, position in the group), as returned by
+                RouteXMLParser.get_route_group_index(). Derived from route_groups if omitted.
+
+        Subscribes to the simulation's departed/arrived vehicle lists, so SUMO must already be running.
         """
         self.vehicle_list = vehicle_list
         self.route_groups = route_groups
+        if route_group_index is None:
+            route_group_index = {route_id: (group, position)
+                                 for group, route_ids in route_groups.items()
+                                 for position, route_id in enumerate(route_ids)}
+        self.route_group_index = route_group_index  # Route ID → (group name, position in the group)
+        self.backend = backend if backend is not None else get_default_backend()
+        self.registry = registry if registry is not None else SimulationRegistry()
+        self.command_buffer = command_buffer if command_buffer is not None else CommandBuffer(deferred=False, backend=self.backend)
+        self.subscribed_vehicles = set()  # IDs of vehicles whose variables are subscribed
+        self.lane_lengths = {}            # Lane ID → length, cached after the first query
+        self.backend.simulation.subscribe(SIMULATION_SUBSCRIPTION_VARS)
+
+    def subscribe_vehicle(self, veh_id):
+        """
+        Subscribe to the variables read by step() for a newly inserted vehicle.
+        Results become available after the next simulation step.
+
+        Args:
+            veh_id (str): ID of the vehicle just added to SUMO.
+        """
+        self.backend.vehicle.subscribe(veh_id, VEHICLE_SUBSCRIPTION_VARS)
+        self.subscribed_vehicles.add(veh_id)
+
+    def reattach(self):
+        """
+        Renew the simulator-side state after the simulation was reloaded with simulation.loadState,
+        which drops all subscriptions and the speeds set through setSpeed: re-subscribes the
+        departed/arrived lists and every active vehicle, and makes the next step resend all speeds.
+        """
+        self.backend.simulation.subscribe(SIMULATION_SUBSCRIPTION_VARS)
+        self.command_buffer.reset_sent_speeds()
+        self.subscribed_vehicles.clear()
+        for vehicle in self.vehicle_list:
+            if self.registry.is_active(vehicle.id):
+                self.subscribe_vehicle(vehicle.id)
+
+    def _get_lane_length(self, lane_id):
+        """
+        Returns:
+            float: Length of the lane, queried from SUMO only once per lane.
+        """
+        length = self.lane_lengths.get(lane_id)
+        if length is None:
+            length = self.backend.lane.getLength(lane_id)
+            self.lane_lengths[lane_id] = length
+        return length
+
+    def _release_vehicle_slots(self, vehicle):
+        """
+        Release the slots still held by a vehicle that left the simulation.
+
+        Args:
+            vehicle (Vehicle): The vehicle that left.
+        """
+        for slot in (vehicle.current_slot, vehicle.previous_slot):
+            if slot is not None and slot.vehicle_id == vehicle.id:
+                slot.release()
+                slot.busy = False
+        vehicle.current_slot = None
+        vehicle.previous_slot = None
+
+    def _process_departures_and_arrivals(self):
+        """
+        Update the active-vehicle registry from the departed/arrived lists of the last simulation step.
+        Arrived vehicles release their slots.
+
+        Returns:
+            List[Vehicle]: Registered vehicles that arrived during the last step.
+        """
+        events = self.backend.simulation.getSubscriptionResults()
+        self.registry.mark_departed(events.get(tc.VAR_DEPARTED_VEHICLES_IDS, ()))
+        arrived = self.registry.mark_arrived(events.get(tc.VAR_ARRIVED_VEHICLES_IDS, ()))
+        for vehicle in arrived:
+            self._release_vehicle_slots(vehicle)
+        return arrived
 
     def step(self):
         """
         Synchronize vehicle state with their assigned slots and execute speed control,
         rerouting logic, and slot releasing upon exit.
+
+        Departures and arrivals come from the simulation's departed/arrived lists, so the
+        bookkeeping of the active-vehicle set is proportional to churn rather than fleet size.
+        Vehicle state is read from the variable subscriptions as columns in one backend call, and the
+        vehicle centers and slot-following speeds of the whole fleet are computed with array operations.
         """
-        to_remove = []
+        to_remove = self._process_departures_and_arrivals()
+        arrived_ids = {v.id for v in to_remove}
+        vehicles = self.registry.vehicles
 
+        tracked = []
         for vehicle in self.vehicle_list:
             veh_id = vehicle.id
-            slot = vehicle.current_slot
-
-            try:
-                if veh_id not in traci.vehicle.getIDList():
+            if veh_id not in vehicles:
+                self.registry.add_vehicle(vehicle)
+            if veh_id in arrived_ids or not self.registry.is_active(veh_id):
+                continue  # Arrived this step, or added but not yet inserted by SUMO
+            if veh_id not in self.subscribed_vehicles:
+                # Added without subscribe_vehicle(): subscribe now, state is available from the next step
+                try:
+                    self.subscribe_vehicle(veh_id)
+                except self.backend.TraCIException as e:
+                    print(f"[WARN] Control failed for {veh_id}: {e}")
                     to_remove.append(vehicle)
-                    continue
-
-                # Update vehicle's current position, heading, and speed
-                front_x, front_y = traci.vehicle.getPosition(veh_id)
-                heading_deg = traci.vehicle.getAngle(veh_id)
-                heading_rad = math.radians(heading_deg)
-                speed = traci.vehicle.getSpeed(veh_id)
-
-                center_x = front_x - (vehicle.vehicle_type.length / 2.0) * math.cos(heading_rad)
-                center_y = front_y - (vehicle.vehicle_type.length / 2.0) * math.sin(heading_rad)
-                vehicle.position = (center_x, center_y)
-                vehicle.heading = heading_deg
-                vehicle.speed = speed
-
-                # === Exit Detection ===
-                current_edge = traci.vehicle.getRoadID(veh_id)
-                if vehicle.current_slot and "off_ramp" in current_edge:
-                    vehicle.current_slot.release()
-                    vehicle.current_slot.busy = False
-                    vehicle.current_slot = None
-
-                    if vehicle.previous_slot:
-                        vehicle.previous_slot.release()
-                        vehicle.previous_slot.busy = False
-                        vehicle.previous_slot = None
+                continue
+            tracked.append(vehicle)
+
+        # Vehicles subscribed during the last step have no results yet
+        found, columns = self.backend.get_vehicle_columns([v.id for v in tracked], VEHICLE_SUBSCRIPTION_VARS)
+        tracked = [tracked[i] for i in found]
+        if tracked:
+            self._sync_vehicles(tracked, columns, to_remove)
+
+        # Remove vehicles no longer in simulation (one pass over the list instead of list.remove per vehicle)
+        # Remove vehicles no longer in simulation (one pass over the list instead of list.remove per vehicle)
+        if to_remove:
+            removed_ids = {v.id for v in to_remove}
+            self.vehicle_list[:] = [v for v in self.vehicle_list if v.id not in removed_ids]
+            for v in to_remove:
+                self.registry.remove_vehicle(v.id)
+                self.subscribed_vehicles.discard(v.id)
+                self.command_buffer.forget(v.id)
+                print(f"[CLEAN] Removed vehicle {v.id}")
+
+    def _sync_vehicles(self, tracked, columns, to_remove):
+        """
+        Update the tracked vehicles from their subscription columns, then run exit detection,
+        action completion, slot synchronization and rerouting for them.
 
-                    print(f"[INFO] Vehicle {veh_id} entered {current_edge}, released slot")
+        Args:
+            tracked (List[Vehicle]): Vehicles with subscription results.
+            columns (Dict[int, Sequence]): Variable ID → values of the tracked vehicles, as returned by
+                backend.get_vehicle_columns().
+            to_remove (List[Vehicle]): Vehicles to remove after this step; vehicles whose control fails are appended.
+        """
+        count = len(tracked)
+        front = np.asarray(columns[tc.VAR_POSITION], dtype=np.float64).reshape(count, 2)
+        heading_deg = np.asarray(columns[tc.VAR_ANGLE], dtype=np.float64)
+        heading_rad = np.radians(heading_deg)
+        half_length = np.fromiter((v.vehicle_type.length for v in tracked), dtype=np.float64, count=count) / 2.0
+        center_x = (front[:, 0] - half_length * np.cos(heading_rad)).tolist()
+        center_y = (front[:, 1] - half_length * np.sin(heading_rad)).tolist()
+        headings = heading_deg.tolist()
+        speeds = np.asarray(columns[tc.VAR_SPEED], dtype=np.float64).tolist()
+        lane_ids = columns[tc.VAR_LANE_ID]
+        road_ids = columns[tc.VAR_ROAD_ID]
+
+        failed = set()  # Indices of vehicles whose control failed during this step
+        slotted = []    # Indices of vehicles still assigned to a slot after exit detection
+        for k, vehicle in enumerate(tracked):
+            vehicle.position = (center_x[k], center_y[k])
+            vehicle.heading = headings[k]
+            vehicle.speed = speeds[k]
+            vehicle.lane_id = lane_ids[k]
+
+            # === Exit Detection ===
+            current_edge = road_ids[k]
+            if vehicle.current_slot and "off_ramp" in current_edge:
+                vehicle.current_slot.release()
+                vehicle.current_slot.busy = False
+                vehicle.current_slot = None
 
-                # === Action Completion Detection ===
                 if vehicle.previous_slot:
-                    new_slot = vehicle.current_slot
-                    dx = new_slot.center[0] - center_x
-                    dy = new_slot.center[1] - center_y
-                    new_slot_heading_rad = math.radians(new_slot.heading)
-                    dist = abs(dx * math.cos(new_slot_heading_rad) + dy * math.sin(new_slot_heading_rad))
-                    if dist < 1.0:
-                        vehicle.previous_slot.release()
-                        vehicle.previous_slot.busy = False
-                        vehicle.current_slot.busy = False
-                        print(f"[ACTION] Vehicle {vehicle.id} completed action, released slot {vehicle.previous_slot.id}")
-                        vehicle.previous_slot = None
-
-                # === Slot Synchronization Control ===
-                if vehicle.current_slot:
-                    slot = vehicle.current_slot
-                    dx = slot.center[0] - center_x
-                    dy = slot.center[1] - center_y
-                    slot_heading_rad = math.radians(slot.heading)
-                    delta_along = dx * math.cos(slot_heading_rad) + dy * math.sin(slot_heading_rad)
-
-                    tolerance = 0.01
-                    max_adjust = 2.0
-                    if abs(delta_along) > tolerance:
-                        correction = max(-max_adjust, min(max_adjust, 0.8 * delta_along))
-                        target_speed = max(0, min(slot.speed + correction, vehicle.vehicle_type.max_speed))
-                        traci.vehicle.setSpeed(veh_id, target_speed)
-                    else:
-                        traci.vehicle.setSpeed(veh_id, slot.speed)
-                        slot.busy = False
-
-                # === Reroute Logic ===
-                route_id = traci.vehicle.getRouteID(veh_id)
-                if route_id.startswith("route_"):
-                    parts = route_id.split("_")
-                    is_reverse = parts[-1] == "r"
-                    entry = parts[1]
-                    group_key = f"{entry}_{'reverse' if is_reverse else 'forward'}"
-                    if group_key in self.route_groups:
-                        route_list = self.route_groups[group_key]
-                        if route_id in route_list:
-                            current_index = route_list.index(route_id)
-                            if current_index < len(route_list) - 1:
-                                route_edges = traci.vehicle.getRoute(veh_id)
-                                current_edge_index = route_edges.index(current_edge) if current_edge in route_edges else -1
-                                if current_edge_index == len(route_edges) - 2:
-                                    pos_on_lane = traci.vehicle.getLanePosition(veh_id)
-                                    lane_id = traci.vehicle.getLaneID(veh_id)
-                                    lane_length = traci.lane.getLength(lane_id)
-                                    if lane_length - pos_on_lane < 50:
-                                        lane_index = int(lane_id.split("_")[-1])
-                                        if lane_index != 0:
-                                            new_route_id = route_list[current_index + 1]
-                                            traci.vehicle.setRouteID(veh_id, new_route_id)
-                                            print(f"[REROUTE] Vehicle {veh_id} rerouted: {route_id} -> {new_route_id}")
-
-            except traci.TraCIException as e:
-                print(f"[WARN] Control failed for {veh_id}: {e}")
+                    vehicle.previous_slot.release()
+                    vehicle.previous_slot.busy = False
+                    vehicle.previous_slot = None
+
+                print(f"[INFO] Vehicle {vehicle.id} entered {current_edge}, released slot")
+
+            if vehicle.current_slot:
+                slotted.append(k)
+
+        if slotted:
+            slots = [tracked[k].current_slot for k in slotted]
+            slot_x, slot_y, slot_heading, slot_speed = self._gather_slots(slots)
+            slot_heading_rad = np.radians(slot_heading)
+            dx = slot_x - np.array([center_x[k] for k in slotted])
+            dy = slot_y - np.array([center_y[k] for k in slotted])
+            delta_along = dx * np.cos(slot_heading_rad) + dy * np.sin(slot_heading_rad)
+
+            # === Action Completion Detection ===
+            for k, reached in zip(slotted, (np.abs(delta_along) < 1.0).tolist()):
+                vehicle = tracked[k]
+                if vehicle.previous_slot and reached:
+                    vehicle.previous_slot.release()
+                    vehicle.previous_slot.busy = False
+                    vehicle.current_slot.busy = False
+                    print(f"[ACTION] Vehicle {vehicle.id} completed action, released slot {vehicle.previous_slot.id}")
+                    vehicle.previous_slot = None
+
+            # === Slot Synchronization Control ===
+            self._follow_slots(tracked, slotted, slots, delta_along, slot_speed, failed, to_remove)
+
+        # === Reroute Logic ===
+        route_ids = columns[tc.VAR_ROUTE_ID]
+        for k, vehicle in enumerate(tracked):
+            if k in failed:
+                continue
+            group_entry = self.route_group_index.get(route_ids[k])
+            if group_entry is None:
+                continue
+            group_key, current_index = group_entry
+            route_list = self.route_groups[group_key]
+            if current_index >= len(route_list) - 1:
+                continue
+            current_edge = road_ids[k]
+            route_edges = columns[tc.VAR_EDGES][k]
+            current_edge_index = route_edges.index(current_edge) if current_edge in route_edges else -1
+            if current_edge_index != len(route_edges) - 2:
+                continue
+            try:
+                pos_on_lane = columns[tc.VAR_LANEPOSITION][k]
+                lane_id = lane_ids[k]
+                lane_length = self._get_lane_length(lane_id)
+                if lane_length - pos_on_lane < 50:
+                    lane_index = int(lane_id.split("_")[-1])
+                    if lane_index != 0:
+                        new_route_id = route_list[current_index + 1]
+                        self.backend.vehicle.setRouteID(vehicle.id, new_route_id)
+                        print(f"[REROUTE] Vehicle {vehicle.id} rerouted: {route_ids[k]} -> {new_route_id}")
+            except self.backend.TraCIException as e:
+                print(f"[WARN] Control failed for {vehicle.id}: {e}")
                 to_remove.append(vehicle)
 
-        # Remove vehicles no longer in simulation
-        for v in to_remove:
-            self.vehicle_list.remove(v)
-            print(f"[CLEAN] Removed vehicle {v.id}")
+    def _follow_slots(self, tracked, slotted, slots, delta_along, slot_speed, failed, to_remove):
+        """
+        Command every slot-following vehicle to the speed that closes its along-track gap to the slot center,
+        computing the speeds of all of them as array operations.
+
+        Args:
+            tracked (List[Vehicle]): Vehicles with subscription results.
+            slotted (List[int]): Indices into tracked of the vehicles assigned to a slot.
+            slots (List[Slot]): The slot of each vehicle in slotted.
+            delta_along (np.ndarray): Offset of each slot center ahead of its vehicle, along the slot heading.
+            slot_speed (np.ndarray): Speed of each slot.
+            failed (Set[int]): Indices of vehicles whose control failed; updated in place.
+            to_remove (List[Vehicle]): Vehicles to remove after this step; vehicles whose control fails are appended.
+        """
+        tolerance = 0.01
+        max_adjust = 2.0
+        count = len(slotted)
+        max_speed = np.fromiter((tracked[k].vehicle_type.max_speed for k in slotted), dtype=np.float64, count=count)
+        correction = np.clip(0.8 * delta_along, -max_adjust, max_adjust)
+        target_speed = np.maximum(0.0, np.minimum(slot_speed + correction, max_speed))
+        aligned = np.abs(delta_along) <= tolerance
+        target_speed = np.where(aligned, slot_speed, target_speed)
+
+        for j, (k, speed, is_aligned) in enumerate(zip(slotted, target_speed.tolist(), aligned.tolist())):
+            vehicle = tracked[k]
+            try:
+                self.command_buffer.set_speed(vehicle.id, speed)
+            except self.backend.TraCIException as e:
+                print(f"[WARN] Control failed for {vehicle.id}: {e}")
+                to_remove.append(vehicle)
+                failed.add(k)
+                continue
+            if is_aligned:
+                slots[j].busy = False
+
+    @staticmethod
+    def _gather_slots(slots):
+        """
+        Read the center, heading and speed of several slots with one fancy-indexing pass per SlotStore.
+
+        Args:
+            slots (List[Slot]): Slots to read.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: Center X, center Y, heading in degrees
+            and speed of each slot, in the order of slots.
+        """
+        by_store = {}  # SlotStore → (positions in slots, rows)
+        for j, slot in enumerate(slots):
+            positions, rows = by_store.setdefault(slot.store, ([], []))
+            positions.append(j)
+            rows.append(slot.row)
+        count = len(slots)
+        slot_x = np.empty(count)
+        slot_y = np.empty(count)
+        slot_heading = np.empty(count)
+        slot_speed = np.empty(count)
+        for store, (positions, rows) in by_store.items():
+            slot_x[positions] = store.center_x[rows]
+            slot_y[positions] = store.center_y[rows]
+            slot_heading[positions] = store.heading[rows]
+            slot_speed[positions] = store.speed[rows]
+        return slot_x, slot_y, slot_heading, slot_speed
 
     def _get_vehicle_by_slot(self, slot):
-        for vehicle in self.vehicle_list:
-            if vehicle.id == slot.vehicle_id:
-                return vehicle
+        return self.registry.get_vehicle_by_slot(slot)
+
+    def _find_lane_change_slot(self, slot, neighbor_full_lane, max_offset=10.0):
+        """
+        Find the free target slot alongside a slot on a neighboring FullLane.
+
+        The slot center is mapped to an arc length on the neighbor via the precomputed
+        longitudinal mapping, and the neighbor slot covering that position is found by
+        binary search. Its adjacent slots are checked by index.
+
+        Args:
+            slot (Slot): The slot the vehicle currently occupies.
+            neighbor_full_lane (FullLane): The FullLane to change into.
+            max_offset (float, optional): Maximum longitudinal offset (m) between the slot centers.
+
+        Returns:
+            Slot or None: The target slot, or None if no suitable slot exists.
+        """
+        neighbor_slots = neighbor_full_lane.slots
+        target = slot.full_lane.project_position_to(neighbor_full_lane, slot.position_start + slot.length / 2)
+
+        # The slot covering the target (or the one just behind it, when it falls in a gap) and the one ahead
+        idx = neighbor_slots.find_by_position(target)
+        candidates = []
+        for i in (idx, idx + 1):
+            if 0 <= i < len(neighbor_slots):
+                s = neighbor_slots[i]
+                offset = abs(s.position_start + s.length / 2 - target)
+                if offset < max_offset:
+                    candidates.append((offset, i, s))
+        candidates.sort(key=lambda c: c[0])
+
+        for _, i, s in candidates:
+            if s.occupied or s.busy:
+                continue
+            prev_free = i == 0 or not neighbor_slots[i - 1].occupied
+            next_free = i == len(neighbor_slots) - 1 or not neighbor_slots[i + 1].occupied
+            if prev_free and next_free:
+                return s
         return None
 
     def execute_slot_action(self, slot, action_id: int):
@@ -173,8 +419,8 @@ class VehicleController:
         full_lane = slot.full_lane
         slots = full_lane.slots
         try:
-            current_pos = next(i for i, s in enumerate(slots) if s.id == slot.id)
-        except StopIteration:
+            current_pos = slots.index(slot)
+        except ValueError:
             print(f"[ERROR] Slot {slot.id} not found in full_lane.")
             return
 
@@ -203,7 +449,9 @@ class VehicleController:
             print(f"[ACTION] Vehicle {vehicle.id} moved backward to slot {new_slot.id}")
 
         elif action_id in [3, 4]:  # Lane change
-            lane_id = traci.vehicle.getLaneID(vehicle.id)
+            lane_id = vehicle.lane_id
+            if lane_id is None:  # No subscription results yet
+                lane_id = self.backend.vehicle.getLaneID(vehicle.id)
             if "ramp" in lane_id.lower():
                 print(f"[INFO] Vehicle {vehicle.id} is on a ramp. Lane change not allowed.")
                 return
@@ -212,32 +460,13 @@ class VehicleController:
                 return
 
             direction = -1 if action_id == 3 else 1
-            current_x = slot.center[0]
-
-            candidate_full_lanes = []
-            for start_x, end_x, neighbor, neighbor_direction in full_lane.neighbor_full_lanes:
-                if neighbor_direction == direction and start_x <= current_x <= end_x:
-                    candidate_full_lanes.append(neighbor)
+            neighbor_full_lane = full_lane.get_neighbor_full_lane(slot.position_start + slot.length / 2, direction)
 
-            if not candidate_full_lanes:
+            if neighbor_full_lane is None:
                 print(f"[LANE CHANGE] No adjacent FullLane available for vehicle {vehicle.id} to change {'left' if direction == -1 else 'right'}.")
                 return
 
-            best_slot = None
-            for neighbor_full_lane in candidate_full_lanes:
-                for s in neighbor_full_lane.slots:
-                    dx = s.center[0] - slot.center[0]
-                    dy = s.center[1] - slot.center[1]
-                    dist = math.hypot(dx, dy)
-                    if dist < 10 and not s.occupied and not s.busy:
-                        idx = neighbor_full_lane.slots.index(s)
-                        prev_free = idx == 0 or not neighbor_full_lane.slots[idx - 1].occupied
-                        next_free = idx == len(neighbor_full_lane.slots) - 1 or not neighbor_full_lane.slots[idx + 1].occupied
-                        if prev_free and next_free:
-                            best_slot = s
-                            break
-                if best_slot:
-                    break
+            best_slot = self._find_lane_change_slot(slot, neighbor_full_lane)
 
             if best_slot:
                 if slot.busy:
@@ -248,8 +477,8 @@ class VehicleController:
                 vehicle.previous_slot = slot
                 vehicle.current_slot = best_slot
                 best_slot.occupy(vehicle.id)
-                lane_result = traci.simulation.convertRoad(*best_slot.center)
-                traci.vehicle.changeLane(vehicle.id, lane_result[2], 50)
+                target_lane = best_slot.full_lane.get_lane_at(best_slot.position_start + best_slot.length / 2)
+                self.command_buffer.change_lane(vehicle.id, target_lane.index, 50)
                 print(f"[LANE CHANGE] Vehicle {vehicle.id} changed {'left' if direction == -1 else 'right'} to slot {best_slot.id}")
             else:
                 print(f"[LANE CHANGE] No available slot for lane change for vehicle {vehicle.id}")
@@ -4,21 +4,25 @@ from Entity.slot import Slot
 from Entity.vehicle import Vehicle, VehicleStatus, VehicleType
 from Entity.route import Route
 from Entity.slot import Slot
+from Entity.registry import SimulationRegistry
 import random
 
 class VehicleGenerator:
-    def __init__(self, route_dict: dict[str, Route], default_vehicle_type: VehicleType):
+    def __init__(self, route_dict: dict[str, Route], default_vehicle_type: VehicleType,
+                 registry: SimulationRegistry | None = None):
         """
         Initializes the VehicleGenerator.
 
         Args:
             route_dict (dict[str, Route]): A dictionary of available routes (route_id -> Route object).
             default_vehicle_type (VehicleType): The default vehicle type to assign to generated vehicles.
+            registry (SimulationRegistry, optional): Registry the generated vehicles are added to.
         """
         self.global_vehicle_index = 0
         self.generated_vehicles = []
         self.routes = route_dict
         self.default_type = default_vehicle_type
+        self.registry = registry if registry is not None else SimulationRegistry()
 
     def select_random_route(self) -> Route:
         """
@@ -64,4 +68,5 @@ class VehicleGenerator:
         )
 
         self.generated_vehicles.append(vehicle)
+        self.registry.add_vehicle(vehicle)
         return vehicle
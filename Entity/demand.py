@@ -0,0 +1,140 @@
+# Entity/demand.py
+
+import math
+import random
+
+
+class Departure:
+    __slots__ = ("id", "type_id", "depart", "route", "from_edge", "to_edge", "via",
+                 "depart_lane", "depart_pos", "depart_speed")
+
+    def __init__(self, id, type_id, depart, route=None, from_edge=None, to_edge=None, via=(),
+                 depart_lane=None, depart_pos=None, depart_speed=None):
+        """
+        A single vehicle of the demand: a <vehicle>, a <trip> or one departure of a <flow>.
+
+        Args:
+            id (str): Vehicle ID.
+            type_id (str): ID of the vehicle type.
+            depart (float): Departure time in seconds.
+            route (Route, optional): Route to follow; None for trips, which only give origin and destination.
+            from_edge (str, optional): Origin edge of a trip.
+            to_edge (str, optional): Destination edge of a trip.
+            via (Tuple[str], optional): Edges a trip must pass.
+            depart_lane (str, optional): SUMO departLane value, None for the default.
+            depart_pos (str, optional): SUMO departPos value, None for the default.
+            depart_speed (str, optional): SUMO departSpeed value, None for the default.
+        """
+        self.id = id
+        self.type_id = type_id
+        self.depart = depart
+        self.route = route
+        self.from_edge = from_edge
+        self.to_edge = to_edge
+        self.via = via
+        self.depart_lane = depart_lane
+        self.depart_pos = depart_pos
+        self.depart_speed = depart_speed
+
+    def __repr__(self):
+        target = self.route.id if self.route is not None else f"{self.from_edge}->{self.to_edge}"
+        return f"Departure(id={self.id}, depart={self.depart}, route={target})"
+
+
+class Flow:
+    __slots__ = ("id", "type_id", "begin", "end", "period", "rate", "probability", "number",
+                 "route", "from_edge", "to_edge", "via", "depart_lane", "depart_pos", "depart_speed")
+
+    def __init__(self, id, type_id, begin=0.0, end=None, period=None, rate=None, probability=None, number=None,
+                 route=None, from_edge=None, to_edge=None, via=(), depart_lane=None, depart_pos=None,
+                 depart_speed=None):
+        """
+        A <flow>: repeated departures kept as parameters and expanded lazily by departures().
+
+        Exactly one of period, rate (Poisson, from period="exp(rate)") or probability sets the spacing;
+        with none of them, number vehicles are spread evenly over [begin, end).
+
+        Args:
+            id (str): Flow ID; departure i gets the vehicle ID "<id>.<i>" as in SUMO.
+            type_id (str): ID of the vehicle type.
+            begin (float, optional): First possible departure time in seconds.
+            end (float, optional): Departures happen before this time. Defaults to 3600 s after begin
+                unless number bounds the flow.
+            period (float, optional): Seconds between departures (also from vehsPerHour).
+            rate (float, optional): Departures per second of a Poisson process.
+            probability (float, optional): Departure probability in each second.
+            number (int, optional): Maximum number of departures.
+            route (Route, optional): Route to follow; None for flows of trips.
+            from_edge (str, optional): Origin edge of a flow of trips.
+            to_edge (str, optional): Destination edge of a flow of trips.
+            via (Tuple[str], optional): Edges the trips must pass.
+            depart_lane (str, optional): SUMO departLane value of every departure.
+            depart_pos (str, optional): SUMO departPos value of every departure.
+            depart_speed (str, optional): SUMO departSpeed value of every departure.
+        """
+        if period is None and rate is None and probability is None and number is None:
+            raise ValueError(f"Flow {id} needs a period, vehsPerHour, probability or number")
+        self.id = id
+        self.type_id = type_id
+        self.begin = begin
+        self.period = period
+        self.rate = rate
+        self.probability = probability
+        self.number = number
+        if end is None and (number is None or (period is None and rate is None and probability is None)):
+            end = begin + 3600.0
+        self.end = end if end is not None else math.inf
+        self.route = route
+        self.from_edge = from_edge
+        self.to_edge = to_edge
+        self.via = via
+        self.depart_lane = depart_lane
+        self.depart_pos = depart_pos
+        self.depart_speed = depart_speed
+
+    def _departure_times(self, rng):
+        number = self.number if self.number is not None else math.inf
+        count = 0
+        if self.rate is not None:
+            time = self.begin
+            while count < number:
+                time += rng.expovariate(self.rate)
+                if time >= self.end:
+                    return
+                yield time
+                count += 1
+        elif self.probability is not None:
+            time = self.begin
+            while count < number and time < self.end:
+                if rng.random() < self.probability:
+                    yield time
+                    count += 1
+                time += 1.0
+        else:
+            spacing = self.period if self.period is not None else (self.end - self.begin) / number
+            while count < number:
+                time = self.begin + count * spacing
+                if time >= self.end:
+                    return
+                yield time
+                count += 1
+
+    def departures(self, rng=None):
+        """
+        Generate the departures of this flow in time order, one at a time.
+
+        Args:
+            rng (random.Random, optional): Random source of Poisson and probability flows. Defaults to the random module.
+
+        Yields:
+            Departure: The next vehicle of the flow.
+        """
+        rng = rng if rng is not None else random
+        for index, depart in enumerate(self._departure_times(rng)):
+            yield Departure(f"{self.id}.{index}", self.type_id, depart, route=self.route,
+                            from_edge=self.from_edge, to_edge=self.to_edge, via=self.via,
+                            depart_lane=self.depart_lane, depart_pos=self.depart_pos,
+                            depart_speed=self.depart_speed)
+
+    def __repr__(self):
+        return f"Flow(id={self.id}, begin={self.begin}, end={self.end}, number={self.number})"
@@ -1,8 +1,15 @@
 # Entity/full_lane.py
 
+import heapq
 import math
+from bisect import bisect_right
+from operator import itemgetter
+from Entity.lane_geometry import LaneGeometry
+from Entity.slot_store import SlotStore
+from Entity.slot_queue import SlotQueue
+from Entity.slot_spatial_index import SlotSpatialIndex
 
-class FullLane:
+class FullLane(LaneGeometry):
     def __init__(self, start_lane_id):
         """
         Represents a complete logical lane composed of multiple connected physical lanes.
@@ -10,27 +17,24 @@ class FullLane:
         Args:
             start_lane_id (str): The ID of the first lane in the sequence.
         """
-        self.start_lane_id = start_lane_id
-        self.lanes = []  # Ordered list of lanes following the driving direction
-        self.full_shape = []  # Combined shape points (geometry) of the full lane
+        super().__init__(start_lane_id)
         self.neighbor_full_lanes = []  # List of neighboring FullLanes: (start_x, end_x, neighbor, direction)
+        self.longitudinal_maps = {}    # Neighbor FullLane → (positions on self, matching positions on neighbor)
+        self.neighbor_intervals = []   # Arc-length neighbor intervals: (start_s, end_s, neighbor, direction)
+        self.neighbor_index = {}       # Direction → (starts, ends, neighbors) sorted by start, see build_neighbor_index()
 
-    def add_lane(self, lane):
+        self.slot_store = SlotStore()  # Struct-of-arrays state of the slots moving on this FullLane
+        self.slots = SlotQueue()       # Slots on this FullLane ordered by ascending position_start
+        self.slot_index = SlotSpatialIndex(self, self.slots)  # Arc-length walk over slots for nearest-slot queries
+
+    def attach_registry(self, registry):
         """
-        Add a lane to the full lane in order and update the overall shape.
+        Let a SimulationRegistry track the vehicle bindings of the slots on this FullLane.
 
         Args:
-            lane (Lane): A Lane instance to append to the FullLane.
-        """
-        if not self.lanes:
-            self.full_shape.extend(lane.shape)
-        else:
-            last_point = self.full_shape[-1]
-            if lane.shape and lane.shape[0] == last_point:
-                self.full_shape.extend(lane.shape[1:])  # Avoid duplicate point
-            else:
-                self.full_shape.extend(lane.shape)
-        self.lanes.append(lane)
+            registry (SimulationRegistry or None): The registry to notify, or None to detach.
+        """
+        self.slot_store.registry = registry
 
     def add_neighbor_full_lane(self, start_x, end_x, neighbor_full_lane, direction):
         """
@@ -44,13 +48,126 @@ class FullLane:
         """
         self.neighbor_full_lanes.append((start_x, end_x, neighbor_full_lane, direction))
 
-    def find_neighbor_slot_by_position(self, position_x, position_y):
+    def add_neighbor_interval(self, start_s, end_s, neighbor_full_lane, direction):
+        """
+        Register an adjacent FullLane over an arc-length interval of this FullLane.
+        Call build_neighbor_index() once all intervals have been added.
+
+        Args:
+            start_s (float): Arc length where the adjacency starts.
+            end_s (float): Arc length where the adjacency ends.
+            neighbor_full_lane (FullLane): The adjacent FullLane instance.
+            direction (int): -1 for left neighbor, 1 for right neighbor.
+        """
+        self.neighbor_intervals.append((start_s, end_s, neighbor_full_lane, direction))
+
+    def build_neighbor_index(self):
+        """
+        Merge touching intervals of the same neighbor and sort them per direction,
+        so that get_neighbor_full_lane() can answer with a binary search.
+        A lane has at most one neighbor per side at any position, so intervals of one direction do not overlap.
+        """
+        grouped = {}
+        for start_s, end_s, neighbor, direction in self.neighbor_intervals:
+            grouped.setdefault((neighbor, direction), []).append((min(start_s, end_s), max(start_s, end_s)))
+
+        merged = []
+        for (neighbor, direction), intervals in grouped.items():
+            intervals.sort()
+            current_start, current_end = intervals[0]
+            for start_s, end_s in intervals[1:]:
+                if start_s <= current_end + 1e-3:  # Merge if close enough
+                    current_end = max(current_end, end_s)
+                else:
+                    merged.append((current_start, current_end, neighbor, direction))
+                    current_start, current_end = start_s, end_s
+            merged.append((current_start, current_end, neighbor, direction))
+
+        merged.sort(key=lambda interval: interval[0])
+        self.neighbor_intervals = merged
+        self.neighbor_index = {}
+        for start_s, end_s, neighbor, direction in merged:
+            starts, ends, neighbors = self.neighbor_index.setdefault(direction, ([], [], []))
+            starts.append(start_s)
+            ends.append(end_s)
+            neighbors.append(neighbor)
+
+    def get_neighbor_full_lane(self, position, direction):
+        """
+        Find the adjacent FullLane on one side at a given arc length.
+
+        Args:
+            position (float): Arc length along this FullLane.
+            direction (int): -1 for the left neighbor, 1 for the right neighbor.
+
+        Returns:
+            FullLane or None: The neighbor covering the position, or None if there is none.
+        """
+        if direction not in self.neighbor_index:
+            return None
+        starts, ends, neighbors = self.neighbor_index[direction]
+        i = bisect_right(starts, position) - 1
+        if i >= 0 and position <= ends[i]:
+            return neighbors[i]
+        return None
+
+    def build_longitudinal_mapping(self, neighbor_full_lane):
+        """
+        Precompute a piecewise-linear mapping from arc length on this FullLane to arc length
+        on a neighboring FullLane. Shape points of each lane are projected onto the other,
+        so the mapping has a breakpoint at every vertex of both polylines.
+
+        Args:
+            neighbor_full_lane (FullLane): The adjacent FullLane.
+        """
+        own_on_other = neighbor_full_lane._project_polyline(self.full_shape)
+        other_on_own = self._project_polyline(neighbor_full_lane.full_shape)
+
+        # Both projections are nondecreasing, so the breakpoints merge in linear time (ties keep own vertices first)
+        source = []
+        target = []
+        reached = -math.inf
+        for position, mapped in heapq.merge(zip(self.cumulative_lengths, own_on_other),
+                                            zip(other_on_own, neighbor_full_lane.cumulative_lengths),
+                                            key=itemgetter(0)):
+            reached = max(reached, mapped)  # Absorb rounding between the two walks; parallel lanes never run backwards
+            source.append(position)
+            target.append(reached)
+
+        self.longitudinal_maps[neighbor_full_lane] = (source, target)
+
+    def project_position_to(self, neighbor_full_lane, position):
+        """
+        Map an arc length on this FullLane to the corresponding arc length on a neighboring FullLane.
+
+        Args:
+            neighbor_full_lane (FullLane): The adjacent FullLane.
+            position (float): Arc length on this FullLane.
+
+        Returns:
+            float: Matching arc length on the neighbor.
+        """
+        if neighbor_full_lane not in self.longitudinal_maps:
+            self.build_longitudinal_mapping(neighbor_full_lane)
+        source, target = self.longitudinal_maps[neighbor_full_lane]
+
+        i = bisect_right(source, position)
+        if i == 0:
+            return target[0] + (position - source[0])
+        if i == len(source):
+            return target[-1] + (position - source[-1])
+        span = source[i] - source[i - 1]
+        ratio = (position - source[i - 1]) / span if span > 0 else 0.0
+        return target[i - 1] + ratio * (target[i] - target[i - 1])
+
+    def find_neighbor_slot_by_position(self, position_x, position_y, max_distance=None):
         """
         Find the closest available slot in neighboring FullLanes at a given position.
 
         Args:
             position_x (float): X coordinate of the current vehicle/slot.
             position_y (float): Y coordinate of the current vehicle/slot.
+            max_distance (float, optional): Only consider slots closer than this. Unbounded if None.
 
         Returns:
             Slot or None: The best candidate slot if found, otherwise None.
@@ -58,36 +175,20 @@ class FullLane:
         best_slot = None
         min_dist = float('inf')
 
-        for start_x, end_x, neighbor_lane in self.neighbor_full_lanes:
+        for start_x, end_x, neighbor_lane, _ in self.neighbor_full_lanes:
             if not (start_x <= position_x <= end_x):
                 continue
-            if not hasattr(neighbor_lane, "slots"):
+            slot = neighbor_lane.slot_index.nearest_free_slot(position_x, position_y, max_distance)
+            if slot is None:
                 continue
-            for slot in neighbor_lane.slots:
-                if slot.occupied:
-                    continue
-                sx, sy = slot.center
-                dist = math.hypot(sx - position_x, sy - position_y)
-                if dist < min_dist:
-                    min_dist = dist
-                    best_slot = slot
+            sx, sy = slot.center
+            dist = math.hypot(sx - position_x, sy - position_y)
+            if dist < min_dist:
+                min_dist = dist
+                best_slot = slot
 
         return best_slot
 
-    def get_total_length(self):
-        """
-        Compute the total geometric arc length of this FullLane.
-
-        Returns:
-            float: Total length in meters.
-        """
-        length = 0
-        for i in range(1, len(self.full_shape)):
-            x1, y1 = self.full_shape[i - 1]
-            x2, y2 = self.full_shape[i]
-            length += math.hypot(x2 - x1, y2 - y1)
-        return length
-
     def __repr__(self):
         """
         String representation of the FullLane object.
@@ -1,6 +1,9 @@
 # Entity/lane.py
 
 class Lane:
+    __slots__ = ("id", "index", "speed", "shape", "from_node", "to_node", "is_internal",
+                 "segment_id", "connected_lanes")
+
     def __init__(self, id, index, speed, shape, from_node=None, to_node=None, is_internal=False):
         """
         Represents a physical lane in the road network.
@@ -9,7 +12,8 @@ class Lane:
             id (str): Unique lane ID.
             index (int): Lane index within the edge (starting from 0 on the left).
             speed (float): Speed limit in meters per second.
-            shape (str): Shape string from SUMO XML, formatted as "x1,y1 x2,y2 ...".
+            shape (str or List[Tuple[float, float]]): Shape string from SUMO XML, formatted as "x1,y1 x2,y2 ...",
+                or the already parsed points.
             from_node (str, optional): ID of the starting node.
             to_node (str, optional): ID of the ending node.
             is_internal (bool): Whether the lane is an internal connector (e.g., at junctions).
@@ -31,11 +35,14 @@ class Lane:
         Parse a SUMO shape string into a list of (x, y) coordinate tuples.
 
         Args:
-            shape_str (str): Shape string from SUMO, e.g., "100.0,50.0 110.0,55.0".
+            shape_str (str or List[Tuple[float, float]]): Shape string from SUMO, e.g., "100.0,50.0 110.0,55.0".
+                Parsed points (e.g. from the compiled network cache) are used as they are.
 
         Returns:
             List[Tuple[float, float]]: Parsed list of points.
         """
+        if not isinstance(shape_str, str):
+            return list(shape_str)
         points = []
         for pair in shape_str.strip().split():
             x, y = map(float, pair.split(','))
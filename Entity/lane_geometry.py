@@ -0,0 +1,361 @@
+# Entity/lane_geometry.py
+
+import math
+from bisect import bisect_left, bisect_right
+import numpy as np
+
+
+class LaneGeometry:
+    def __init__(self, start_lane_id):
+        """
+        Arc-length geometry of a chain of connected lanes: the combined shape and its compiled index,
+        with interpolation and projection along it. Holds no slots or neighbor relations, so a backend
+        can keep one per lane cheaply; FullLane adds those on top.
+
+        Args:
+            start_lane_id (str): The ID of the first lane in the sequence.
+        """
+        self.start_lane_id = start_lane_id
+        self.lanes = []  # Ordered list of lanes following the driving direction
+        self.full_shape = []  # Combined shape points (geometry) of the full lane
+
+        # Compiled geometry index, extended incrementally by add_lane()
+        self.cumulative_lengths = []  # Arc length from the start of the FullLane to each shape point
+        self.segment_directions = []  # Unit direction vector (ux, uy) of each shape segment
+        self.segment_headings = []    # Heading in degrees of each shape segment
+        self.lane_start_indices = []  # Index in full_shape of the first point of each lane
+
+        # Derived geometry (total length, bounding box, ...), computed lazily and reset by add_lane()
+        self._derived_geometry = None
+        self._geometry_arrays = None  # Precompiled (shape, cumulative, direction, heading) arrays, see restore_geometry()
+
+    def add_lane(self, lane):
+        """
+        Add a lane to the full lane in order and update the overall shape.
+
+        Args:
+            lane (Lane): A Lane instance to append to the FullLane.
+        """
+        if not self.lanes:
+            self.lane_start_indices.append(0)
+            self.full_shape.extend(lane.shape)
+        else:
+            last_point = self.full_shape[-1]
+            if lane.shape and lane.shape[0] == last_point:
+                self.lane_start_indices.append(len(self.full_shape) - 1)
+                self.full_shape.extend(lane.shape[1:])  # Avoid duplicate point
+            else:
+                self.lane_start_indices.append(len(self.full_shape))
+                self.full_shape.extend(lane.shape)
+        self.lanes.append(lane)
+        self._extend_geometry_index()
+        self._derived_geometry = None  # Geometry changed, drop cached values
+        self._geometry_arrays = None
+
+    def restore_geometry(self, lanes, full_shape, lane_start_indices, cumulative_lengths, segment_directions,
+                         segment_headings, geometry_arrays=None):
+        """
+        Install member lanes together with their precompiled geometry index instead of adding them
+        one by one with add_lane(). Used by the compiled network cache (Sumo/net_cache.py).
+
+        Args:
+            lanes (List[Lane]): Member lanes in driving order.
+            full_shape (List[Tuple[float, float]]): Combined shape points.
+            lane_start_indices (List[int]): Index in full_shape of the first point of each lane.
+            cumulative_lengths (List[float]): Arc length at each shape point.
+            segment_directions (List[Tuple[float, float]]): Unit direction vector of each shape segment.
+            segment_headings (List[float]): Heading in degrees of each shape segment.
+            geometry_arrays (Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray], optional): The same shape points,
+                arc lengths, directions and headings as arrays (e.g. memory-mapped), used by the vectorized
+                methods instead of converting the lists.
+        """
+        self.lanes = lanes
+        self.full_shape = full_shape
+        self.lane_start_indices = lane_start_indices
+        self.cumulative_lengths = cumulative_lengths
+        self.segment_directions = segment_directions
+        self.segment_headings = segment_headings
+        self._derived_geometry = None
+        self._geometry_arrays = geometry_arrays
+
+    def _extend_geometry_index(self):
+        """
+        Extend the compiled geometry index to cover shape points appended since the last call.
+        Cumulative arc lengths, unit directions and headings are computed once per segment.
+        """
+        if not self.cumulative_lengths and self.full_shape:
+            self.cumulative_lengths.append(0.0)
+
+        for i in range(len(self.cumulative_lengths), len(self.full_shape)):
+            x1, y1 = self.full_shape[i - 1]
+            x2, y2 = self.full_shape[i]
+            dx = x2 - x1
+            dy = y2 - y1
+            segment_length = math.hypot(dx, dy)
+
+            self.cumulative_lengths.append(self.cumulative_lengths[-1] + segment_length)
+            if segment_length > 0:
+                self.segment_directions.append((dx / segment_length, dy / segment_length))
+            else:
+                self.segment_directions.append((0.0, 0.0))
+            self.segment_headings.append(math.degrees(math.atan2(dy, dx)))
+
+    def interpolate_position_and_heading(self, target_distance):
+        """
+        Interpolate a position and heading at a given arc length along the FullLane.
+        Uses a binary search over the precomputed cumulative arc lengths.
+
+        Args:
+            target_distance (float): Arc length distance from the start of the FullLane.
+
+        Returns:
+            Tuple[Tuple[float, float], float]: The (x, y) position and heading (in degrees) at the given distance.
+        """
+        cumulative = self.cumulative_lengths
+        segment_count = len(cumulative) - 1
+
+        # First segment whose end point reaches the target distance
+        i = bisect_left(cumulative, target_distance, 1) - 1
+        if i >= segment_count:
+            # Fallback to the end of the last segment
+            return self.full_shape[-1], self.segment_headings[-1]
+
+        x1, y1 = self.full_shape[i]
+        ux, uy = self.segment_directions[i]
+        offset = target_distance - cumulative[i]
+        return (x1 + offset * ux, y1 + offset * uy), self.segment_headings[i]
+
+    def interpolate_positions_and_headings(self, target_distances):
+        """
+        Vectorized version of interpolate_position_and_heading for many arc lengths at once,
+        using a single searchsorted over the cumulative arc lengths.
+
+        Args:
+            target_distances (np.ndarray): Arc length distances from the start of the FullLane.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: X coordinates, Y coordinates and headings (in degrees).
+        """
+        geometry = self._get_derived_geometry()
+        cumulative = geometry["cumulative_array"]
+        points = geometry["shape_array"]
+        directions = geometry["direction_array"]
+        headings = geometry["heading_array"]
+        segment_count = len(cumulative) - 1
+
+        indices = np.maximum(np.searchsorted(cumulative, target_distances, side="left"), 1) - 1
+        beyond = indices >= segment_count
+        indices = np.minimum(indices, segment_count - 1)
+
+        offsets = target_distances - cumulative[indices]
+        xs = points[indices, 0] + offsets * directions[indices, 0]
+        ys = points[indices, 1] + offsets * directions[indices, 1]
+        if beyond.any():
+            # Fallback to the end of the last segment
+            xs[beyond] = points[-1, 0]
+            ys[beyond] = points[-1, 1]
+        return xs, ys, headings[indices]
+
+    def _project_polyline(self, points):
+        """
+        Project the vertices of a roughly parallel polyline onto this FullLane in a single forward walk.
+
+        Each point is matched against the segment the previous point ended on and the ones after it;
+        the walk moves on while the next segment is at least as close. The arc lengths are nondecreasing,
+        the cost is linear in both shapes, and points stay on the stretch of this lane next to them
+        even where the lane curves back close to itself further along.
+
+        Args:
+            points (List[Tuple[float, float]]): Polyline vertices in driving order.
+
+        Returns:
+            List[float]: Arc length on this FullLane of each point.
+        """
+        shape = self.full_shape
+        cumulative = self.cumulative_lengths
+        directions = self.segment_directions
+        last_segment = len(shape) - 2
+        if last_segment < 0:
+            return [0.0] * len(points)
+
+        def closest(segment, px, py):
+            # Offset along the segment of the closest point and its distance to (px, py)
+            x1, y1 = shape[segment]
+            ux, uy = directions[segment]
+            offset = min(max((px - x1) * ux + (py - y1) * uy, 0.0), cumulative[segment + 1] - cumulative[segment])
+            return offset, math.hypot(x1 + offset * ux - px, y1 + offset * uy - py)
+
+        segment = 0
+        reached = 0.0
+        positions = []
+        for px, py in points:
+            offset, distance = closest(segment, px, py)
+            while segment < last_segment:
+                next_offset, next_distance = closest(segment + 1, px, py)
+                if next_distance > distance:
+                    break
+                segment += 1
+                offset, distance = next_offset, next_distance
+            reached = max(reached, cumulative[segment] + offset)
+            positions.append(reached)
+        return positions
+
+    @staticmethod
+    def _project_points(points, geometry):
+        """
+        Project points orthogonally onto a polyline and return their arc lengths along it.
+
+        Args:
+            points (np.ndarray): Array of shape (n, 2) with the points to project.
+            geometry (dict): Derived geometry of the target FullLane.
+
+        Returns:
+            np.ndarray: Arc length of the closest point on the polyline for each input point.
+        """
+        shape = geometry["shape_array"]
+        cumulative = geometry["cumulative_array"]
+        starts = shape[:-1]
+        deltas = shape[1:] - starts
+        lengths = np.diff(cumulative)
+        squared = np.where(lengths > 0, lengths ** 2, 1.0)
+
+        relative = points[:, None, :] - starts[None, :, :]                      # (n, m, 2)
+        t = np.clip((relative * deltas[None, :, :]).sum(axis=2) / squared, 0.0, 1.0)
+        closest = starts[None, :, :] + t[:, :, None] * deltas[None, :, :]
+        distances = np.hypot(*(points[:, None, :] - closest).transpose(2, 0, 1))
+        best = distances.argmin(axis=1)
+        rows = np.arange(len(points))
+        return cumulative[best] + t[rows, best] * lengths[best]
+
+    def project_point(self, x, y):
+        """
+        Project a point orthogonally onto the FullLane.
+
+        Args:
+            x (float): X coordinate.
+            y (float): Y coordinate.
+
+        Returns:
+            Tuple[float, float]: Arc length of the closest point on the FullLane and its distance to (x, y).
+        """
+        geometry = self._get_derived_geometry()
+        position = float(self._project_points(np.array([[x, y]], dtype=np.float64), geometry)[0])
+        (px, py), _ = self.interpolate_position_and_heading(position)
+        return position, math.hypot(px - x, py - y)
+
+    def _get_derived_geometry(self):
+        """
+        Return the cached derived geometry of this FullLane, computing it on first use.
+
+        Returns:
+            dict: Total length, bounding box, start/end points, per-lane arc-length offsets and geometry arrays.
+        """
+        if self._derived_geometry is None:
+            if self._geometry_arrays is not None:
+                shape_array, cumulative_array, direction_array, heading_array = self._geometry_arrays
+            else:
+                shape_array = np.asarray(self.full_shape, dtype=np.float64).reshape(-1, 2)
+                cumulative_array = np.asarray(self.cumulative_lengths, dtype=np.float64)
+                direction_array = np.asarray(self.segment_directions, dtype=np.float64).reshape(-1, 2)
+                heading_array = np.asarray(self.segment_headings, dtype=np.float64)
+            xs = [x for x, _ in self.full_shape]
+            ys = [y for _, y in self.full_shape]
+            self._derived_geometry = {
+                "total_length": self.cumulative_lengths[-1] if self.cumulative_lengths else 0.0,
+                "bounding_box": (min(xs), min(ys), max(xs), max(ys)) if self.full_shape else None,
+                "start_point": self.full_shape[0] if self.full_shape else None,
+                "end_point": self.full_shape[-1] if self.full_shape else None,
+                "lane_offsets": {
+                    lane.id: self.cumulative_lengths[start_index]
+                    for lane, start_index in zip(self.lanes, self.lane_start_indices)
+                },
+                "lane_starts": [self.cumulative_lengths[start_index] for start_index in self.lane_start_indices],
+                "lane_intervals": {
+                    lane.id: (self.cumulative_lengths[start_index],
+                              self.cumulative_lengths[start_index + max(len(lane.shape) - 1, 0)])
+                    for lane, start_index in zip(self.lanes, self.lane_start_indices)
+                },
+                # Array form of the geometry index for vectorized interpolation
+                "cumulative_array": cumulative_array,
+                "shape_array": shape_array,
+                "direction_array": direction_array,
+                "heading_array": heading_array,
+            }
+        return self._derived_geometry
+
+    def get_total_length(self):
+        """
+        Get the total geometric arc length of this FullLane.
+
+        Returns:
+            float: Total length in meters.
+        """
+        return self._get_derived_geometry()["total_length"]
+
+    def get_bounding_box(self):
+        """
+        Get the axis-aligned bounding box of the FullLane shape.
+
+        Returns:
+            Tuple[float, float, float, float] or None: (xmin, ymin, xmax, ymax), or None if the shape is empty.
+        """
+        return self._get_derived_geometry()["bounding_box"]
+
+    def get_start_point(self):
+        """
+        Returns:
+            Tuple[float, float] or None: First shape point of the FullLane.
+        """
+        return self._get_derived_geometry()["start_point"]
+
+    def get_end_point(self):
+        """
+        Returns:
+            Tuple[float, float] or None: Last shape point of the FullLane.
+        """
+        return self._get_derived_geometry()["end_point"]
+
+    def get_lane_offset(self, lane_id):
+        """
+        Get the arc length at which a member lane starts within this FullLane.
+
+        Args:
+            lane_id (str): ID of a lane belonging to this FullLane.
+
+        Returns:
+            float or None: Arc-length offset in meters, or None if the lane is not part of this FullLane.
+        """
+        return self._get_derived_geometry()["lane_offsets"].get(lane_id)
+
+    def get_lane_interval(self, lane_id):
+        """
+        Get the arc-length interval covered by a member lane within this FullLane.
+
+        Args:
+            lane_id (str): ID of a lane belonging to this FullLane.
+
+        Returns:
+            Tuple[float, float] or None: (start, end) arc lengths, or None if the lane is not part of this FullLane.
+        """
+        return self._get_derived_geometry()["lane_intervals"].get(lane_id)
+
+    def get_lane_at(self, position):
+        """
+        Get the member lane covering an arc length, with a binary search over the lane start offsets.
+
+        Args:
+            position (float): Arc length along this FullLane; clamped to the first and last lane.
+
+        Returns:
+            Lane or None: The lane at that position, or None if the FullLane has no lanes.
+        """
+        if not self.lanes:
+            return None
+        i = bisect_right(self._get_derived_geometry()["lane_starts"], position) - 1
+        return self.lanes[max(i, 0)]
+
+    def __repr__(self):
+        """
+        String representation of the LaneGeometry object.
+        """
+        return f"LaneGeometry(start={self.start_lane_id}, lanes={[lane.id for lane in self.lanes]})"
@@ -0,0 +1,130 @@
+# Entity/registry.py
+
+class SimulationRegistry:
+    def __init__(self):
+        """
+        Bidirectional lookup tables between vehicles and slots, replacing linear scans
+        over vehicle and slot lists. Kept up to date by Slot.occupy/release (bindings),
+        VehicleGenerator and the controllers (vehicles).
+        """
+        self.vehicles = {}            # Vehicle ID → Vehicle
+        self.active_vehicles = set()  # IDs of vehicles that have departed and not yet arrived
+        self.slot_bindings = {}       # Slot ID → ID of the vehicle occupying it
+        self.vehicle_bindings = {}    # Vehicle ID → Slot most recently occupied by it
+
+    # ===== Vehicles =====
+
+    def add_vehicle(self, vehicle):
+        """
+        Args:
+            vehicle (Vehicle): Vehicle to register.
+        """
+        self.vehicles[vehicle.id] = vehicle
+
+    def remove_vehicle(self, vehicle_id):
+        """
+        Unregister a vehicle and drop its vehicle → slot binding.
+
+        Args:
+            vehicle_id (str): ID of the vehicle to remove.
+
+        Returns:
+            Vehicle or None: The removed vehicle, or None if it was not registered.
+        """
+        self.vehicle_bindings.pop(vehicle_id, None)
+        self.active_vehicles.discard(vehicle_id)
+        return self.vehicles.pop(vehicle_id, None)
+
+    def mark_departed(self, vehicle_ids):
+        """
+        Record vehicles that entered the network during the last simulation step.
+
+        Args:
+            vehicle_ids (Iterable[str]): IDs from the simulation's departed list.
+        """
+        self.active_vehicles.update(vehicle_ids)
+
+    def mark_arrived(self, vehicle_ids):
+        """
+        Record vehicles that left the network during the last simulation step.
+
+        Args:
+            vehicle_ids (Iterable[str]): IDs from the simulation's arrived list.
+
+        Returns:
+            List[Vehicle]: The registered vehicles among them.
+        """
+        arrived = []
+        for vehicle_id in vehicle_ids:
+            self.active_vehicles.discard(vehicle_id)
+            vehicle = self.vehicles.get(vehicle_id)
+            if vehicle is not None:
+                arrived.append(vehicle)
+        return arrived
+
+    def is_active(self, vehicle_id):
+        """
+        Returns:
+            bool: Whether the vehicle is currently driving in the network.
+        """
+        return vehicle_id in self.active_vehicles
+
+    def get_vehicle(self, vehicle_id):
+        """
+        Returns:
+            Vehicle or None: The vehicle with the given ID, or None if unknown.
+        """
+        return self.vehicles.get(vehicle_id)
+
+    # ===== Slot ↔ vehicle bindings =====
+
+    def bind(self, slot, vehicle_id):
+        """
+        Record that a vehicle occupies a slot. Called by Slot.occupy().
+
+        Args:
+            slot (Slot): The occupied slot.
+            vehicle_id (str): ID of the occupying vehicle.
+        """
+        previous_id = self.slot_bindings.get(slot.id)
+        if previous_id is not None and previous_id != vehicle_id and self.vehicle_bindings.get(previous_id) is slot:
+            del self.vehicle_bindings[previous_id]
+        self.slot_bindings[slot.id] = vehicle_id
+        self.vehicle_bindings[vehicle_id] = slot
+
+    def unbind(self, slot):
+        """
+        Forget the vehicle occupying a slot. Called by Slot.release().
+
+        Args:
+            slot (Slot): The released slot.
+        """
+        vehicle_id = self.slot_bindings.pop(slot.id, None)
+        if vehicle_id is not None and self.vehicle_bindings.get(vehicle_id) is slot:
+            del self.vehicle_bindings[vehicle_id]
+
+    def get_vehicle_by_slot(self, slot):
+        """
+        Args:
+            slot (Slot): The slot to look up.
+
+        Returns:
+            Vehicle or None: The vehicle occupying the slot, or None if it is free or the vehicle is unknown.
+        """
+        vehicle_id = self.slot_bindings.get(slot.id)
+        if vehicle_id is None:
+            vehicle_id = slot.vehicle_id  # Slot bound outside this registry
+        return self.vehicles.get(vehicle_id)
+
+    def get_slot_by_vehicle(self, vehicle_id):
+        """
+        Args:
+            vehicle_id (str): ID of the vehicle.
+
+        Returns:
+            Slot or None: The slot most recently occupied by the vehicle, or None if it holds no slot.
+        """
+        return self.vehicle_bindings.get(vehicle_id)
+
+    def __repr__(self):
+        return f"SimulationRegistry(vehicles={len(self.vehicles)}, bindings={len(self.slot_bindings)})"
@@ -7,10 +7,11 @@ class Route:
 
         Args:
             id (str): Unique identifier for the route.
-            edges (List[str]): Ordered list of edge IDs that form the route path.
+            edges (Sequence[str]): Ordered edge IDs that form the route path. RouteXMLParser passes
+                tuples shared by all routes with the same edges.
         """
         self.id = id              # Unique route identifier
-        self.edges = edges        # List of edge IDs in travel order
+        self.edges = edges        # Edge IDs in travel order
 
     def __repr__(self):
         """
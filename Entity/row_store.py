@@ -0,0 +1,101 @@
+# Entity/row_store.py
+
+import numpy as np
+
+class RowStore:
+    # (attribute name, dtype, value of a freshly allocated row) of each column, declared by subclasses
+    COLUMNS = ()
+
+    def __init__(self, capacity=64):
+        """
+        Struct-of-arrays storage in which every object owns one row of a set of NumPy columns.
+        Rows are handed out from a free list and the columns grow by doubling, so objects come and go
+        without per-object allocation while every column stays available to whole-array operations.
+
+        Args:
+            capacity (int, optional): Initial number of rows. The store grows automatically.
+        """
+        self.capacity = 0
+        for name, dtype, _ in self.COLUMNS:
+            setattr(self, name, np.zeros(0, dtype=dtype))
+        self.active = np.zeros(0, dtype=bool)  # Whether the row is currently in use
+        self.views = []                        # Row → view object bound to the row (or None for free rows)
+        self.free_rows = []                    # Stack of released rows
+        self.used_rows = 0                     # Rows below this index have been handed out
+        self.version = 0                       # Bumped whenever rows are allocated or released
+        self._grow(capacity)
+
+    def _grow(self, new_capacity):
+        """
+        Enlarge all column arrays to the given capacity, keeping existing rows.
+
+        Args:
+            new_capacity (int): New number of rows.
+        """
+        extra = new_capacity - self.capacity
+        if extra <= 0:
+            return
+        for name, dtype, initial in self.COLUMNS:
+            setattr(self, name, np.concatenate([getattr(self, name), np.full(extra, initial, dtype=dtype)]))
+        self.active = np.concatenate([self.active, np.zeros(extra, dtype=bool)])
+        self.views.extend([None] * extra)
+        self.capacity = new_capacity
+
+    def allocate(self, view=None):
+        """
+        Reserve a row and reset its columns to their initial values.
+
+        Args:
+            view (object, optional): The view object bound to the row.
+
+        Returns:
+            int: The allocated row.
+        """
+        if self.free_rows:
+            row = self.free_rows.pop()
+        else:
+            if self.used_rows == self.capacity:
+                self._grow(max(1, self.capacity * 2))
+            row = self.used_rows
+            self.used_rows += 1
+        for name, _, initial in self.COLUMNS:
+            getattr(self, name)[row] = initial
+        self.active[row] = True
+        self.views[row] = view
+        self.version += 1
+        return row
+
+    def release(self, row):
+        """
+        Return a row to the free list.
+
+        Args:
+            row (int): Row to release.
+        """
+        self.active[row] = False
+        self.views[row] = None
+        self.free_rows.append(row)
+        self.version += 1
+
+    def clear(self):
+        """
+        Release every row of the store.
+        """
+        self.active[:] = False
+        self.views = [None] * self.capacity
+        self.free_rows = []
+        self.used_rows = 0
+        self.version += 1
+
+    def active_rows(self):
+        """
+        Returns:
+            np.ndarray: Indices of the rows in use.
+        """
+        return np.flatnonzero(self.active[:self.used_rows])
+
+    def __len__(self):
+        return self.used_rows - len(self.free_rows)
+
+    def __repr__(self):
+        return f"{type(self).__name__}(active={len(self)}, capacity={self.capacity})"
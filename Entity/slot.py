@@ -1,6 +1,12 @@
 # Entity/slot.py
 
+from Entity.slot_store import SlotStore
+
 class Slot:
+    # Declared fields: no per-instance __dict__, the kinematic state lives in the SlotStore row
+    __slots__ = ("id", "segment_id", "lane", "index", "gap_to_previous", "full_lane",
+                 "store", "row")
+
     def __init__(self,
                  id,
                  segment_id,
@@ -12,9 +18,11 @@ class Slot:
                  gap_to_previous=3.0,
                  vehicle_id=None,
                  heading=0.0,
-                 full_lane=None):
+                 full_lane=None,
+                 store=None):
         """
         Represents a virtual traffic slot (space reservation) on a lane for vehicle control.
+        The kinematic state lives in a row of a SlotStore; the Slot object is a thin view over it.
 
         Args:
             id (str): Unique identifier of the slot.
@@ -28,22 +36,132 @@ class Slot:
             vehicle_id (str, optional): ID of the vehicle occupying the slot. Defaults to None.
             heading (float, optional): Heading angle in degrees (relative to SUMO coordinates).
             full_lane (FullLane, optional): Reference to the full logical lane this slot belongs to.
+            store (SlotStore, optional): Store holding the slot state. A private store is created if omitted.
+        """
+        self.store = None          # SlotStore holding this slot's row
+        self.row = None            # Row of this slot in the store
+        self.reset(id, segment_id, lane, index, position_start, speed, length, gap_to_previous,
+                   vehicle_id, heading, full_lane, store)
+
+    def reset(self,
+              id,
+              segment_id,
+              lane,
+              index,
+              position_start,
+              speed,
+              length=8.0,
+              gap_to_previous=3.0,
+              vehicle_id=None,
+              heading=0.0,
+              full_lane=None,
+              store=None):
+        """
+        (Re)initialize the slot, releasing any previously held row. Used by the constructor
+        and by SlotPool recycling; arguments are the same as for the constructor.
         """
+        self.release_row()
+
         self.id = id                              # Unique slot ID
         self.segment_id = segment_id              # Segment the slot is part of
         self.lane = lane                          # Lane object this slot is located on
         self.index = index                        # Global slot index
+        self.gap_to_previous = gap_to_previous    # Gap from the previous slot
+        self.full_lane = full_lane                # Reference to the full logical lane
+        if store is None:
+            store = SlotStore(capacity=1)  # Standalone slot, not on any FullLane
+        self.store = store
+        self.row = store.allocate(self)
+
         self.position_start = position_start      # Start position (arc length) on the lane
         self.length = length                      # Physical length of the slot
-        self.gap_to_previous = gap_to_previous    # Gap from the previous slot
         self.speed = speed                        # Target speed of the slot (m/s)
-        self.position_end = self.position_start + self.length  # End position along the lane
-        self.center = (self.position_start + self.position_end) / 2  # Approximate center (scalar, arc-length)
         self.heading = heading                    # Heading angle in degrees (relative to SUMO)
-        self.occupied = False                     # Whether the slot is currently occupied by a vehicle
-        self.vehicle_id = vehicle_id              # ID of the occupying vehicle, if any
-        self.full_lane = full_lane                # Reference to the full logical lane
-        self.busy = False                         # Whether the slot is currently involved in an action
+        if vehicle_id is not None:
+            self.occupy(vehicle_id)
+
+    # ===== Views over the SlotStore row =====
+
+    @property
+    def position_start(self):
+        return float(self.store.position_start[self.row])
+
+    @position_start.setter
+    def position_start(self, value):
+        self.store.position_start[self.row] = value
+
+    @property
+    def position_end(self):
+        """End position along the lane."""
+        return float(self.store.position_start[self.row] + self.store.length[self.row])
+
+    @property
+    def length(self):
+        return float(self.store.length[self.row])
+
+    @length.setter
+    def length(self, value):
+        self.store.length[self.row] = value
+
+    @property
+    def speed(self):
+        return float(self.store.speed[self.row])
+
+    @speed.setter
+    def speed(self, value):
+        self.store.speed[self.row] = value
+
+    @property
+    def center(self):
+        """(x, y) center point of the slot."""
+        return float(self.store.center_x[self.row]), float(self.store.center_y[self.row])
+
+    @center.setter
+    def center(self, value):
+        self.store.center_x[self.row], self.store.center_y[self.row] = value
+        self.store.version += 1
+
+    @property
+    def heading(self):
+        return float(self.store.heading[self.row])
+
+    @heading.setter
+    def heading(self, value):
+        self.store.heading[self.row] = value
+
+    @property
+    def queue_sequence(self):
+        """Sequence number assigned by the SlotQueue holding the slot."""
+        return int(self.store.queue_sequence[self.row])
+
+    @queue_sequence.setter
+    def queue_sequence(self, value):
+        self.store.queue_sequence[self.row] = value
+
+    @property
+    def occupied(self):
+        return bool(self.store.occupied[self.row])
+
+    @occupied.setter
+    def occupied(self, value):
+        self.store.occupied[self.row] = value
+
+    @property
+    def busy(self):
+        return bool(self.store.busy[self.row])
+
+    @busy.setter
+    def busy(self, value):
+        self.store.busy[self.row] = value
+
+    @property
+    def vehicle_id(self):
+        index = self.store.vehicle_index[self.row]
+        return None if index < 0 else self.store.vehicle_table[index]
+
+    @vehicle_id.setter
+    def vehicle_id(self, value):
+        self.store.set_vehicle(self.row, value)
 
     def occupy(self, vehicle_id):
         """
@@ -54,6 +172,8 @@ class Slot:
         """
         self.occupied = True
         self.vehicle_id = vehicle_id
+        if self.store.registry is not None:
+            self.store.registry.bind(self, vehicle_id)
 
     def release(self):
         """
@@ -61,6 +181,38 @@ class Slot:
         """
         self.occupied = False
         self.vehicle_id = None
+        if self.store.registry is not None:
+            self.store.registry.unbind(self)
+
+    def detach(self, store=None):
+        """
+        Move the slot state out of its FullLane's store into another store and free the shared row.
+        Used when a slot leaves its FullLane, so that references still held elsewhere
+        (e.g. by a bound vehicle) keep their last state instead of aliasing a reused row.
+
+        Args:
+            store (SlotStore, optional): Store receiving the row, normally the SlotPool's retired store.
+                A one-row store is created if omitted.
+        """
+        if store is None:
+            store = SlotStore(capacity=1)
+        if self.store is store:
+            return  # Already detached
+        store.registry = self.store.registry
+        row = store.allocate(self)
+        self.store.copy_row(self.row, store, row)
+        self.store.release(self.row)
+        self.store = store
+        self.row = row
+
+    def release_row(self):
+        """
+        Free the slot's store row. The slot must be reset before it is used again.
+        """
+        if self.store is not None:
+            self.store.release(self.row)
+            self.store = None
+            self.row = None
 
     def __repr__(self):
         """
@@ -68,5 +220,5 @@ class Slot:
         """
         return (f"Slot(id={self.id}, lane={self.lane.id}, index={self.index}, "
                 f"range=({self.position_start:.2f}-{self.position_end:.2f}), "
-                f"center={self.center:.2f}, heading={self.heading:.2f}, "
+                f"center=({self.center[0]:.2f}, {self.center[1]:.2f}), heading={self.heading:.2f}, "
                 f"occupied={self.occupied}, vehicle={self.vehicle_id})")
@@ -0,0 +1,127 @@
+# Entity/slot_queue.py
+
+from bisect import bisect_right
+from itertools import chain
+
+class SlotQueue:
+    def __init__(self, capacity=64):
+        """
+        Ring buffer holding the slots of one FullLane ordered by ascending position_start.
+        All slots on a FullLane move at the same speed, so their order never changes:
+        new slots are spawned at the lane start (front) and expire at the lane end (back).
+        Both operations are O(1) and the queue supports O(1) random access by index.
+        Every slot gets a sequence number on insertion (kept in its SlotStore row), so its index
+        can also be found in O(1).
+
+        Args:
+            capacity (int, optional): Initial buffer size. The buffer doubles when full.
+        """
+        self.buffer = [None] * capacity  # Circular storage of Slot references
+        self.head = 0                    # Buffer position of the front (index 0) slot
+        self.count = 0                   # Number of slots currently queued
+        self.front_sequence = 0          # Sequence number of the front slot; index = sequence - front_sequence
+
+    def _grow(self):
+        """
+        Double the buffer size, unrolling the ring so that the front slot sits at position 0.
+        """
+        self.buffer = list(self) + [None] * len(self.buffer)
+        self.head = 0
+
+    def push_front(self, slot):
+        """
+        Insert a newly spawned slot at the start of the lane.
+
+        Args:
+            slot (Slot): The slot to insert.
+        """
+        if self.count == len(self.buffer):
+            self._grow()
+        self.head = (self.head - 1) % len(self.buffer)
+        self.buffer[self.head] = slot
+        self.count += 1
+        self.front_sequence -= 1
+        slot.queue_sequence = self.front_sequence
+
+    def push_back(self, slot):
+        """
+        Append a slot behind all others (used when filling a lane front to back).
+
+        Args:
+            slot (Slot): The slot to append.
+        """
+        if self.count == len(self.buffer):
+            self._grow()
+        self.buffer[(self.head + self.count) % len(self.buffer)] = slot
+        slot.queue_sequence = self.front_sequence + self.count
+        self.count += 1
+
+    def pop_back(self):
+        """
+        Remove and return the slot furthest along the lane.
+
+        Returns:
+            Slot: The removed slot.
+        """
+        if not self.count:
+            raise IndexError("pop from an empty SlotQueue")
+        position = (self.head + self.count - 1) % len(self.buffer)
+        slot = self.buffer[position]
+        self.buffer[position] = None
+        self.count -= 1
+        return slot
+
+    def clear(self):
+        """
+        Remove all slots from the queue.
+        """
+        self.buffer = [None] * len(self.buffer)
+        self.head = 0
+        self.count = 0
+        self.front_sequence = 0
+
+    def index(self, slot):
+        """
+        Return the index of a slot in the queue.
+
+        Args:
+            slot (Slot): The slot to look up.
+
+        Returns:
+            int: Index of the slot, 0 being the slot closest to the lane start.
+        """
+        i = slot.queue_sequence - self.front_sequence
+        if not 0 <= i < self.count or self.buffer[(self.head + i) % len(self.buffer)] is not slot:
+            raise ValueError(f"{slot} is not in SlotQueue")
+        return i
+
+    def find_by_position(self, position):
+        """
+        Binary search for the last slot starting at or before an arc length.
+
+        Args:
+            position (float): Arc length along the FullLane.
+
+        Returns:
+            int: Index of that slot, or -1 if every slot starts after the position.
+        """
+        return bisect_right(self, position, key=lambda slot: slot.position_start) - 1
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += self.count
+        if not 0 <= i < self.count:
+            raise IndexError("SlotQueue index out of range")
+        return self.buffer[(self.head + i) % len(self.buffer)]
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        end = self.head + self.count
+        if end <= len(self.buffer):
+            return iter(self.buffer[self.head:end])
+        return chain(self.buffer[self.head:], self.buffer[:end - len(self.buffer)])
+
+    def __repr__(self):
+        return f"SlotQueue(count={self.count}, capacity={len(self.buffer)})"
@@ -0,0 +1,97 @@
+# Entity/slot_spatial_index.py
+
+import math
+
+class SlotSpatialIndex:
+    def __init__(self, full_lane, slots):
+        """
+        Arc-length index over the slots of one FullLane, answering
+        "nearest free slot within radius r of (x, y)" without scanning every slot.
+
+        Slots on a FullLane move rigidly along it and the SlotQueue keeps them ordered by position,
+        so the queue itself is the index: a query point is projected onto the lane, the slot at that
+        arc length is found by binary search, and slots are visited outward from it while their
+        longitudinal offset stays below the search radius. Nothing has to be rebuilt when slots move.
+
+        Args:
+            full_lane (FullLane): The FullLane whose geometry the slots follow.
+            slots (SlotQueue): The ordered slots of the FullLane.
+        """
+        self.full_lane = full_lane
+        self.slots = slots
+
+    def _candidates(self, x, y, radius, exclude_occupied, exclude_busy, shrink):
+        """
+        Walk outward from the slot at the query point's arc length and collect the slots whose
+        center lies strictly within the radius and that pass the occupancy filters.
+
+        Args:
+            shrink (bool): Narrow the walk to the closest distance found so far (nearest-slot search).
+
+        Returns:
+            List[Tuple[float, int, Slot]]: (distance, queue index, slot) triples ordered by increasing distance.
+        """
+        slots = self.slots
+        count = len(slots)
+        if count == 0:
+            return []
+        position, _ = self.full_lane.project_point(x, y)
+        start = slots.find_by_position(position)
+
+        found = []
+        limit = radius
+        # Backward from the slot at the query position, then forward from the one after it
+        for direction, indices in ((-1, range(start, -1, -1)), (1, range(start + 1, count))):
+            for i in indices:
+                slot = slots[i]
+                offset = direction * (slot.position_start + slot.length / 2 - position)
+                if offset >= limit:
+                    break  # Offsets only grow further along this direction
+                if exclude_occupied and slot.occupied:
+                    continue
+                if exclude_busy and slot.busy:
+                    continue
+                cx, cy = slot.center
+                dist = math.hypot(cx - x, cy - y)
+                if dist < limit:
+                    found.append((dist, i, slot))
+                    if shrink:
+                        limit = dist
+        found.sort(key=lambda candidate: candidate[:2])
+        return found
+
+    def slots_within(self, x, y, radius, exclude_occupied=True, exclude_busy=False):
+        """
+        Find all slots whose center lies strictly within a radius of a point.
+
+        Args:
+            x (float): Query X coordinate.
+            y (float): Query Y coordinate.
+            radius (float): Search radius in meters.
+            exclude_occupied (bool, optional): Skip occupied slots. Defaults to True.
+            exclude_busy (bool, optional): Skip busy slots. Defaults to False.
+
+        Returns:
+            List[Slot]: Matching slots ordered by increasing distance.
+        """
+        return [slot for _, _, slot in self._candidates(x, y, radius, exclude_occupied, exclude_busy, False)]
+
+    def nearest_free_slot(self, x, y, radius=None, exclude_busy=False):
+        """
+        Find the closest unoccupied slot to a point.
+
+        Args:
+            x (float): Query X coordinate.
+            y (float): Query Y coordinate.
+            radius (float, optional): Only consider slots strictly closer than this. Unbounded if None.
+            exclude_busy (bool, optional): Also skip busy slots. Defaults to False.
+
+        Returns:
+            Slot or None: The closest matching slot, or None if there is none.
+        """
+        limit = math.inf if radius is None else radius
+        found = self._candidates(x, y, limit, True, exclude_busy, True)
+        return found[0][2] if found else None
+
+    def __repr__(self):
+        return f"SlotSpatialIndex(full_lane={self.full_lane.start_lane_id}, slots={len(self.slots)})"
@@ -0,0 +1,175 @@
+# Entity/slot_store.py
+
+import numpy as np
+from Entity.row_store import RowStore
+
+class VehicleIdTable:
+    def __init__(self):
+        """
+        Interns vehicle ID strings so that slot occupancy can be stored as integer indices.
+        Entries are reference counted: every slot row holding an index owns one reference, and an
+        entry is freed for reuse once the last row referring to it lets go, so the table stays
+        bounded by the number of vehicles currently occupying slots.
+        """
+        self.ids = []       # Index → vehicle ID (None for free entries)
+        self.lookup = {}    # Vehicle ID → index
+        self.counts = []    # Index → number of rows referring to the entry
+        self.free = []      # Stack of free indices
+
+    def intern(self, vehicle_id):
+        """
+        Return the index of a vehicle ID and take a reference on it, registering it if needed.
+
+        Args:
+            vehicle_id (str): Vehicle ID to intern.
+
+        Returns:
+            int: Index of the vehicle ID in the table.
+        """
+        index = self.lookup.get(vehicle_id)
+        if index is None:
+            if self.free:
+                index = self.free.pop()
+                self.ids[index] = vehicle_id
+            else:
+                index = len(self.ids)
+                self.ids.append(vehicle_id)
+                self.counts.append(0)
+            self.lookup[vehicle_id] = index
+        self.counts[index] += 1
+        return index
+
+    def release(self, index):
+        """
+        Drop one reference on an entry, freeing it when no row refers to it anymore.
+
+        Args:
+            index (int): Index returned by intern().
+        """
+        self.counts[index] -= 1
+        if self.counts[index] == 0:
+            del self.lookup[self.ids[index]]
+            self.ids[index] = None
+            self.free.append(index)
+
+    def __getitem__(self, index):
+        return self.ids[index]
+
+    def __len__(self):
+        return len(self.lookup)
+
+
+class SlotStore(RowStore):
+    COLUMNS = (
+        ("position_start", np.float64, 0.0),  # Start position (arc length) of each slot
+        ("length", np.float64, 0.0),          # Physical length of each slot
+        ("speed", np.float64, 0.0),           # Target speed of each slot (m/s)
+        ("center_x", np.float64, np.nan),     # X coordinate of each slot center
+        ("center_y", np.float64, np.nan),     # Y coordinate of each slot center
+        ("heading", np.float64, 0.0),         # Heading angle in degrees
+        ("occupied", bool, False),            # Whether a vehicle occupies the slot
+        ("busy", bool, False),                # Whether the slot is involved in an action
+        ("vehicle_index", np.int64, -1),      # Interned vehicle index, -1 if unoccupied
+        ("queue_sequence", np.int64, 0),      # Insertion sequence number in the FullLane's SlotQueue
+    )
+
+    def __init__(self, capacity=64, vehicle_table=None):
+        """
+        Struct-of-arrays storage for the kinematic state of all slots on one FullLane.
+        Each slot owns one row; Slot objects are thin views that read and write their row,
+        so that all slots of a lane can be advanced and interpolated with single array operations.
+        The version is also bumped whenever slot centers change.
+
+        Args:
+            capacity (int, optional): Initial number of rows. The store grows automatically.
+            vehicle_table (VehicleIdTable, optional): Shared table used to intern vehicle IDs.
+        """
+        super().__init__(capacity)
+        self.vehicle_table = vehicle_table if vehicle_table is not None else VehicleIdTable()
+        self.registry = None  # SimulationRegistry notified of slot bindings, if any
+
+    def set_vehicle(self, row, vehicle_id):
+        """
+        Set the occupying vehicle of a row, moving the row's reference in the vehicle table.
+
+        Args:
+            row (int): Row to update.
+            vehicle_id (str or None): ID of the occupying vehicle, None to clear it.
+        """
+        index = -1 if vehicle_id is None else self.vehicle_table.intern(vehicle_id)
+        previous = self.vehicle_index[row]
+        self.vehicle_index[row] = index
+        if previous >= 0:
+            self.vehicle_table.release(previous)
+
+    def release(self, row):
+        """
+        Return a row to the free list, dropping its reference on the occupying vehicle's ID.
+
+        Args:
+            row (int): Row to release.
+        """
+        self.set_vehicle(row, None)
+        super().release(row)
+
+    def clear(self):
+        """
+        Release every row of the store and their vehicle ID references.
+        """
+        for index in self.vehicle_index[self.active_rows()].tolist():
+            if index >= 0:
+                self.vehicle_table.release(index)
+        self.vehicle_index[:] = -1
+        super().clear()
+
+    def advance(self, time_step):
+        """
+        Advance all slots along the lane by speed * time_step in a single array operation.
+
+        Args:
+            time_step (float): Simulation time step in seconds.
+        """
+        self.position_start += self.speed * time_step
+        self.version += 1
+
+    def expired_mask(self, total_length):
+        """
+        Args:
+            total_length (float): Arc length of the FullLane.
+
+        Returns:
+            np.ndarray: Boolean mask of active rows whose start has passed the end of the lane.
+        """
+        return self.active & (self.position_start >= total_length)
+
+    def update_centers(self, full_lane, mask):
+        """
+        Recompute the center point and heading of the selected rows with one vectorized interpolation.
+
+        Args:
+            full_lane (FullLane): The FullLane whose geometry the slots follow.
+            mask (np.ndarray): Boolean mask of rows to update.
+        """
+        rows = np.flatnonzero(mask)
+        if rows.size == 0:
+            return
+        distances = self.position_start[rows] + self.length[rows] / 2
+        xs, ys, headings = full_lane.interpolate_positions_and_headings(distances)
+        self.center_x[rows] = xs
+        self.center_y[rows] = ys
+        self.heading[rows] = headings
+        self.version += 1
+
+    def copy_row(self, row, target, target_row):
+        """
+        Copy all columns of one row into a row of another store.
+
+        Args:
+            row (int): Source row in this store.
+            target (SlotStore): Destination store.
+            target_row (int): Destination row.
+        """
+        for name in ("position_start", "length", "speed", "center_x", "center_y", "heading", "occupied", "busy"):
+            getattr(target, name)[target_row] = getattr(self, name)[row]
+        index = self.vehicle_index[row]
+        target.set_vehicle(target_row, None if index < 0 else self.vehicle_table[index])
@@ -2,9 +2,9 @@
 
 from enum import Enum
 import math
-import traci
 from Entity.slot import Slot
 from Entity.route import Route
+from Backend.factory import get_default_backend
 
 class VehicleStatus(Enum):
     """
@@ -16,6 +16,8 @@ class VehicleStatus(Enum):
     EXITED = 3         # Vehicle has exited the environment
 
 class VehicleType:
+    __slots__ = ("id", "accel", "decel", "max_speed", "length")
+
     def __init__(self, id: str, accel: float, decel: float, max_speed: float, length: float):
         """
         Represents the physical and control properties of a vehicle type.
@@ -37,6 +39,9 @@ class VehicleType:
         return f"VehicleType(id={self.id}, max_speed={self.max_speed}, length={self.length})"
 
 class Vehicle:
+    __slots__ = ("id", "current_slot", "route", "vehicle_type", "speed", "position", "heading",
+                 "status", "previous_slot", "lane_id")
+
     def __init__(self,
                  id: str,
                  current_slot: Slot,
@@ -63,25 +68,31 @@ class Vehicle:
         self.vehicle_type = vehicle_type
         self.speed = speed
         self.position = position
+        self.heading = 0.0  # Heading angle in degrees, updated by VehicleController.step
         self.status = status
         self.previous_slot = None  # For tracking slot transitions
+        self.lane_id = None        # Lane from the latest subscription results, updated by VehicleController.step
 
     def __repr__(self):
         return f"Vehicle(id={self.id}, route={self.route.id}, slot={self.current_slot.id})"
 
-    def get_current_center_position(self):
+    def get_current_center_position(self, backend=None):
         """
         Get the geometric center of the vehicle in real time.
-        This is derived from the front bumper position provided by TraCI.
+        This is derived from the front bumper position provided by the simulator.
+
+        Args:
+            backend (SimulationBackend, optional): Simulator to query. Defaults to the TraCI default connection.
 
         Returns:
             Tuple[float, float] or None: (x, y) center position if available, else None.
         """
+        backend = backend if backend is not None else get_default_backend()
         try:
-            x_front, y_front = traci.vehicle.getPosition(self.id)
-            heading_deg = traci.vehicle.getAngle(self.id)
+            x_front, y_front = backend.vehicle.getPosition(self.id)
+            heading_deg = backend.vehicle.getAngle(self.id)
             heading_rad = math.radians(heading_deg)
-            vehicle_length = traci.vehicle.getLength(self.id)
+            vehicle_length = backend.vehicle.getLength(self.id)
 
             x_center = x_front - (vehicle_length / 2.0) * math.cos(heading_rad)
             y_center = y_front - (vehicle_length / 2.0) * math.sin(heading_rad)
@@ -90,14 +101,18 @@ class Vehicle:
             # Return None if the vehicle is not yet in the simulation
             return None
 
-    def get_front_position(self):
+    def get_front_position(self, backend=None):
         """
-        Get the front bumper position of the vehicle directly from TraCI.
+        Get the front bumper position of the vehicle directly from the simulator.
+
+        Args:
+            backend (SimulationBackend, optional): Simulator to query. Defaults to the TraCI default connection.
 
         Returns:
             Tuple[float, float]: (x, y) position of the vehicle front, or (0.0, 0.0) if unavailable.
         """
+        backend = backend if backend is not None else get_default_backend()
         try:
-            return traci.vehicle.getPosition(self.id)
+            return backend.vehicle.getPosition(self.id)
         except:
             return (0.0, 0.0)
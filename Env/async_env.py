@@ -0,0 +1,145 @@
+import asyncio
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+# Add the project root directory to sys.path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, ".."))
+sys.path.append(project_root)
+
+from Config.config import default_config
+from Env.slot_based_env import SlotBasedEnv
+
+
+class AsyncSlotBasedEnv:
+    def __init__(self, config):
+        """
+        asyncio front end for a SlotBasedEnv.
+
+        Every call of the wrapped environment runs on a thread owned by this environment, so the event
+        loop stays free while SUMO computes and answers over the TraCI socket (socket waits release the
+        GIL). Each environment has its own labeled TraCI connection (see SlotBasedEnv), which lets a
+        single event loop keep many SUMO processes busy; see gather_step().
+
+        Calls of one environment are executed in order on one thread, because a TraCI connection must
+        not be used from several threads at once. Vehicle spawning draws from the shared random module,
+        so concurrent environments are not reproducible individually.
+
+        The constructor blocks until the environment is built; use create() (or gather_create()) to
+        build environments from a running event loop without blocking it.
+
+        Args:
+            config (dict): SlotBasedEnv configuration.
+        """
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="slot_env")
+        self.env = self.executor.submit(SlotBasedEnv, config).result()  # Built on its own thread
+
+    @classmethod
+    async def create(cls, config):
+        """
+        Build an environment on its own thread without blocking the event loop.
+
+        Args:
+            config (dict): SlotBasedEnv configuration.
+
+        Returns:
+            AsyncSlotBasedEnv: The new environment.
+        """
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="slot_env")
+        try:
+            env = await asyncio.get_running_loop().run_in_executor(executor, SlotBasedEnv, config)
+        except BaseException:
+            executor.shutdown(wait=False)
+            raise
+        self = cls.__new__(cls)
+        self.executor = executor
+        self.env = env
+        return self
+
+    async def _call(self, function, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, function, *args)
+
+    async def reset(self):
+        """
+        Returns:
+            Tuple: (observation, info) of SlotBasedEnv.reset().
+        """
+        return await self._call(self.env.reset)
+
+    async def step(self, actions=[]):
+        """
+        Args:
+            actions (dict or list): Actions in the SlotBasedEnv.step format.
+
+        Returns:
+            Tuple: (observation, reward, done, info) of SlotBasedEnv.step().
+        """
+        return await self._call(self.env.step, actions)
+
+    async def close(self):
+        """
+        Close the simulation and stop the environment's thread.
+        """
+        await self._call(self.env.close)
+        self.executor.shutdown(wait=True)
+
+    def __repr__(self):
+        return f"AsyncSlotBasedEnv(backend={self.env.backend!r})"
+
+
+async def gather_create(configs):
+    """
+    Build several environments concurrently. Each environment writes its SUMO configuration file on
+    reset, so like the workers of VectorSlotEnv they need distinct "sumo_config" paths.
+
+    Args:
+        configs (List[dict]): SlotBasedEnv configuration of each environment.
+
+    Returns:
+        List[AsyncSlotBasedEnv]: The new environments, in order.
+    """
+    sumo_configs = [config.get("sumo_config", default_config["sumo_config"]) for config in configs]
+    if len(set(sumo_configs)) != len(sumo_configs):
+        raise ValueError(f"Concurrent environments must not share a sumo_config file, got {sumo_configs}")
+    return await asyncio.gather(*(AsyncSlotBasedEnv.create(config) for config in configs))
+
+
+async def gather_reset(envs):
+    """
+    Reset several environments concurrently.
+
+    Args:
+        envs (List[AsyncSlotBasedEnv]): Environments to reset.
+
+    Returns:
+        List[Tuple]: (observation, info) of each environment, in order.
+    """
+    return await asyncio.gather(*(env.reset() for env in envs))
+
+
+async def gather_step(envs, actions):
+    """
+    Step several environments concurrently and wait for all of them.
+
+    Args:
+        envs (List[AsyncSlotBasedEnv]): Environments to step.
+        actions (List): Actions in the SlotBasedEnv.step format, one entry per environment.
+
+    Returns:
+        List[Tuple]: (observation, reward, done, info) of each environment, in order.
+    """
+    if len(actions) != len(envs):
+        raise ValueError(f"Expected {len(envs)} action sets, got {len(actions)}")
+    return await asyncio.gather(*(env.step(env_actions) for env, env_actions in zip(envs, actions)))
+
+
+async def gather_close(envs):
+    """
+    Close several environments concurrently.
+
+    Args:
+        envs (List[AsyncSlotBasedEnv]): Environments to close.
+    """
+    await asyncio.gather(*(env.close() for env in envs))
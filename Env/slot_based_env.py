@@ -1,11 +1,12 @@
 import gym
 import numpy as np
-import traci
 import os
 import sys
 import time
 import math
 import random
+import itertools
+from concurrent.futures import ThreadPoolExecutor
 
 # Add the project root directory to sys.path
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -17,10 +18,40 @@ from Controller.vehicle_controller import VehicleController
 from Controller.vehicle_generator import VehicleGenerator
 from Controller.slot_generator import SlotGenerator
 from Controller.merge_controller import MergeController
+from Controller.command_buffer import CommandBuffer
+from Controller.slot_renderer import SlotRenderer
+from Entity.registry import SimulationRegistry
 from Sumo.sumo_netxml_parser import NetXMLParser
 from Sumo.sumo_routexml_parser import RouteXMLParser
 from Config.config import default_config
 from Tools.utils import generate_temp_cfg
+from Backend.factory import create_backend
+from Env.world_snapshot import WorldSnapshot
+
+_connection_ids = itertools.count()  # Numbers the TraCI connection labels of the environments in this process
+
+# Environment attributes frozen by take_snapshot(), next to the slot state of every FullLane
+WORLD_ATTRIBUTES = ("time_step", "registry", "slot_generator", "slot_controller", "vehicle_generator",
+                    "rendered_vehicles", "vehicle_list", "command_buffer", "vehicle_controller",
+                    "merge_controller", "ramp_to_fulllane_map")
+
+
+def load_snapshots(directory):
+    """
+    Load the warm-start snapshots written by Tools/warm_start.py.
+
+    Args:
+        directory (str or None): Snapshot directory. None disables warm starts.
+
+    Returns:
+        List[WorldSnapshot]: Snapshots sorted by file name, empty if directory is None.
+    """
+    if directory is None:
+        return []
+    files = sorted(f for f in os.listdir(directory) if f.endswith(".pkl"))
+    if not files:
+        raise FileNotFoundError(f"No warm-start snapshots in {directory}")
+    return [WorldSnapshot.load(os.path.join(directory, f)) for f in files]
 
 
 class SlotBasedEnv(gym.Env):
@@ -31,69 +62,169 @@ class SlotBasedEnv(gym.Env):
         self.max_steps = config.get("max_steps", 1000)
         self.gui = config.get("use_gui", True)
         self.time_step = 0
+        self.episode_start_step = 0  # time_step at which the current episode started
+        self.spawn_interval = config.get("vehicle_spawn_rate", 30)  # Add a vehicle every this many steps
 
         # Road network and route analysis
-        net_parser = NetXMLParser(config.get("net_file", "Sim/test.net.xml"))
+        net_parser = NetXMLParser(config.get("net_file", "Sim/test.net.xml"),
+                                  cache_dir=config.get("net_cache_dir"))  # Compiled once, then loaded from cache
         self.full_lanes = net_parser.build_full_lanes()
         self.lane_dict = net_parser.lane_dict
 
         route_parser = RouteXMLParser(config.get("route_file", "Sim/test.rou.xml"))
         self.routes = route_parser.get_routes()
         self.route_groups = route_parser.get_route_groups()
+        self.route_group_index = route_parser.get_route_group_index()
         self.default_vtype = route_parser.get_default_vehicle_type()
 
+        # Simulator backend: "traci", "libsumo", "inmemory", "kinematic" or "auto" (fastest available).
+        # Each environment gets its own labeled TraCI connection, so several can share a process
+        self.connection_label = config.get("connection_label") or f"slot_env_{next(_connection_ids)}"
+        self.backend = create_backend(config.get("backend", "auto"), gui=self.gui,
+                                      net_file=config.get("net_file", "Sim/test.net.xml"),
+                                      route_file=config.get("route_file", "Sim/test.rou.xml"),
+                                      label=self.connection_label, cache_dir=config.get("net_cache_dir"))
+
         self.sumo_running = False
 
+        # Pipelined step: run flush + simulationStep on a helper thread while the slots advance.
+        # Pays off with the socket-based TraCI backend, whose round trips release the GIL.
+        # The thread is started by the first step and shut down by close()
+        self.pipelined_step = config.get("pipelined_step", False)
+        self.step_executor = None
+
+        # Warm reset: keep SUMO running and restore the state saved after the first reset instead of restarting
+        self.warm_reset = config.get("warm_reset", False)
+        self.reset_snapshot = None
+        self.reset_state_file = os.path.abspath(
+            f"{os.path.splitext(self.sumo_config)[0]}_{self.connection_label}_reset_state.xml")
+
+        # Warm start: episodes begin from one of the steady-state snapshots written by Tools/warm_start.py
+        self.warm_start_snapshots = load_snapshots(config.get("warm_start_dir"))
+
     def _start_sumo(self):
         if not self.sumo_running:
-            generate_temp_cfg()
+            generate_temp_cfg(cfg_path=self.sumo_config)
             sumo_binary = "sumo-gui" if self.gui else "sumo"
             sumo_cmd = [sumo_binary, "-c", self.sumo_config]
-            traci.start(sumo_cmd)
+            self.backend.start(sumo_cmd)
             self.sumo_running = True
 
     def reset(self):
+        if self.warm_start_snapshots:
+            snapshot = random.choice(self.warm_start_snapshots)
+        elif self.warm_reset:
+            snapshot = self.reset_snapshot
+        else:
+            snapshot = None
+        if snapshot is not None and self.sumo_running:
+            self.restore_snapshot(snapshot)
+            return self._get_observation(), {}
+
         if self.sumo_running:
-            traci.close()
+            self.backend.close()
             self.sumo_running = False
             time.sleep(0.2)
         self._start_sumo()
-        traci.simulationStep()
+        self.backend.simulationStep()
 
         self.time_step = 0
+        self.episode_start_step = 0
 
-        self.slot_generator = SlotGenerator()
+        self.registry = SimulationRegistry()
+        self.slot_generator = SlotGenerator(registry=self.registry)
         self.slot_generator.generate_slots_for_all_full_lanes(self.full_lanes)
         self.slot_controller = SlotController(self.slot_generator, self.full_lanes)
 
-        self.vehicle_generator = VehicleGenerator(self.routes, self.default_vtype)
-        self.rendered_slots = set()
+        self.vehicle_generator = VehicleGenerator(self.routes, self.default_vtype, registry=self.registry)
         self.rendered_vehicles = set()
         self.vehicle_list = []
 
-        for fl in self.full_lanes:
-            for slot in fl.slots:
-                if slot.center:
-                    x, y = slot.center
-                    try:
-                        traci.poi.add(slot.id, x, y, color=(255, 0, 0), layer=5)
-                        traci.poi.setParameter(slot.id, "label", slot.id)
-                        self.rendered_slots.add(slot.id)
-                    except:
-                        pass
-
-        self.vehicle_controller = VehicleController(self.vehicle_list, self.route_groups)
+        # Slot POIs are only drawn in sumo-gui; headless runs skip rendering entirely
+        self.renderer = SlotRenderer(enabled=self.gui,
+                                     frame_interval=self.config.get("render_frame_interval"),
+                                     position_tolerance=self.config.get("render_position_tolerance"),
+                                     backend=self.backend)
+        self.renderer.draw(self.full_lanes)
+
+        self.command_buffer = CommandBuffer(backend=self.backend)
+        self.vehicle_controller = VehicleController(self.vehicle_list, self.route_groups, registry=self.registry,
+                                                    command_buffer=self.command_buffer, backend=self.backend,
+                                                    route_group_index=self.route_group_index)
         self.ramp_to_fulllane_map = {
             "on_ramp1": "e2_0",
             "-on_ramp1": "-e6_0"
         }
-        self.merge_controller = MergeController(self.full_lanes, self.ramp_to_fulllane_map, safety_gap=5.0)
+        self.merge_controller = MergeController(self.full_lanes, self.ramp_to_fulllane_map, safety_gap=5.0,
+                                                backend=self.backend)
         self.slot_list = [slot for fl in self.full_lanes for slot in fl.slots]
 
+        if self.warm_start_snapshots:
+            self.restore_snapshot(snapshot)
+        elif self.warm_reset:
+            self.reset_snapshot = self.take_snapshot(self.reset_state_file)
+
         observation = self._get_observation()
         info = {}
         return observation, info
 
+    def _shared_objects(self):
+        # Objects a snapshot refers to by key: network, routes and backend are never copied
+        shared = {
+            ("backend",): self.backend,
+            ("full_lanes",): self.full_lanes,
+            ("routes",): self.routes,
+            ("route_groups",): self.route_groups,
+            ("route_group_index",): self.route_group_index,
+            ("vehicle_type",): self.default_vtype,
+        }
+        shared.update({("full_lane", index): fl for index, fl in enumerate(self.full_lanes)})
+        shared.update({("lane", lane_id): lane for lane_id, lane in self.lane_dict.items()})
+        shared.update({("route", route_id): route for route_id, route in self.routes.items()})
+        return shared
+
+    def take_snapshot(self, state_file):
+        """
+        Save the simulator state and freeze the matching Python-side state (slots, registry, generators,
+        controllers), so that restore_snapshot() can return to this instant without restarting SUMO.
+
+        Args:
+            state_file (str): Path the simulator state is written to.
+
+        Returns:
+            WorldSnapshot: The snapshot.
+        """
+        self.backend.simulation.saveState(state_file)
+        world = {name: getattr(self, name) for name in WORLD_ATTRIBUTES}
+        world["full_lane_slots"] = [(fl.slot_store, fl.slots, fl.slot_index) for fl in self.full_lanes]
+        return WorldSnapshot(world, self._shared_objects(), state_file=state_file, time_step=self.time_step)
+
+    def restore_snapshot(self, snapshot):
+        """
+        Return to a snapshot: reload the simulator state with simulation.loadState and rebuild
+        the Python-side state from the snapshot. POIs survive loadState, so the renderer only
+        sends the difference.
+
+        Args:
+            snapshot (WorldSnapshot): Snapshot taken by take_snapshot() of an environment built from the same files.
+        """
+        self.backend.simulation.loadState(snapshot.state_file)
+        world = snapshot.restore(self._shared_objects())
+        for fl, (store, slots, slot_index) in zip(self.full_lanes, world.pop("full_lane_slots")):
+            fl.slot_store, fl.slots, fl.slot_index = store, slots, slot_index
+        for name, value in world.items():
+            setattr(self, name, value)
+        self.episode_start_step = self.time_step
+        self.slot_list = [slot for fl in self.full_lanes for slot in fl.slots]
+
+        # loadState drops subscriptions, set speeds and the control modes chosen at insertion
+        self.vehicle_controller.reattach()
+        for vehicle in self.vehicle_list:
+            if self.registry.is_active(vehicle.id):
+                self.backend.vehicle.setLaneChangeMode(vehicle.id, 256)
+                self.backend.vehicle.setSpeedMode(vehicle.id, 0)
+        self.renderer.draw(self.full_lanes)
+
     def step(self, actions=[]):
         #  Determine multi-agent mode
         if self.config.get("multi-agent", False):
@@ -111,41 +242,25 @@ class SlotBasedEnv(gym.Env):
                         self.vehicle_controller.execute_slot_action(slot, action_type)
 
         # Env Step()
-        traci.simulationStep()
-        removed = self.slot_controller.step()
+        if self.pipelined_step:
+            if self.step_executor is None:
+                self.step_executor = ThreadPoolExecutor(max_workers=1)
+            # Pipelined: SUMO computes the step while the slots advance and the observation layout is built
+            # (slot motion only depends on time); join before reading vehicle state
+            simulation = self.step_executor.submit(self._advance_simulation)
+            scaffold = self._advance_slots()
+            simulation.result()
+        else:
+            self._advance_simulation()
+            scaffold = self._advance_slots()
         self.vehicle_controller.step()
         self.merge_controller.step(self.vehicle_list)
 
-        # Update self.slot_list
-        self.slot_list = [slot for fl in self.full_lanes for slot in fl.slots]
+        # Slot visualization: new, moved and removed slots, once per render frame
+        self.renderer.update(self.full_lanes)
 
-        # slot visualization
-        for fl in self.full_lanes:
-            for slot in fl.slots:
-                if slot.center:
-                    if slot.id in self.rendered_slots:
-                        try:
-                            traci.poi.setPosition(slot.id, *slot.center)
-                        except:
-                            pass
-                    else:
-                        try:
-                            traci.poi.add(slot.id, *slot.center, color=(255, 0, 0), layer=5)
-                            traci.poi.setParameter(slot.id, "label", slot.id)
-                            self.rendered_slots.add(slot.id)
-                        except:
-                            pass
-
-        # slot removal
-        for old_slot, _ in removed:
-            try:
-                traci.poi.remove(old_slot.id)
-                self.rendered_slots.discard(old_slot.id)
-            except:
-                pass
-
-        # Added a vehicle per 30 steps
-        if self.time_step % 30 == 0:
+        # Added a vehicle per spawn interval
+        if self.time_step % self.spawn_interval == 0:
             selected_route = self.vehicle_generator.select_random_route()
             entry_edge = selected_route.edges[0]
             candidate_lanes = [lane for lane in self.lane_dict.values() if lane.id.startswith(entry_edge + "_")]
@@ -170,7 +285,7 @@ class SlotBasedEnv(gym.Env):
                 try:
                     if vehicle.current_slot:
                         slot = vehicle.current_slot
-                        traci.vehicle.add(
+                        self.backend.vehicle.add(
                             vehID=vehicle.id,
                             routeID=vehicle.route.id,
                             typeID=vehicle.vehicle_type.id,
@@ -178,9 +293,12 @@ class SlotBasedEnv(gym.Env):
                             departSpeed=str(slot.speed),
                             departLane=slot.lane.id.split("_")[-1]
                         )
-                        traci.vehicle.setLaneChangeMode(vehicle.id, 256)
-                        traci.vehicle.setSpeedMode(vehicle.id, 0)
-                        traci.vehicle.setSpeed(vehicle.id, vehicle.speed)
+                        # Subscribe before moveToXY: SUMO drops the connection if the road ID is
+                        # subscribed while a moveToXY placement is still pending
+                        self.vehicle_controller.subscribe_vehicle(vehicle.id)
+                        self.backend.vehicle.setLaneChangeMode(vehicle.id, 256)
+                        self.backend.vehicle.setSpeedMode(vehicle.id, 0)
+                        self.command_buffer.set_speed(vehicle.id, vehicle.speed)
 
                         heading_rad = math.radians(slot.heading)
                         x_center, y_center = slot.center
@@ -189,10 +307,10 @@ class SlotBasedEnv(gym.Env):
                         y_front = y_center + (vehicle_length / 2.0) * math.sin(heading_rad)
                         edge_id = slot.lane.id.rsplit("_", 1)[0]
                         lane_index = int(slot.lane.id.rsplit("_", 1)[-1])
-                        traci.vehicle.moveToXY(vehicle.id, edgeID=edge_id, laneIndex=lane_index,
-                                            x=x_front, y=y_front, angle=slot.heading, keepRoute=1)
+                        self.command_buffer.move_to_xy(vehicle.id, edge_id=edge_id, lane_index=lane_index,
+                                                       x=x_front, y=y_front, angle=slot.heading, keep_route=1)
                     else:
-                        traci.vehicle.add(
+                        self.backend.vehicle.add(
                             vehID=vehicle.id,
                             routeID=vehicle.route.id,
                             typeID=vehicle.vehicle_type.id,
@@ -200,59 +318,101 @@ class SlotBasedEnv(gym.Env):
                             departSpeed="0",
                             departPos="0"
                         )
-                        traci.vehicle.setLaneChangeMode(vehicle.id, 256)
-                        traci.vehicle.setSpeedMode(vehicle.id, 0)
+                        self.vehicle_controller.subscribe_vehicle(vehicle.id)
+                        self.backend.vehicle.setLaneChangeMode(vehicle.id, 256)
+                        self.backend.vehicle.setSpeedMode(vehicle.id, 0)
 
                     self.rendered_vehicles.add(vehicle.id)
                     self.vehicle_list.append(vehicle)
                     print(f"[ADD VEH] {vehicle.id} Added successfully, assigned route {selected_route.id}")
                 except Exception as e:
+                    self.registry.remove_vehicle(vehicle.id)
                     print(f"[WARN] Adding {vehicle.id} failed: {e}")
 
         self.time_step += 1
 
-        observation = self._get_observation()
+        observation = self._finish_observation(scaffold)
         reward = self._get_reward()
-        done = self.time_step >= self.max_steps
-        info = {}
+        done = self.time_step - self.episode_start_step >= self.max_steps
+        info = {
+            "slot_pool": self.slot_controller.get_pool_metrics(),
+            "commands": self.command_buffer.get_metrics(),
+            "render": self.renderer.get_metrics(),
+        }
 
         return observation, reward, done, info
 
-    def _get_observation(self):
-        all_slot_data = []
-
-        for idx, slot in enumerate(self.slot_list):
-            if slot.center is None:
-                continue
-            x, y = slot.center
-            controllable = 1.0 if slot.occupied and not slot.busy else 0.0
-            all_slot_data.append([idx, x, y, controllable])
+    def _advance_simulation(self):
+        # Send the coalesced setSpeed/changeLane/moveToXY commands of this step, then advance SUMO
+        self.command_buffer.flush()
+        self.backend.simulationStep()
 
-        obs_array = np.array(all_slot_data, dtype=np.float32)
+    def _advance_slots(self):
+        # Slot motion and the observation layout do not depend on SUMO state
+        self.slot_controller.step()
+        self.slot_list = [slot for fl in self.full_lanes for slot in fl.slots]
+        return self._build_observation_scaffold()
+
+    def _build_observation_scaffold(self):
+        # Slot index and center columns, read straight from each FullLane's SlotStore in self.slot_list order;
+        # the controllable flag is filled in by _finish_observation once the controllers have run
+        lane_rows = []
+        lane_blocks = []
+        offset = 0
+        for fl in self.full_lanes:
+            store = fl.slot_store
+            rows = np.fromiter((slot.row for slot in fl.slots), dtype=np.int64, count=len(fl.slots))
+            block = np.empty((len(rows), 4), dtype=np.float32)
+            block[:, 0] = np.arange(offset, offset + len(rows))
+            block[:, 1] = store.center_x[rows]
+            block[:, 2] = store.center_y[rows]
+            lane_rows.append(rows)
+            lane_blocks.append(block)
+            offset += len(rows)
+
+        obs_array = np.concatenate(lane_blocks) if lane_blocks else np.empty((0, 4), dtype=np.float32)
 
         # Determine whether it is multi-agent mode
+        agent_masks = None
         if self.config.get("multi-agent", False):
-            agent_obs = {}
+            agent_masks = {}
             zones = self.config.get("agent_zones", {})
             for agent_id, zone in zones.items():
                 xmin, xmax = zone["xmin"], zone["xmax"]
                 ymin, ymax = zone["ymin"], zone["ymax"]
-                agent_slot_data = obs_array[
-                    (obs_array[:, 1] >= xmin) & (obs_array[:, 1] < xmax) &
-                    (obs_array[:, 2] >= ymin) & (obs_array[:, 2] < ymax)
-                ]
-                agent_obs[agent_id] = agent_slot_data
-            return agent_obs
+                agent_masks[agent_id] = ((obs_array[:, 1] >= xmin) & (obs_array[:, 1] < xmax) &
+                                         (obs_array[:, 2] >= ymin) & (obs_array[:, 2] < ymax))
+        return obs_array, lane_rows, agent_masks
+
+    def _finish_observation(self, scaffold):
+        obs_array, lane_rows, agent_masks = scaffold
+        offset = 0
+        for fl, rows in zip(self.full_lanes, lane_rows):
+            store = fl.slot_store
+            obs_array[offset:offset + len(rows), 3] = store.occupied[rows] & ~store.busy[rows]  # Controllable flag
+            offset += len(rows)
+
+        if agent_masks is not None:
+            return {agent_id: obs_array[mask] for agent_id, mask in agent_masks.items()}
         else:
             return obs_array
 
+    def _get_observation(self):
+        return self._finish_observation(self._build_observation_scaffold())
+
     def _get_reward(self):
         return 0.0
 
     def close(self):
         if self.sumo_running:
-            traci.close()
+            self.backend.close()
             self.sumo_running = False
+        if self.step_executor is not None:
+            self.step_executor.shutdown(wait=True)
+            self.step_executor = None
+        self.reset_snapshot = None  # The next reset starts the simulation from scratch
+        if os.path.exists(self.reset_state_file):
+            os.remove(self.reset_state_file)
 
     def render(self, mode='human'):
         pass
@@ -0,0 +1,295 @@
+import multiprocessing as mp
+import numpy as np
+import os
+import sys
+import random
+import traceback
+
+# Add the project root directory to sys.path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, ".."))
+sys.path.append(project_root)
+
+from Config.config import default_config
+
+OBS_FEATURES = 4  # Columns of a slot observation row: slot index, center x, center y, controllable flag
+
+
+class SharedBuffers:
+    def __init__(self, num_envs, num_agents, max_slots, context, arrays=None):
+        """
+        Observation, reward and done arrays shared by the vector env and its workers.
+        Workers write their results in place; only small command tuples travel over the pipes.
+
+        Args:
+            num_envs (int): Number of environments.
+            num_agents (int): Observation blocks per environment (1 in single-agent mode).
+            max_slots (int): Maximum slot rows per observation block; longer observations are truncated.
+            context (multiprocessing.context.BaseContext): Context used to allocate the shared arrays.
+            arrays (tuple, optional): Existing raw arrays to attach to (used inside the workers).
+        """
+        self.num_envs = num_envs
+        self.num_agents = num_agents
+        self.max_slots = max_slots
+        if arrays is None:
+            arrays = (context.RawArray("f", num_envs * num_agents * max_slots * OBS_FEATURES),
+                      context.RawArray("i", num_envs * num_agents),
+                      context.RawArray("f", num_envs),
+                      context.RawArray("b", num_envs))
+        self.arrays = arrays
+        self.observations = np.frombuffer(arrays[0], dtype=np.float32).reshape(
+            num_envs, num_agents, max_slots, OBS_FEATURES)                             # Padded slot rows
+        self.counts = np.frombuffer(arrays[1], dtype=np.int32).reshape(num_envs, num_agents)  # Valid rows per block
+        self.rewards = np.frombuffer(arrays[2], dtype=np.float32)                      # Reward of the last step
+        self.dones = np.frombuffer(arrays[3], dtype=np.int8)                           # Done flag of the last step
+
+    def write_observation(self, env_index, agent_ids, observation):
+        """
+        Copy one environment observation into its padded block.
+
+        Args:
+            env_index (int): Index of the environment.
+            agent_ids (List[str]): Agent IDs in block order, or [None] in single-agent mode.
+            observation (dict or np.ndarray): Observation returned by SlotBasedEnv.
+
+        Returns:
+            int: Number of rows dropped because a block exceeded max_slots.
+        """
+        dropped = 0
+        for agent_index, agent_id in enumerate(agent_ids):
+            rows = observation if agent_id is None else observation[agent_id]
+            count = min(len(rows), self.max_slots)
+            dropped += len(rows) - count
+            self.observations[env_index, agent_index, :count] = rows[:count]
+            self.counts[env_index, agent_index] = count
+        return dropped
+
+    def read_observation(self, env_index, agent_ids):
+        """
+        Returns:
+            dict or np.ndarray: Views on the valid rows of one environment, in the SlotBasedEnv format.
+        """
+        blocks = [self.observations[env_index, agent_index, :self.counts[env_index, agent_index]]
+                  for agent_index in range(len(agent_ids))]
+        if agent_ids == [None]:
+            return blocks[0]
+        return dict(zip(agent_ids, blocks))
+
+
+def _worker(env_index, config, agent_ids, buffer_shape, arrays, pipe, parent_pipe, auto_reset, seed):
+    """
+    Worker process: owns one SlotBasedEnv with its own simulator connection and serves commands
+    received on the pipe until "close".
+    """
+    parent_pipe.close()
+    from Env.slot_based_env import SlotBasedEnv
+
+    buffers = SharedBuffers(*buffer_shape, context=None, arrays=arrays)
+    env = None
+    try:
+        if seed is not None:
+            random.seed(seed + env_index)
+            np.random.seed(seed + env_index)
+        env = SlotBasedEnv(config)
+        while True:
+            command, data = pipe.recv()
+            if command == "step":
+                observation, reward, done, info = env.step(data)
+                if done and auto_reset:
+                    info["episode_done"] = True
+                    observation, _ = env.reset()
+                info["dropped_rows"] = buffers.write_observation(env_index, agent_ids, observation)
+                buffers.rewards[env_index] = reward
+                buffers.dones[env_index] = done
+                pipe.send(("ok", info))
+            elif command == "reset":
+                observation, info = env.reset()
+                info["dropped_rows"] = buffers.write_observation(env_index, agent_ids, observation)
+                buffers.rewards[env_index] = 0.0
+                buffers.dones[env_index] = False
+                pipe.send(("ok", info))
+            elif command == "close":
+                pipe.send(("ok", None))
+                break
+            else:
+                raise ValueError(f"Unknown command '{command}'")
+    except (KeyboardInterrupt, EOFError):
+        pass
+    except Exception:
+        pipe.send(("error", traceback.format_exc()))
+    finally:
+        if env is not None:
+            env.close()
+        if os.path.exists(config["sumo_config"]):
+            os.remove(config["sumo_config"])  # Per-worker file generated by SlotBasedEnv
+        pipe.close()
+
+
+class VectorSlotEnv:
+    def __init__(self, config, num_envs=None, auto_reset=True, max_slots=None, start_method=None, seed=None):
+        """
+        Runs several SlotBasedEnv instances in parallel, one per worker process.
+
+        Every worker owns its simulator connection (TraCI's module-level connection and libsumo both
+        allow only one simulation per process) and a separate SUMO config file. Commands and the small
+        info dicts go over pipes; observations, rewards and dones are written by the workers into
+        shared-memory arrays, so observation arrays are never pickled.
+
+        Observations are padded to max_slots rows per agent. step() and reset() return per-environment
+        views in the SlotBasedEnv format (dict of agent arrays in multi-agent mode); the views are
+        overwritten by the next call, copy them to keep them. The padded arrays themselves are
+        available as observations/observation_counts for batched consumers.
+
+        Args:
+            config (dict): SlotBasedEnv configuration shared by all workers. GUI is forced off.
+            num_envs (int, optional): Number of worker environments. Defaults to config value.
+            auto_reset (bool, optional): Reset an environment inside its worker as soon as it is done;
+                the returned observation is then the first one of the new episode and the info dict
+                carries "episode_done". Defaults to True.
+            max_slots (int, optional): Rows per observation block. Defaults to config value.
+            start_method (str, optional): multiprocessing start method. Defaults to config value.
+            seed (int, optional): Base seed; worker i seeds random and numpy with seed + i.
+        """
+        self.num_envs = num_envs if num_envs is not None else config.get("vector_num_envs",
+                                                                         default_config["vector_num_envs"])
+        self.auto_reset = auto_reset
+        max_slots = max_slots if max_slots is not None else config.get("vector_max_slots",
+                                                                       default_config["vector_max_slots"])
+        if config.get("multi-agent", False):
+            self.agent_ids = list(config.get("agent_zones", {}))
+        else:
+            self.agent_ids = [None]
+
+        context = mp.get_context(start_method or config.get("vector_start_method",
+                                                             default_config["vector_start_method"]))
+        self.buffers = SharedBuffers(self.num_envs, len(self.agent_ids), max_slots, context)
+        self.observations = self.buffers.observations        # (num_envs, num_agents, max_slots, 4)
+        self.observation_counts = self.buffers.counts        # (num_envs, num_agents)
+
+        base_config = dict(config)
+        base_config["use_gui"] = False
+        sumo_config = base_config.get("sumo_config", default_config["sumo_config"])
+        stem, extension = os.path.splitext(sumo_config)
+
+        self.pipes = []
+        self.processes = []
+        self.waiting = False
+        self.closed = False
+        for env_index in range(self.num_envs):
+            worker_config = dict(base_config)
+            worker_config["sumo_config"] = f"{stem}_{env_index}{extension}"  # Workers must not share the file
+            parent_pipe, child_pipe = context.Pipe()
+            process = context.Process(
+                target=_worker,
+                args=(env_index, worker_config, self.agent_ids,
+                      (self.num_envs, len(self.agent_ids), max_slots), self.buffers.arrays,
+                      child_pipe, parent_pipe, auto_reset, seed),
+                daemon=True)
+            process.start()
+            child_pipe.close()
+            self.pipes.append(parent_pipe)
+            self.processes.append(process)
+
+    def _receive(self):
+        """
+        Collect one reply from every worker.
+
+        Returns:
+            List[dict]: The info dict of each environment.
+
+        Raises:
+            RuntimeError: If a worker failed; the worker traceback is included.
+        """
+        infos = []
+        errors = []
+        for env_index, pipe in enumerate(self.pipes):
+            status, payload = pipe.recv()
+            if status == "error":
+                errors.append(f"[worker {env_index}]\n{payload}")
+            infos.append(payload)
+        if errors:
+            raise RuntimeError("VectorSlotEnv worker failed:\n" + "\n".join(errors))
+        return infos
+
+    def _observations(self):
+        return [self.buffers.read_observation(env_index, self.agent_ids) for env_index in range(self.num_envs)]
+
+    def reset(self):
+        """
+        Reset every environment.
+
+        Returns:
+            Tuple[List, List[dict]]: Observation views and info dicts, one per environment.
+        """
+        for pipe in self.pipes:
+            pipe.send(("reset", None))
+        infos = self._receive()
+        return self._observations(), infos
+
+    def step_async(self, actions):
+        """
+        Send one action set per environment without waiting for the results.
+
+        Args:
+            actions (List): Actions in the SlotBasedEnv.step format, one entry per environment.
+        """
+        if len(actions) != self.num_envs:
+            raise ValueError(f"Expected {self.num_envs} action sets, got {len(actions)}")
+        for pipe, env_actions in zip(self.pipes, actions):
+            pipe.send(("step", env_actions))
+        self.waiting = True
+
+    def step_wait(self):
+        """
+        Wait for the results of step_async().
+
+        Returns:
+            Tuple[List, np.ndarray, np.ndarray, List[dict]]: Observation views, rewards, dones and
+            info dicts. Rewards and dones are copies.
+        """
+        infos = self._receive()
+        self.waiting = False
+        return self._observations(), self.buffers.rewards.copy(), self.buffers.dones.astype(bool), infos
+
+    def step(self, actions):
+        """
+        Step every environment in parallel.
+
+        Args:
+            actions (List): Actions in the SlotBasedEnv.step format, one entry per environment.
+
+        Returns:
+            Tuple[List, np.ndarray, np.ndarray, List[dict]]: Observations, rewards, dones and infos.
+        """
+        self.step_async(actions)
+        return self.step_wait()
+
+    def close(self):
+        """
+        Stop every worker and its simulation.
+        """
+        if self.closed:
+            return
+        if self.waiting:
+            try:
+                self._receive()
+            except (RuntimeError, EOFError):
+                pass
+        for pipe in self.pipes:
+            try:
+                pipe.send(("close", None))
+                pipe.recv()
+            except (BrokenPipeError, EOFError):
+                pass
+            pipe.close()
+        for process in self.processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        self.closed = True
+
+    def __len__(self):
+        return self.num_envs
+
+    def __repr__(self):
+        return f"VectorSlotEnv(num_envs={self.num_envs}, agents={len(self.agent_ids)}, closed={self.closed})"
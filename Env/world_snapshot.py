@@ -0,0 +1,96 @@
+import io
+import os
+import pickle
+
+
+class _SharedObjectPickler(pickle.Pickler):
+    def __init__(self, file, shared_ids):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.shared_ids = shared_ids  # id(object) → key
+
+    def persistent_id(self, obj):
+        return self.shared_ids.get(id(obj))
+
+
+class _SharedObjectUnpickler(pickle.Unpickler):
+    def __init__(self, file, shared_objects):
+        super().__init__(file)
+        self.shared_objects = shared_objects  # key → object
+
+    def persistent_load(self, key):
+        try:
+            return self.shared_objects[key]
+        except KeyError:
+            raise pickle.UnpicklingError(f"Snapshot refers to unknown shared object {key!r}")
+
+
+class WorldSnapshot:
+    def __init__(self, world, shared_objects, state_file=None, time_step=0):
+        """
+        Frozen copy of the Python-side state of an environment (slots, registry, generators, controllers),
+        paired with the simulator state file saved at the same instant.
+
+        The world is pickled once. Objects listed in shared_objects (network geometry, routes, the backend)
+        are stored as references by key instead of by value, so restoring never copies them and
+        the restored slots and vehicles point at the live network objects again. Keys are plain tuples,
+        so a snapshot can be restored by another environment built from the same files.
+
+        Args:
+            world (dict): Name → object, the state to freeze.
+            shared_objects (dict): Key → object kept by reference.
+            state_file (str, optional): Simulator state saved with simulation.saveState.
+            time_step (int, optional): Environment step at which the snapshot was taken.
+        """
+        self.state_file = state_file
+        self.time_step = time_step
+        buffer = io.BytesIO()
+        _SharedObjectPickler(buffer, {id(obj): key for key, obj in shared_objects.items()}).dump(world)
+        self.data = buffer.getvalue()
+
+    def restore(self, shared_objects):
+        """
+        Build a fresh copy of the frozen world; the snapshot itself stays unchanged.
+
+        Args:
+            shared_objects (dict): Key → live object for every key used when the snapshot was taken.
+
+        Returns:
+            dict: Name → restored object.
+        """
+        return _SharedObjectUnpickler(io.BytesIO(self.data), shared_objects).load()
+
+    def save(self, file_name):
+        """
+        Write the snapshot (without the simulator state file) to disk. The state file path is stored
+        relative to the snapshot, so a directory of snapshots and state files can be moved as a whole.
+
+        Args:
+            file_name (str): Destination path.
+        """
+        state_file = self.state_file
+        if state_file is not None:
+            self.state_file = os.path.relpath(os.path.abspath(state_file),
+                                              os.path.dirname(os.path.abspath(file_name)))
+        try:
+            with open(file_name, "wb") as f:
+                pickle.dump(self, f, protocol=pickle.HIGHEST_PROTOCOL)
+        finally:
+            self.state_file = state_file
+
+    @staticmethod
+    def load(file_name):
+        """
+        Args:
+            file_name (str): Path written by save().
+
+        Returns:
+            WorldSnapshot: The loaded snapshot.
+        """
+        with open(file_name, "rb") as f:
+            snapshot = pickle.load(f)
+        if snapshot.state_file is not None and not os.path.isabs(snapshot.state_file):
+            snapshot.state_file = os.path.join(os.path.dirname(os.path.abspath(file_name)), snapshot.state_file)
+        return snapshot
+
+    def __repr__(self):
+        return f"WorldSnapshot(time_step={self.time_step}, state_file={self.state_file}, size={len(self.data)})"
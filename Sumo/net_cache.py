@@ -0,0 +1,241 @@
+# Sumo/net_cache.py
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import numpy as np
+from Entity.lane import Lane
+from Entity.fulllane import FullLane
+
+CACHE_VERSION = 2  # Bump when the artifact layout or the FullLane construction changes
+
+
+def net_file_hash(file_path):
+    """
+    Args:
+        file_path (str): Path to the .net.xml file.
+
+    Returns:
+        str: SHA-256 hex digest of the file content.
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def get_cache_path(file_path, cache_dir):
+    """
+    Returns:
+        str: Artifact directory of a network, keyed by the content hash of its file.
+    """
+    return os.path.join(cache_dir, f"{net_file_hash(file_path)}_v{CACHE_VERSION}")
+
+
+def _offsets(lengths):
+    offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum(lengths)
+    return offsets
+
+
+def _ragged(rows, dtype, width=None):
+    # Concatenate variable-length rows into one array plus CSR offsets (row i is values[offsets[i]:offsets[i+1]])
+    offsets = _offsets([len(row) for row in rows])
+    shape = (int(offsets[-1]),) if width is None else (int(offsets[-1]), width)
+    values = np.fromiter((v for row in rows for item in row for v in (item if width else (item,))),
+                         dtype=dtype, count=int(np.prod(shape))).reshape(shape)
+    return values, offsets
+
+
+def write_compiled_network(path, file_path, lane_dict, full_lanes, successors):
+    """
+    Write the parsed network as a directory of .npy arrays plus a meta.json with the IDs.
+
+    The directory is written under a temporary name and renamed into place, so processes compiling
+    the same network at once never see a partial artifact; the first rename wins.
+
+    Args:
+        path (str): Artifact directory, see get_cache_path().
+        file_path (str): The .net.xml file the network was parsed from.
+        lane_dict (dict): Lane ID → Lane.
+        full_lanes (List[FullLane]): FullLanes returned by NetXMLParser.build_full_lanes().
+        successors (dict): Lane ID → successor lane IDs, from NetXMLParser.get_lane_connections().
+    """
+    lane_ids = list(lane_dict)
+    lane_number = {lane_id: i for i, lane_id in enumerate(lane_ids)}
+    full_lane_number = {fl: i for i, fl in enumerate(full_lanes)}
+    lanes = [lane_dict[lane_id] for lane_id in lane_ids]
+
+    arrays = {
+        "lane_index": np.array([lane.index for lane in lanes], dtype=np.int32),
+        "lane_speed": np.array([lane.speed for lane in lanes], dtype=np.float64),
+    }
+    arrays["lane_points"], arrays["lane_point_offsets"] = _ragged([lane.shape for lane in lanes], np.float64, 2)
+
+    # FullLane members and compiled geometry index
+    arrays["fl_lanes"], arrays["fl_lane_offsets"] = _ragged(
+        [[lane_number[lane.id] for lane in fl.lanes] for fl in full_lanes], np.int32)
+    arrays["fl_lane_starts"], _ = _ragged([fl.lane_start_indices for fl in full_lanes], np.int64)
+    arrays["fl_points"], arrays["fl_point_offsets"] = _ragged([fl.full_shape for fl in full_lanes], np.float64, 2)
+    arrays["fl_cumulative"], _ = _ragged([fl.cumulative_lengths for fl in full_lanes], np.float64)
+    arrays["fl_directions"], arrays["fl_segment_offsets"] = _ragged(
+        [fl.segment_directions for fl in full_lanes], np.float64, 2)
+    arrays["fl_headings"], _ = _ragged([fl.segment_headings for fl in full_lanes], np.float64)
+
+    # Neighbor relations, referring to FullLanes by position in full_lanes
+    for prefix, attribute in (("nfl", "neighbor_full_lanes"), ("ni", "neighbor_intervals")):
+        rows = [getattr(fl, attribute) for fl in full_lanes]
+        arrays[f"{prefix}_bounds"], arrays[f"{prefix}_offsets"] = _ragged(
+            [[(start, end) for start, end, _, _ in row] for row in rows], np.float64, 2)
+        arrays[f"{prefix}_neighbor"], _ = _ragged(
+            [[full_lane_number[neighbor] for _, _, neighbor, _ in row] for row in rows], np.int32)
+        arrays[f"{prefix}_direction"], _ = _ragged(
+            [[direction for _, _, _, direction in row] for row in rows], np.int8)
+
+    # Longitudinal maps, one (source, target) breakpoint pair per neighbor
+    maps = [(full_lane_number[neighbor], source, target)
+            for fl in full_lanes for neighbor, (source, target) in fl.longitudinal_maps.items()]
+    arrays["lm_neighbor"] = np.array([neighbor for neighbor, _, _ in maps], dtype=np.int32)
+    arrays["lm_offsets"] = _offsets([len(fl.longitudinal_maps) for fl in full_lanes])
+    arrays["lm_source"], arrays["lm_point_offsets"] = _ragged([source for _, source, _ in maps], np.float64)
+    arrays["lm_target"], _ = _ragged([target for _, _, target in maps], np.float64)
+
+    meta = {
+        "version": CACHE_VERSION,
+        "net_file": os.path.abspath(file_path),
+        "lane_ids": lane_ids,
+        "full_lane_start_ids": [fl.start_lane_id for fl in full_lanes],
+        "successors": successors,
+    }
+
+    parent = os.path.dirname(os.path.abspath(path))
+    os.makedirs(parent, exist_ok=True)
+    staging = tempfile.mkdtemp(dir=parent, prefix=".compiling_")
+    try:
+        for name, array in arrays.items():
+            np.save(os.path.join(staging, f"{name}.npy"), array)
+        with open(os.path.join(staging, "meta.json"), "w") as f:
+            json.dump(meta, f)
+        try:
+            os.rename(staging, path)
+        except OSError:
+            if not os.path.exists(os.path.join(path, "meta.json")):
+                raise  # Not a concurrent writer that finished first
+    finally:
+        if os.path.exists(staging):
+            shutil.rmtree(staging)
+    print(f"[INFO] Compiled network {file_path} → {path}")
+
+
+class CompiledNetwork:
+    def __init__(self, path):
+        """
+        Network loaded from an artifact written by write_compiled_network().
+
+        Arrays are memory-mapped read-only. The FullLane geometry arrays used by vectorized interpolation
+        stay views on the mapping, so processes loading the same network share those pages through the
+        OS file cache. The Python lists that lanes, scalar lookups, neighbor relations and longitudinal maps
+        work on are still built by every process; for them the cache saves parsing and recomputation,
+        not memory. Lanes are created once; build_full_lanes() assembles new FullLanes from the stored
+        geometry index without recomputing it.
+
+        Args:
+            path (str): Artifact directory.
+        """
+        self.path = path
+        with open(os.path.join(path, "meta.json")) as f:
+            self.meta = json.load(f)
+        self.arrays = {
+            file_name[:-4]: np.load(os.path.join(path, file_name), mmap_mode="r")
+            for file_name in os.listdir(path) if file_name.endswith(".npy")
+        }
+
+        points = self._points("lane_points")
+        offsets = self.arrays["lane_point_offsets"].tolist()
+        self.lane_dict = {}  # Lane ID → Lane
+        for i, (lane_id, index, speed) in enumerate(zip(self.meta["lane_ids"], self.arrays["lane_index"].tolist(),
+                                                        self.arrays["lane_speed"].tolist())):
+            self.lane_dict[lane_id] = Lane(id=lane_id, index=index, speed=speed,
+                                           shape=points[offsets[i]:offsets[i + 1]])
+
+    def _points(self, name):
+        return list(map(tuple, self.arrays[name].tolist()))
+
+    def get_lane_connections(self):
+        """
+        Returns:
+            dict: from_lane_id → list of to_lane_ids, as NetXMLParser.get_lane_connections().
+        """
+        return {lane_id: list(to_lane_ids) for lane_id, to_lane_ids in self.meta["successors"].items()}
+
+    def build_full_lanes(self):
+        """
+        Returns:
+            List[FullLane]: New FullLanes equal to NetXMLParser.build_full_lanes() of the source file.
+        """
+        a = self.arrays
+        lanes = [self.lane_dict[lane_id] for lane_id in self.meta["lane_ids"]]
+        lane_offsets = a["fl_lane_offsets"].tolist()
+        members = a["fl_lanes"].tolist()
+        lane_starts = a["fl_lane_starts"].tolist()
+        point_offsets = a["fl_point_offsets"].tolist()
+        segment_offsets = a["fl_segment_offsets"].tolist()
+        points = self._points("fl_points")
+        cumulative = a["fl_cumulative"].tolist()
+        directions = self._points("fl_directions")
+        headings = a["fl_headings"].tolist()
+        # Plain ndarray views on the mapping (no copy), shared with other processes loading the artifact
+        geometry_points, geometry_cumulative, geometry_directions, geometry_headings = (
+            np.asarray(a[name]) for name in ("fl_points", "fl_cumulative", "fl_directions", "fl_headings"))
+
+        full_lanes = [FullLane(start_lane_id=start_lane_id) for start_lane_id in self.meta["full_lane_start_ids"]]
+        for i, fl in enumerate(full_lanes):
+            l0, l1 = lane_offsets[i], lane_offsets[i + 1]
+            p0, p1 = point_offsets[i], point_offsets[i + 1]
+            s0, s1 = segment_offsets[i], segment_offsets[i + 1]
+            fl.restore_geometry([lanes[j] for j in members[l0:l1]], points[p0:p1], lane_starts[l0:l1],
+                                cumulative[p0:p1], directions[s0:s1], headings[s0:s1],
+                                geometry_arrays=(geometry_points[p0:p1], geometry_cumulative[p0:p1],
+                                                 geometry_directions[s0:s1], geometry_headings[s0:s1]))
+
+        for prefix, attribute in (("nfl", "neighbor_full_lanes"), ("ni", "neighbor_intervals")):
+            offsets = a[f"{prefix}_offsets"].tolist()
+            bounds = a[f"{prefix}_bounds"].tolist()
+            neighbors = a[f"{prefix}_neighbor"].tolist()
+            directions = a[f"{prefix}_direction"].tolist()
+            for i, fl in enumerate(full_lanes):
+                setattr(fl, attribute, [(bounds[k][0], bounds[k][1], full_lanes[neighbors[k]], directions[k])
+                                        for k in range(offsets[i], offsets[i + 1])])
+        for fl in full_lanes:
+            fl.build_neighbor_index()
+
+        map_offsets = a["lm_offsets"].tolist()
+        map_neighbors = a["lm_neighbor"].tolist()
+        breakpoints = a["lm_point_offsets"].tolist()
+        sources = a["lm_source"].tolist()
+        targets = a["lm_target"].tolist()
+        for i, fl in enumerate(full_lanes):
+            for k in range(map_offsets[i], map_offsets[i + 1]):
+                b0, b1 = breakpoints[k], breakpoints[k + 1]
+                fl.longitudinal_maps[full_lanes[map_neighbors[k]]] = (sources[b0:b1], targets[b0:b1])
+        return full_lanes
+
+    def __repr__(self):
+        return f"CompiledNetwork(path={self.path}, lanes={len(self.lane_dict)})"
+
+
+def load_compiled_network(path):
+    """
+    Args:
+        path (str): Artifact directory of the network, see get_cache_path().
+
+    Returns:
+        CompiledNetwork or None: The cached network, or None if the file was not compiled yet
+        (or by an older cache version).
+    """
+    if not os.path.exists(os.path.join(path, "meta.json")):
+        return None
+    return CompiledNetwork(path)
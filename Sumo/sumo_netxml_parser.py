@@ -2,51 +2,163 @@
 
 import xml.etree.ElementTree as ET
 from collections import defaultdict
+import numpy as np
 from Entity.lane import Lane
 from Entity.fulllane import FullLane
+from Sumo.net_cache import get_cache_path, load_compiled_network, write_compiled_network
+
+
+def decode_shapes(shapes):
+    """
+    Decode many SUMO shape strings ("x1,y1 x2,y2 ...", optionally with z coordinates) at once.
+    All strings are joined and converted to floats in a single call instead of splitting every point.
+
+    Args:
+        shapes (List[str]): Shape attributes as written by SUMO.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Array of shape (n, 2) with the x, y coordinates of all points,
+        and offsets such that shape i is points[offsets[i]:offsets[i + 1]].
+    """
+    shapes = [shape.strip() for shape in shapes]
+    point_counts = np.array([shape.count(" ") + 1 if shape else 0 for shape in shapes], dtype=np.int64)
+    comma_counts = np.array([shape.count(",") for shape in shapes], dtype=np.int64)
+    offsets = np.zeros(len(shapes) + 1, dtype=np.int64)
+    np.cumsum(point_counts, out=offsets[1:])
+
+    values = np.fromstring(" ".join(shapes).replace(",", " "), dtype=np.float64, sep=" ")
+    if len(values) != point_counts.sum() + comma_counts.sum():
+        # Irregular spacing or unreadable values: fall back to decoding shape by shape
+        points = [[tuple(map(float, pair.split(",")[:2])) for pair in shape.split()] for shape in shapes]
+        offsets[1:] = np.cumsum([len(shape) for shape in points])
+        return np.array([p for shape in points for p in shape], dtype=np.float64).reshape(-1, 2), offsets
+
+    dimensions = comma_counts // np.maximum(point_counts, 1) + 1  # 2 for "x,y", 3 for "x,y,z"
+    if (dimensions[point_counts > 0] == 2).all():
+        return values.reshape(-1, 2), offsets
+
+    # Shapes with z coordinates: keep x, y of every point
+    value_counts = point_counts * dimensions
+    first = (np.repeat(np.cumsum(value_counts) - value_counts, point_counts)
+             + (np.arange(offsets[-1]) - np.repeat(offsets[:-1], point_counts)) * np.repeat(dimensions, point_counts))
+    return np.stack([values[first], values[first + 1]], axis=1), offsets
+
+
+class _NetTarget:
+    """
+    XMLParser target collecting lane and connection attributes of a .net.xml file without building elements.
+    """
+
+    def __init__(self):
+        self.depth = 0         # Nesting depth of the current element, 1 for the <net> root
+        self.lanes = []        # (lane_id, index, speed) as strings
+        self.shapes = []       # Shape string of each lane
+        self.connections = []  # (from_edge, to_edge, from_lane, to_lane, via)
+
+    def start(self, tag, attrib):
+        self.depth += 1
+        if tag == "lane" and self.depth == 3:
+            self.lanes.append((attrib["id"], attrib["index"], attrib["speed"]))
+            self.shapes.append(attrib["shape"])
+        elif tag == "connection" and self.depth == 2:
+            self.connections.append((attrib.get("from"), attrib.get("to"), attrib.get("fromLane"),
+                                     attrib.get("toLane"), attrib.get("via")))
+
+    def end(self, tag):
+        self.depth -= 1
+
+    def close(self):
+        pass
+
 
 class NetXMLParser:
-    def __init__(self, file_path):
+    def __init__(self, file_path, cache_dir=None):
+        """
+        Args:
+            file_path (str): Path to the .net.xml file.
+            cache_dir (str, optional): Directory of compiled network artifacts (see Sumo/net_cache.py).
+                On the first use of a net file its parse result is compiled there; later parsers
+                load it instead of reading the XML. None always parses the XML.
+        """
         self.file_path = file_path
         self.lane_dict = {}       # Mapping from lane_id to Lane object
-        self.connections = []     # Not used in this version, reserved
-        self._parse_all_edges()   # Load all <edge> and <lane> elements
+        self.connections = []     # (from_edge, to_edge, from_lane, to_lane, via) of every <connection>
+        self.compiled = None      # CompiledNetwork serving the queries when a cache is used
+
+        if cache_dir is not None:
+            path = get_cache_path(file_path, cache_dir)  # Hashes the net file, once per parser
+            self.compiled = load_compiled_network(path)
+            if self.compiled is None:
+                self._compile(path)
+            self.lane_dict = self.compiled.lane_dict
+        else:
+            self._parse_all_edges()   # Load all <edge> and <lane> elements
+
+    def _compile(self, path):
+        """
+        Parse the XML and write the result to the artifact directory path, then serve it from there like a cache hit.
+        """
+        self._parse_all_edges()
+        write_compiled_network(path, self.file_path, self.lane_dict, self.build_full_lanes(),
+                               self.get_lane_connections())
+        self.compiled = load_compiled_network(path)
 
     def _parse_all_edges(self):
         """
-        Parse <edge> and <lane> tags from the .net.xml file,
-        and construct Lane objects stored in self.lane_dict.
+        Stream the .net.xml file once: construct Lane objects from <edge>/<lane> tags into self.lane_dict
+        and keep the attributes of <connection> tags in self.connections.
+
+        The file is fed in blocks to an XMLParser whose target only records the needed attributes, so no
+        element tree is built and memory follows the extracted data. Lane shapes are decoded together
+        by decode_shapes().
+        """
+        target = _NetTarget()
+        parser = ET.XMLParser(target=target)
+        with open(self.file_path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 16), b""):
+                parser.feed(block)
+        parser.close()
+        self.connections = target.connections
+
+        points, offsets = decode_shapes(target.shapes)
+        points = list(map(tuple, points.tolist()))
+        offsets = offsets.tolist()
+        for i, (lane_id, index, speed) in enumerate(target.lanes):
+            self.lane_dict[lane_id] = Lane(id=lane_id, index=int(index), speed=float(speed),
+                                           shape=points[offsets[i]:offsets[i + 1]])
+
+    def get_lane_connections(self):
+        """
+        Parse <connection> tags into lane-level successors, skipping internal junction lanes.
+
+        Returns:
+            dict: from_lane_id → list of to_lane_ids reachable through the junction.
         """
-        tree = ET.parse(self.file_path)
-        root = tree.getroot()
-
-        for edge in root.findall("edge"):
-            for lane_elem in edge.findall("lane"):
-                lane_id = lane_elem.get("id")
-                index = int(lane_elem.get("index"))
-                speed = float(lane_elem.get("speed"))
-                shape = lane_elem.get("shape")
-                lane = Lane(id=lane_id, index=index, speed=speed, shape=shape)
-                self.lane_dict[lane_id] = lane
+        if self.compiled is not None:
+            return self.compiled.get_lane_connections()
+        successors = defaultdict(list)
+        for from_edge, to_edge, from_lane, to_lane, _ in self.connections:
+            if not (from_edge and to_edge and from_lane is not None and to_lane is not None):
+                continue
+            from_lane_id = f"{from_edge}_{from_lane}"
+            to_lane_id = f"{to_edge}_{to_lane}"
+            if from_lane_id in self.lane_dict and to_lane_id in self.lane_dict \
+                    and not self.lane_dict[from_lane_id].is_internal and not from_edge.startswith(":"):
+                successors[from_lane_id].append(to_lane_id)
+        return dict(successors)
 
     def build_full_lanes(self):
         """
         Construct FullLane objects by following lane connection chains.
         Also builds neighbor FullLane relationships for lane-change support.
         """
-        tree = ET.parse(self.file_path)
-        root = tree.getroot()
+        if self.compiled is not None:
+            return self.compiled.build_full_lanes()
 
         lane_graph = defaultdict(list)     # lane_id → list of next_lane_ids
         incoming = defaultdict(set)        # lane_id → set of predecessor_lane_ids
 
-        for conn in root.findall("connection"):
-            from_edge = conn.get("from")
-            to_edge = conn.get("to")
-            via = conn.get("via")
-            from_lane = conn.get("fromLane")
-            to_lane = conn.get("toLane")
-
+        for from_edge, to_edge, from_lane, to_lane, via in self.connections:
             # Skip incomplete or irrelevant connections
             if not (from_edge and to_edge and via and from_lane is not None and to_lane is not None):
                 continue
@@ -107,9 +219,19 @@ class NetXMLParser:
                         end_x = lane.shape[-1][0]
                         full_lane.add_neighbor_full_lane(start_x, end_x, neighbor_full_lane, direction)
 
+                        start_s, end_s = full_lane.get_lane_interval(lane_id)
+                        full_lane.add_neighbor_interval(start_s, end_s, neighbor_full_lane, direction)
+
         # Merge overlapping or adjacent intervals with same neighbor and direction
         for full_lane in full_lanes:
             self._merge_neighbor_full_lanes(full_lane)
+            full_lane.build_neighbor_index()
+
+        # Precompute arc-length mappings between adjacent FullLanes for lane-change lookups
+        for full_lane in full_lanes:
+            for _, _, neighbor_full_lane, _ in full_lane.neighbor_full_lanes:
+                if neighbor_full_lane not in full_lane.longitudinal_maps:
+                    full_lane.build_longitudinal_mapping(neighbor_full_lane)
 
         return full_lanes
 
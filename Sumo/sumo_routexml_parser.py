@@ -1,70 +1,189 @@
 # Sumo/sumo_routexml_parser.py
 
+import heapq
+import math
+import sys
 import xml.etree.ElementTree as ET
+from operator import attrgetter
 from Entity.route import Route
 from Entity.vehicle import VehicleType
+from Entity.demand import Departure, Flow
 from collections import defaultdict
 
+
+def _route_group(route_id):
+    """
+    Group name and exit priority of a route named "route_<entry>_<exit>[_r]".
+
+    Returns:
+        Tuple[str, int] or None: e.g. ("main_forward", 1) for "route_main_offramp1"; offramp routes come
+        first (by number), main routes last. None for routes outside the naming scheme.
+    """
+    if not route_id.startswith("route_"):
+        return None
+    parts = route_id.split("_")
+    if len(parts) < 3:
+        return None  # Skip malformed route IDs
+
+    _, entry, exit = parts[:3]
+    direction = "reverse" if parts[-1] == "r" else "forward"
+    if exit.startswith("offramp"):
+        priority = int(exit.replace("offramp", ""))
+    elif exit == "main":
+        priority = 9999
+    else:
+        priority = 10000  # Other unknown exits at the end
+    return f"{entry}_{direction}", priority
+
+
+def _time(value, default):
+    if value is None:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        return math.inf  # "triggered" and similar: no departure by time
+
+
+class _RouteTarget:
+    """
+    XMLParser target handing the top-level elements of a route file to RouteXMLParser without building elements.
+    """
+
+    def __init__(self, parser):
+        self.parser = parser
+        self.depth = 0         # Nesting depth of the current element, 1 for the <routes> root
+        self.parent = None     # Tag of the current top-level element
+        self.pending = None    # [tag, attributes, embedded route edges] of an open <vehicle>, <trip> or <flow>
+
+    def start(self, tag, attrib):
+        self.depth += 1
+        if self.depth == 2:
+            self.parent = tag
+            if tag == "vType":
+                self.parser._add_vehicle_type(attrib)
+            elif tag == "route":
+                self.parser._add_route(attrib)
+            elif tag in ("vehicle", "trip", "flow"):
+                self.pending = [tag, attrib, None]
+        elif self.depth == 3 and tag == "route":
+            if self.pending is not None:
+                self.pending[2] = self.parser._edges(attrib.get("edges"))  # Route embedded in the vehicle
+            elif self.parent == "routeDistribution":
+                self.parser._add_route(attrib)
+
+    def end(self, tag):
+        if self.depth == 2 and self.pending is not None:
+            self.parser._add_demand(*self.pending)
+            self.pending = None
+        self.depth -= 1
+
+    def close(self):
+        pass
+
+
 class RouteXMLParser:
     def __init__(self, file_path: str):
+        """
+        Streaming reader of a SUMO route/demand file: vehicle types, routes, vehicles, trips and flows.
+
+        The file is read once in blocks without building an element tree. Edge lists are interned:
+        routes (named or embedded in vehicles) with the same edges share one tuple of interned edge IDs.
+        Flows are kept as parameters and expanded lazily, see Flow.departures() and iter_departures().
+
+        Args:
+            file_path (str): Path to the .rou.xml file.
+        """
         self.file_path = file_path
         self.routes: dict[str, Route] = {}                 # Route ID → Route object
         self.vehicle_types: dict[str, VehicleType] = {}    # VehicleType ID → VehicleType object
         self.route_groups: dict[str, list[str]] = {}       # Group name → list of route IDs
+        self.route_group_index: dict[str, tuple[str, int]] = {}  # Route ID → (group name, position in the group)
+        self.vehicles: list[Departure] = []                # <vehicle> and <trip> entries in file order
+        self.flows: list[Flow] = []                        # <flow> entries in file order
+        self._edge_sequences: dict[str, tuple] = {}        # edges attribute → shared tuple of interned edge IDs
+        self._group_members = defaultdict(list)            # Group name → [(exit priority, route ID)] in file order
 
         self._parse()
 
     def _parse(self):
-        tree = ET.parse(self.file_path)
-        root = tree.getroot()
-
-        # Parse vehicle types defined in <vType> tags
-        for vtype in root.findall("vType"):
-            id = vtype.get("id")
-            accel = float(vtype.get("accel", 2.6))
-            decel = float(vtype.get("decel", 4.5))
-            max_speed = float(vtype.get("maxSpeed", 27.78))
-            length = float(vtype.get("length", 5.0))
-            self.vehicle_types[id] = VehicleType(id, accel, decel, max_speed, length)
-
-        # Parse <route> definitions and group them by entry and direction
-        temp_groups = defaultdict(list)
-        for route in root.findall("route"):
-            route_id = route.get("id")
-            edges = route.get("edges", "").split()
-            self.routes[route_id] = Route(route_id, edges)
-
-            if not route_id.startswith("route_"):
-                continue
-
-            parts = route_id.split("_")
-            if len(parts) < 3:
-                continue  # Skip malformed route IDs
-
-            _, entry, exit = parts[:3]
-            is_reverse = parts[-1] == "r"
-
-            # Construct group name: e.g., main_forward, onramp1_reverse
-            direction = "reverse" if is_reverse else "forward"
-            group_name = f"{entry}_{direction}"
-            temp_groups[group_name].append((exit, route_id))
-
-        # Sort routes within each group by exit priority:
+        target = _RouteTarget(self)
+        parser = ET.XMLParser(target=target)
+        with open(self.file_path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 16), b""):
+                parser.feed(block)
+        parser.close()
+
+        # Sort routes within each group by exit priority (stable, so ties keep file order):
         # offramp routes first, main routes last
-        def sort_key(item):
-            exit_name, _ = item
-            if exit_name.startswith("offramp"):
-                return int(exit_name.replace("offramp", ""))
-            elif exit_name == "main":
-                return 9999
-            else:
-                return 10000  # Other unknown exits at the end
-
         self.route_groups = {
-            group: [route_id for _, route_id in sorted(items, key=sort_key)]
-            for group, items in temp_groups.items()
+            group: [route_id for _, route_id in sorted(members, key=lambda member: member[0])]
+            for group, members in self._group_members.items()
+        }
+        self.route_group_index = {
+            route_id: (group, position)
+            for group, route_ids in self.route_groups.items() for position, route_id in enumerate(route_ids)
         }
 
+    def _edges(self, edges):
+        sequence = self._edge_sequences.get(edges)
+        if sequence is None:
+            sequence = tuple(sys.intern(edge) for edge in (edges or "").split())
+            self._edge_sequences[edges] = sequence
+        return sequence
+
+    def _add_vehicle_type(self, attrib):
+        # Parse vehicle types defined in <vType> tags
+        id = attrib.get("id")
+        accel = float(attrib.get("accel", 2.6))
+        decel = float(attrib.get("decel", 4.5))
+        max_speed = float(attrib.get("maxSpeed", 27.78))
+        length = float(attrib.get("length", 5.0))
+        self.vehicle_types[id] = VehicleType(id, accel, decel, max_speed, length)
+
+    def _add_route(self, attrib):
+        # <route> definitions, grouped by entry and direction
+        route_id = attrib.get("id")
+        self.routes[route_id] = Route(route_id, self._edges(attrib.get("edges")))
+        group = _route_group(route_id)
+        if group is not None:
+            name, priority = group
+            self._group_members[name].append((priority, route_id))
+
+    def _add_demand(self, tag, attrib, embedded_edges):
+        vehicle_id = attrib.get("id")
+        route = None
+        if embedded_edges is not None:
+            route = Route(f"!{vehicle_id}", embedded_edges)  # SUMO's ID for routes embedded in a vehicle
+        elif attrib.get("route") is not None:
+            route = self.routes.get(attrib["route"])
+            if route is None:
+                print(f"[WARN] {tag} {vehicle_id} refers to unknown route {attrib['route']}, skipped")
+                return
+        common = dict(route=route, from_edge=attrib.get("from"), to_edge=attrib.get("to"),
+                      via=self._edges(attrib.get("via")), depart_lane=attrib.get("departLane"),
+                      depart_pos=attrib.get("departPos"), depart_speed=attrib.get("departSpeed"))
+        type_id = attrib.get("type", "DEFAULT_VEHTYPE")
+
+        if tag != "flow":
+            self.vehicles.append(Departure(vehicle_id, type_id, _time(attrib.get("depart"), 0.0), **common))
+            return
+
+        period = attrib.get("period")
+        rate = None
+        if period is not None and period.startswith("exp("):
+            rate, period = float(period[4:-1]), None  # Poisson arrivals, period="exp(rate)"
+        elif period is not None:
+            period = float(period)
+        elif attrib.get("vehsPerHour") is not None:
+            period = 3600.0 / float(attrib["vehsPerHour"])
+        probability = attrib.get("probability")
+        number = attrib.get("number")
+        self.flows.append(Flow(vehicle_id, type_id, begin=_time(attrib.get("begin"), 0.0),
+                               end=_time(attrib.get("end"), None), period=period, rate=rate,
+                               probability=float(probability) if probability is not None else None,
+                               number=int(number) if number is not None else None, **common))
+
     def get_routes(self) -> dict[str, Route]:
         return self.routes
 
@@ -77,3 +196,26 @@ class RouteXMLParser:
 
     def get_route_groups(self) -> dict[str, list[str]]:
         return self.route_groups
+
+    def get_route_group_index(self) -> dict[str, tuple[str, int]]:
+        return self.route_group_index
+
+    def get_vehicles(self) -> list[Departure]:
+        return self.vehicles
+
+    def get_flows(self) -> list[Flow]:
+        return self.flows
+
+    def iter_departures(self, rng=None):
+        """
+        All departures of the file (vehicles, trips and flow vehicles) in departure-time order.
+        Flow vehicles are created only when reached, so long flows cost no memory up front.
+
+        Args:
+            rng (random.Random, optional): Random source of Poisson and probability flows. Defaults to the random module.
+
+        Yields:
+            Departure: The next departing vehicle.
+        """
+        vehicles = sorted(self.vehicles, key=attrgetter("depart"))
+        yield from heapq.merge(vehicles, *(flow.departures(rng) for flow in self.flows), key=attrgetter("depart"))
@@ -0,0 +1,156 @@
+# Test/benchmark_entity_memory.py
+
+import os
+import gc
+import sys
+import time
+import tracemalloc
+
+# Add project root to sys.path for testing
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, ".."))
+sys.path.append(project_root)
+
+from Entity.lane import Lane
+from Entity.fulllane import FullLane
+from Entity.vehicle import Vehicle, VehicleType, VehicleStatus
+from Entity.route import Route
+from Controller.slot_generator import SlotGenerator
+from Controller.slot_controller import SlotController
+
+# Synthetic network: parallel straight FullLanes holding ~100k slots in total
+TARGET_SLOTS = 100_000
+STEADY_STATE_SLOTS = 10_000  # Smaller network driven past a full slot turnover
+LANE_COUNT = 10
+LANE_SPEED = 30.0
+SLOT_LENGTH = 8.0
+SLOT_GAP = 3.0
+
+
+class DictSlot:
+    """
+    Reference layout of the former dict-based Slot, used as the memory baseline.
+    """
+    def __init__(self, id, segment_id, lane, index, position_start, speed, length, gap_to_previous, full_lane):
+        self.id = id
+        self.segment_id = segment_id
+        self.lane = lane
+        self.index = index
+        self.position_start = position_start
+        self.length = length
+        self.gap_to_previous = gap_to_previous
+        self.speed = speed
+        self.position_end = position_start + length
+        self.center = (position_start + length / 2, 0.0)
+        self.heading = 0.0
+        self.occupied = False
+        self.vehicle_id = None
+        self.full_lane = full_lane
+        self.busy = False
+
+
+class DictVehicle:
+    """
+    Reference layout of the former dict-based Vehicle, used as the memory baseline.
+    """
+    def __init__(self, id, current_slot, route, vehicle_type, speed, position, status):
+        self.id = id
+        self.current_slot = current_slot
+        self.route = route
+        self.vehicle_type = vehicle_type
+        self.speed = speed
+        self.position = position
+        self.status = status
+        self.previous_slot = None
+        self.heading = 0.0
+
+
+def build_full_lanes(target_slots=TARGET_SLOTS):
+    lane_length = target_slots / LANE_COUNT * (SLOT_LENGTH + SLOT_GAP)
+    full_lanes = []
+    for i in range(LANE_COUNT):
+        y = i * 3.2
+        lane = Lane(id=f"bench{i}_0", index=0, speed=LANE_SPEED, shape=f"0.0,{y} {lane_length + SLOT_LENGTH},{y}")
+        full_lane = FullLane(start_lane_id=lane.id)
+        full_lane.add_lane(lane)
+        full_lanes.append(full_lane)
+    return full_lanes
+
+
+def measure(label, factory):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = factory()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"[BENCH] {label:<34} {len(objects):>7} objects  {(after - before) / len(objects):8.1f} bytes/object")
+    return objects, (after - before) / len(objects)
+
+
+def measure_steady_state():
+    """
+    Memory per live slot after every generated slot has expired and been replaced through the
+    SlotPool, i.e. including the retired store, the pool and the recycled slot objects.
+
+    Returns:
+        float: Traced bytes per live slot.
+    """
+    full_lanes = build_full_lanes(STEADY_STATE_SLOTS)
+    slot_generator = SlotGenerator(slot_length=SLOT_LENGTH, slot_gap=SLOT_GAP)
+    # One slot spacing per step, so that every step spawns exactly one slot per lane
+    time_step = (SLOT_LENGTH + SLOT_GAP) / LANE_SPEED
+    turnover_steps = int(full_lanes[0].get_total_length() / (LANE_SPEED * time_step)) + 2
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    slot_generator.generate_slots_for_all_full_lanes(full_lanes)
+    slot_controller = SlotController(slot_generator, full_lanes, time_step=time_step)
+    for _ in range(turnover_steps):
+        slot_controller.step()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    live_slots = sum(len(fl.slots) for fl in full_lanes)
+    print(f"[BENCH] {'Slot (store-backed, steady state)':<34} {live_slots:>7} objects  "
+          f"{(after - before) / live_slots:8.1f} bytes/object  ({turnover_steps} steps, "
+          f"pool {slot_generator.slot_pool.size}, retired rows {len(slot_generator.slot_pool.retired_store)})")
+    return (after - before) / live_slots
+
+
+if __name__ == "__main__":
+    full_lanes = build_full_lanes()
+    lane = full_lanes[0].lanes[0]
+
+    slot_generator = SlotGenerator(slot_length=SLOT_LENGTH, slot_gap=SLOT_GAP)
+    slots, slot_bytes = measure("Slot (store-backed, __slots__)",
+                                lambda: slot_generator.generate_slots_for_all_full_lanes(full_lanes))
+    _, dict_slot_bytes = measure("Slot (dict-based reference)",
+                                 lambda: [DictSlot(f"slot_{i}", "seg", lane, i, i * (SLOT_LENGTH + SLOT_GAP), 30.0,
+                                                   SLOT_LENGTH, SLOT_GAP, None)
+                                          for i in range(len(slots))])
+    steady_slot_bytes = measure_steady_state()
+
+    vtype = VehicleType("car", 2.6, 4.5, 27.78, 5.0)
+    route = Route("route_main_main", ["e1", "e2"])
+    measure("Vehicle (__slots__)",
+            lambda: [Vehicle(f"veh_{i}", slots[i], route, vtype, 30.0, 0.0, VehicleStatus.IDLE)
+                     for i in range(len(slots))])
+    measure("Vehicle (dict-based reference)",
+            lambda: [DictVehicle(f"veh_{i}", slots[i], route, vtype, 30.0, 0.0, VehicleStatus.IDLE)
+                     for i in range(len(slots))])
+
+    slot_controller = SlotController(slot_generator, full_lanes)
+    start = time.perf_counter()
+    for _ in range(100):
+        slot_controller.step()
+    elapsed = time.perf_counter() - start
+    print(f"[BENCH] SlotController.step with {len(slots)} slots: {elapsed / 100 * 1000:.3f} ms/step")
+
+    # The store-backed layout exists to save memory: fail loudly when it no longer does
+    for label, value in (("generated", slot_bytes), ("steady state", steady_slot_bytes)):
+        if value >= dict_slot_bytes:
+            raise AssertionError(f"Store-backed slots ({label}) use {value:.1f} bytes/object, "
+                                 f"not less than the dict-based reference ({dict_slot_bytes:.1f})")
+    print("[BENCH] Store-backed slots are smaller than the dict-based reference.")
@@ -0,0 +1,75 @@
+# Test/test_async_env.py
+
+import os
+import sys
+import asyncio
+import threading
+
+# Add project root to sys.path for testing
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, ".."))
+sys.path.append(project_root)
+
+from Config.config import default_config
+from Env.async_env import gather_create, gather_reset, gather_step, gather_close
+
+NUM_ENVS = 3
+STEPS = 20
+ROUNDS = 3
+
+
+async def run_round(configs):
+    # The event loop must keep running while the environments are built on their own threads
+    ticks = 0
+    stop = asyncio.Event()
+
+    async def ticker():
+        nonlocal ticks
+        while not stop.is_set():
+            ticks += 1
+            await asyncio.sleep(0.001)
+
+    ticker_task = asyncio.create_task(ticker())
+    envs = await gather_create(configs)
+    stop.set()
+    await ticker_task
+    assert ticks > 1, "Event loop blocked while creating the environments"
+
+    backends = [env.env.backend.name for env in envs]
+    assert backends.count("libsumo") <= 1, f"libsumo claimed by several environments: {backends}"
+    try:
+        await gather_reset(envs)
+        for step in range(STEPS):
+            results = await gather_step(envs, [{} for _ in envs])
+            assert len(results) == len(envs)
+    finally:
+        await gather_close(envs)
+    return backends
+
+
+if __name__ == "__main__":
+    print(f"[TEST] Creating and stepping {NUM_ENVS} 'auto' environments concurrently")
+    configs = []
+    for env_index in range(NUM_ENVS):
+        config = dict(default_config)
+        config.update({"use_gui": False, "backend": "auto", "max_steps": STEPS,
+                       "sumo_config": f"Sim/temp_test_async_{env_index}.sumocfg"})
+        configs.append(config)
+
+    try:
+        for round_index in range(ROUNDS):
+            backends = asyncio.run(run_round(configs))
+            print(f"[TEST] Round {round_index}: backends {backends}")
+    finally:
+        for config in configs:
+            if os.path.exists(config["sumo_config"]):
+                os.remove(config["sumo_config"])
+    assert threading.active_count() == 1, "Environment threads left running"
+
+    try:
+        asyncio.run(gather_create([dict(default_config), dict(default_config)]))
+        raise AssertionError("Environments sharing a sumo_config file must be rejected")
+    except ValueError:
+        pass
+
+    print("[TEST] Async environment test passed.")
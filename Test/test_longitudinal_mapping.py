@@ -0,0 +1,46 @@
+# Test/test_longitudinal_mapping.py
+
+import os
+import sys
+import time
+
+# Add project root to sys.path for testing
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, ".."))
+sys.path.append(project_root)
+
+from Entity.fulllane import FullLane
+from Entity.lane import Lane
+
+
+def full_lane(lane_id, shape):
+    fl = FullLane(start_lane_id=lane_id)
+    fl.add_lane(Lane(id=lane_id, index=0, speed=30.0, shape=shape))
+    return fl
+
+
+if __name__ == "__main__":
+    print("[TEST] Long parallel lanes map in linear time")
+    points = 4000
+    own = full_lane("a_0", [(float(i), 0.0) for i in range(points)])
+    neighbor = full_lane("a_1", [(float(i) + 0.5, 3.2) for i in range(points)])
+    start = time.perf_counter()
+    own.build_longitudinal_mapping(neighbor)
+    elapsed = time.perf_counter() - start
+    source, target = own.longitudinal_maps[neighbor]
+    assert len(source) == 2 * points, "Expected a breakpoint at every vertex of both lanes"
+    assert all(t0 <= t1 for t0, t1 in zip(target, target[1:])), "Mapping is not monotone"
+    assert abs(own.project_position_to(neighbor, 1234.25) - 1233.75) < 1e-9, "Wrong mapped position"
+    print(f"[TEST] {points} points per lane mapped in {elapsed * 1000:.1f} ms")
+
+    print("[TEST] A lane curving back next to its neighbor does not capture the mapping")
+    # The return leg of the hairpin (y=6) is closer to the neighbor (y=3.2) than the outbound leg (y=0)
+    hairpin = full_lane("h_0", [(float(x), 0.0) for x in range(0, 201, 10)] + [(210.0, 3.0)]
+                        + [(float(x), 6.0) for x in range(200, -1, -10)])
+    straight = full_lane("h_1", [(float(x), 3.2) for x in range(0, 201, 10)])
+    projected = hairpin._project_polyline(straight.full_shape)
+    assert projected[:-1] == [float(x) for x in range(0, 200, 10)], "Neighbor vertices snapped to the far leg"
+    hairpin.build_longitudinal_mapping(straight)
+    assert abs(hairpin.project_position_to(straight, 50.0) - 50.0) < 1e-9, "Wrong mapped position on the hairpin"
+
+    print("[TEST] Longitudinal mapping test passed.")
@@ -0,0 +1,56 @@
+# Test/test_net_cache.py
+
+import os
+import sys
+import tempfile
+import time
+
+# Add project root to sys.path for testing
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, ".."))
+sys.path.append(project_root)
+
+from Sumo.sumo_netxml_parser import NetXMLParser
+from Sumo.net_cache import get_cache_path
+
+NET_FILE = os.path.join("Sim", "test.net.xml")
+
+
+def describe(parser):
+    """
+    Summarize lanes, FullLanes and their neighbor relations with FullLanes replaced by their start lane ID.
+    """
+    full_lanes = parser.build_full_lanes()
+    name = {fl: fl.start_lane_id for fl in full_lanes}
+    lanes = {lane_id: (lane.index, lane.speed, lane.shape) for lane_id, lane in parser.lane_dict.items()}
+    summary = []
+    for fl in full_lanes:
+        summary.append((fl.start_lane_id, [lane.id for lane in fl.lanes], fl.full_shape, fl.cumulative_lengths,
+                        fl.segment_directions, fl.segment_headings, fl.lane_start_indices,
+                        [(start, end, name[n], d) for start, end, n, d in fl.neighbor_full_lanes],
+                        [(start, end, name[n], d) for start, end, n, d in fl.neighbor_intervals],
+                        {name[n]: mapping for n, mapping in fl.longitudinal_maps.items()},
+                        {lane.id: fl.get_lane_interval(lane.id) for lane in fl.lanes}))
+    return lanes, summary, parser.get_lane_connections()
+
+
+if __name__ == "__main__":
+    print("[TEST] Compiled network cache against XML parsing")
+    expected = describe(NetXMLParser(NET_FILE))
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        compiled = describe(NetXMLParser(NET_FILE, cache_dir=cache_dir))  # Cache miss: parse and compile
+        assert os.path.exists(os.path.join(get_cache_path(NET_FILE, cache_dir), "meta.json")), "No artifact written"
+        assert compiled == expected, "Network served after compiling differs from XML parsing"
+
+        start = time.perf_counter()
+        parser = NetXMLParser(NET_FILE, cache_dir=cache_dir)  # Cache hit
+        assert describe(parser) == expected, "Cached network differs from XML parsing"
+        elapsed = time.perf_counter() - start
+
+        # Each call builds independent FullLanes, as with XML parsing
+        first, second = parser.build_full_lanes(), parser.build_full_lanes()
+        assert all(a is not b for a, b in zip(first, second)), "FullLanes shared between calls"
+
+    print(f"[TEST] {len(expected[0])} lanes, {len(expected[1])} FullLanes, cached load {elapsed * 1000:.2f} ms")
+    print("[TEST] Network cache test passed.")
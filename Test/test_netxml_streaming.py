@@ -0,0 +1,40 @@
+# Test/test_netxml_streaming.py
+
+import os
+import sys
+import xml.etree.ElementTree as ET
+
+# Add project root to sys.path for testing
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, ".."))
+sys.path.append(project_root)
+
+from Sumo.sumo_netxml_parser import NetXMLParser, decode_shapes
+
+NET_FILE = os.path.join("Sim", "test.net.xml")
+
+
+if __name__ == "__main__":
+    print("[TEST] Vectorized shape decoding")
+    points, offsets = decode_shapes(["0.0,1.5 2.25,3.0", " 4.5,5.0 ", "1.0,2.0,9.0 3.0,4.0,9.0", "7.0,8.0"])
+    assert offsets.tolist() == [0, 2, 3, 5, 6], "Wrong point offsets"
+    assert points.tolist() == [[0.0, 1.5], [2.25, 3.0], [4.5, 5.0], [1.0, 2.0], [3.0, 4.0], [7.0, 8.0]], \
+        "Wrong points (z coordinates must be dropped)"
+    points, offsets = decode_shapes(["0,1  2,3", "4,5"])  # Irregular spacing takes the fallback path
+    assert points.tolist() == [[0.0, 1.0], [2.0, 3.0], [4.0, 5.0]] and offsets.tolist() == [0, 2, 3]
+
+    print("[TEST] Single-pass parsing against an ElementTree reference")
+    parser = NetXMLParser(NET_FILE)
+    root = ET.parse(NET_FILE).getroot()
+    reference = {
+        lane.get("id"): (int(lane.get("index")), float(lane.get("speed")),
+                         [tuple(map(float, pair.split(","))) for pair in lane.get("shape").split()])
+        for edge in root.findall("edge") for lane in edge.findall("lane")
+    }
+    parsed = {lane_id: (lane.index, lane.speed, lane.shape) for lane_id, lane in parser.lane_dict.items()}
+    assert list(parsed) == list(reference) and parsed == reference, "Lanes differ from the reference"
+    assert len(parser.connections) == len(root.findall("connection")), "Connections missing"
+    assert parser.build_full_lanes(), "No FullLanes built from the recorded connections"
+
+    print(f"[TEST] {len(parsed)} lanes, {len(parser.connections)} connections")
+    print("[TEST] Streaming net parser test passed.")
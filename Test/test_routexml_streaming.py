@@ -0,0 +1,69 @@
+# Test/test_routexml_streaming.py
+
+import os
+import sys
+import random
+import tempfile
+
+# Add project root to sys.path for testing
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, ".."))
+sys.path.append(project_root)
+
+from Sumo.sumo_routexml_parser import RouteXMLParser
+
+DEMAND = """<routes>
+    <vType id="car" accel="2.0" decel="4.0" maxSpeed="30.0" length="4.5"/>
+    <route id="route_main_main" edges="a b c"/>
+    <route id="route_main_offramp2" edges="a b x2"/>
+    <route id="route_main_offramp1" edges="a x1"/>
+    <route id="route_other" edges="a b c"/>
+    <vehicle id="v0" type="car" depart="5.0" route="route_main_offramp1"/>
+    <vehicle id="v1" type="car" depart="1.0" departLane="best"><route edges="a b c"/></vehicle>
+    <vehicle id="v2" type="car" depart="2.0" route="unknown"/>
+    <trip id="t0" type="car" depart="3.0" from="a" to="c" via="b"/>
+    <flow id="f0" type="car" begin="0" end="10" period="4" route="route_main_main"/>
+    <flow id="f1" type="car" begin="0" vehsPerHour="1800" number="3" route="route_main_offramp2"/>
+    <flow id="f2" type="car" begin="0" end="100" period="exp(0.5)" from="a" to="c"/>
+    <flow id="f3" type="car" begin="0" end="4" number="2" route="route_main_main"/>
+</routes>
+"""
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as directory:
+        file_path = os.path.join(directory, "demand.rou.xml")
+        with open(file_path, "w") as f:
+            f.write(DEMAND)
+        parser = RouteXMLParser(file_path)
+
+    print("[TEST] Routes, interning and route groups")
+    routes = parser.get_routes()
+    assert routes["route_main_main"].edges is routes["route_other"].edges, "Equal edge lists not shared"
+    assert parser.get_route_groups() == {
+        "main_forward": ["route_main_offramp1", "route_main_offramp2", "route_main_main"]}, "Wrong route groups"
+    assert parser.get_route_group_index()["route_main_offramp2"] == ("main_forward", 1), "Wrong route group index"
+
+    print("[TEST] Vehicles and trips")
+    vehicles = {vehicle.id: vehicle for vehicle in parser.get_vehicles()}
+    assert list(vehicles) == ["v0", "v1", "t0"], "Vehicle with an unknown route must be skipped"
+    assert vehicles["v1"].route.id == "!v1" and vehicles["v1"].route.edges is routes["route_other"].edges
+    assert vehicles["v1"].depart_lane == "best"
+    assert vehicles["t0"].route is None and vehicles["t0"].via == ("b",)
+
+    print("[TEST] Lazy flow departures")
+    flows = {flow.id: flow for flow in parser.get_flows()}
+    assert [d.depart for d in flows["f0"].departures()] == [0.0, 4.0, 8.0], "Wrong periodic departures"
+    assert [d.id for d in flows["f1"].departures()] == ["f1.0", "f1.1", "f1.2"], "number must bound the flow"
+    assert [d.depart for d in flows["f1"].departures()] == [0.0, 2.0, 4.0], "vehsPerHour not converted"
+    assert [d.depart for d in flows["f3"].departures()] == [0.0, 2.0], "number not spread over [begin, end)"
+    poisson = [d.depart for d in flows["f2"].departures(random.Random(0))]
+    assert 20 < len(poisson) < 80 and all(0.0 < t < 100.0 for t in poisson), "Wrong Poisson departures"
+
+    departures = list(parser.iter_departures(random.Random(0)))
+    times = [d.depart for d in departures]
+    assert times == sorted(times), "Departures not in time order"
+    assert len(departures) == 3 + 3 + 3 + 2 + len(poisson), "Departures missing"
+
+    print(f"[TEST] {len(departures)} departures from {len(parser.get_flows())} flows")
+    print("[TEST] Streaming route parser test passed.")
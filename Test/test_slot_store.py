@@ -0,0 +1,81 @@
+# Test/test_slot_store.py
+
+import os
+import sys
+import math
+import time
+import random
+
+# Add project root to sys.path for testing
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, ".."))
+sys.path.append(project_root)
+
+from Sumo.sumo_netxml_parser import NetXMLParser
+from Controller.slot_generator import SlotGenerator
+from Controller.slot_controller import SlotController
+
+NET_FILE = "Sim/test.net.xml"
+STEPS = 500
+
+if __name__ == "__main__":
+    print("[TEST] Advancing slots through the vectorized SlotStore (no SUMO needed)")
+    parser = NetXMLParser(NET_FILE)
+    full_lanes = parser.build_full_lanes()
+
+    slot_generator = SlotGenerator()
+    slot_generator.generate_slots_for_all_full_lanes(full_lanes)
+    slot_controller = SlotController(slot_generator, full_lanes)
+
+    start = time.perf_counter()
+    removed_count = 0
+    for step in range(STEPS):
+        removed_count += len(slot_controller.step())
+    elapsed = time.perf_counter() - start
+
+    # Slot views must agree with the scalar interpolation on every FullLane
+    for fl in full_lanes:
+        positions = [slot.position_start for slot in fl.slots]
+        assert positions == sorted(positions), f"Slots out of order on {fl.start_lane_id}"
+        assert len(fl.slot_store) == len(fl.slots), f"Store rows leaked on {fl.start_lane_id}"
+        for slot in fl.slots:
+            (x, y), heading = fl.interpolate_position_and_heading(slot.position_start + slot.length / 2)
+            assert abs(slot.center[0] - x) < 1e-6 and abs(slot.center[1] - y) < 1e-6, f"Center mismatch on {slot.id}"
+            assert abs(slot.heading - heading) < 1e-6, f"Heading mismatch on {slot.id}"
+
+    print("[TEST] Arc-length slot index agrees with brute force")
+    rng = random.Random(0)
+    for fl in full_lanes:
+        for slot in list(fl.slots)[::3]:
+            slot.occupied = True
+        for _ in range(50):
+            # Query points around the lane, e.g. vehicles driving on it or on a merging ramp
+            (x, y), _ = fl.interpolate_position_and_heading(rng.uniform(0.0, fl.get_total_length()))
+            x += rng.uniform(-3.0, 3.0)
+            y += rng.uniform(-3.0, 3.0)
+            free = sorted((math.hypot(s.center[0] - x, s.center[1] - y), s.id) for s in fl.slots if not s.occupied)
+            expected = free[0][1] if free and free[0][0] < 15.0 else None
+            found = fl.slot_index.nearest_free_slot(x, y, radius=15.0)
+            assert (found.id if found else None) == expected, f"Wrong nearest free slot on {fl.start_lane_id}"
+            found = fl.slot_index.nearest_free_slot(x, y)
+            assert found is not None and found.id == free[0][1], f"Wrong unbounded nearest slot on {fl.start_lane_id}"
+            within = [s.id for s in fl.slot_index.slots_within(x, y, 15.0)]
+            assert within == [slot_id for d, slot_id in free if d < 15.0], "Wrong slots within radius"
+        for slot in list(fl.slots)[::3]:
+            slot.occupied = False
+
+    print("[TEST] Vehicle IDs are released with the last slot holding them")
+    fl = full_lanes[0]
+    table = fl.slot_store.vehicle_table
+    first, second = list(fl.slots)[:2]
+    for episode in range(3):
+        first.occupy(f"veh_{episode}")
+        second.occupy(f"veh_{episode}")
+        first.release()
+        assert len(table) == 1, "Entry freed while a slot still holds it"
+        second.release()
+        assert len(table) == 0 and len(table.ids) == 1, "Vehicle ID entry leaked or not reused"
+
+    total_slots = sum(len(fl.slots) for fl in full_lanes)
+    print(f"[TEST] {total_slots} slots, {removed_count} removed, {elapsed / STEPS * 1000:.3f} ms/step")
+    print("[TEST] SlotStore test passed.")
@@ -4,7 +4,6 @@ import os
 import sys
 import time
 import random
-import traci
 import math
 from collections import defaultdict
 
@@ -16,8 +15,10 @@ sys.path.append(project_root)
 from Sumo.sumo_netxml_parser import NetXMLParser
 from Sumo.sumo_routexml_parser import RouteXMLParser
 from Tools.utils import generate_temp_cfg
+from Backend.factory import create_backend
 from Controller.slot_generator import SlotGenerator
 from Controller.slot_controller import SlotController
+from Controller.slot_renderer import SlotRenderer
 from Controller.vehicle_generator import VehicleGenerator
 from Controller.merge_controller import MergeController
 from Controller.vehicle_controller import VehicleController
@@ -43,8 +44,9 @@ if __name__ == "__main__":
     default_vtype = route_parser.get_default_vehicle_type()
 
     # Start SUMO
-    traci.start([SUMO_BINARY, "-c", CFG_FILE])
-    traci.simulationStep()
+    backend = create_backend("traci")
+    backend.start([SUMO_BINARY, "-c", CFG_FILE])
+    backend.simulationStep()
 
     # Initialize slot system
     slot_generator = SlotGenerator()
@@ -54,38 +56,29 @@ if __name__ == "__main__":
     # Initialize vehicle system
     vehicle_generator = VehicleGenerator(routes, default_vtype)
 
-    rendered_slots = set()
     rendered_vehicles = set()
     vehicle_list = []
 
     # Visualize initial slots
-    for fl in full_lanes:
-        for slot in fl.slots:
-            if slot.center:
-                x, y = slot.center
-                try:
-                    traci.poi.add(slot.id, x, y, color=(255, 0, 0), layer=5)
-                    traci.poi.setParameter(slot.id, "label", slot.id)
-                    rendered_slots.add(slot.id)
-                except:
-                    pass
+    renderer = SlotRenderer(poi_parameters={"imgWidth": "5", "imgHeight": "5"}, backend=backend)
+    renderer.draw(full_lanes)
 
     # Initialize vehicle controller
-    vehicle_controller = VehicleController(vehicle_list, route_groups)
+    vehicle_controller = VehicleController(vehicle_list, route_groups, backend=backend)
 
     # Initialize merge controller
     ramp_to_fulllane_map = {
         "on_ramp1": "e2_0",
         "-on_ramp1": "-e6_0"
     }
-    merge_controller = MergeController(full_lanes, ramp_to_fulllane_map, safety_gap=5.0)
+    merge_controller = MergeController(full_lanes, ramp_to_fulllane_map, safety_gap=5.0, backend=backend)
 
     print("[TEST] Start adding vehicles dynamically and updating slots")
     for step in range(5000):
-        traci.simulationStep()
+        backend.simulationStep()
 
-        # Advance slot controller and collect removed slots
-        removed = slot_controller.step()
+        # Advance slot controller
+        slot_controller.step()
 
         # Update all vehicle states
         vehicle_controller.step()
@@ -93,32 +86,8 @@ if __name__ == "__main__":
         # Merge controller checks merging conditions
         merge_controller.step(vehicle_list)
 
-        # Update existing slot positions or add new ones
-        for fl in full_lanes:
-            for slot in fl.slots:
-                if slot.center:
-                    if slot.id in rendered_slots:
-                        try:
-                            traci.poi.setPosition(slot.id, *slot.center)
-                        except:
-                            pass
-                    else:
-                        try:
-                            traci.poi.add(slot.id, *slot.center, color=(255, 0, 0), layer=5)
-                            traci.poi.setParameter(slot.id, "label", slot.id)
-                            traci.poi.setParameter(slot.id, "imgWidth", "5")
-                            traci.poi.setParameter(slot.id, "imgHeight", "5")
-                            rendered_slots.add(slot.id)
-                        except Exception as e:
-                            print(f"[WARN] Failed to add new slot {slot.id}: {e}")
-
-        # Remove disappeared slots
-        for old_slot, full_lane in removed:
-            try:
-                traci.poi.remove(old_slot.id)
-                rendered_slots.discard(old_slot.id)
-            except:
-                pass
+        # Draw new, moved and removed slots
+        renderer.update(full_lanes)
 
         # Add a new vehicle at step 30 (for demonstration)
         if step == 30:
@@ -158,7 +127,7 @@ if __name__ == "__main__":
                 try:
                     if vehicle.current_slot:
                         slot = vehicle.current_slot
-                        traci.vehicle.add(
+                        backend.vehicle.add(
                             vehID=vehicle.id,
                             routeID=vehicle.route.id,
                             typeID=vehicle.vehicle_type.id,
@@ -167,9 +136,9 @@ if __name__ == "__main__":
                             departLane=slot.lane.id.split("_")[-1]
                         )
                         # Disable lane change and auto acceleration
-                        traci.vehicle.setLaneChangeMode(vehicle.id, 256)
-                        traci.vehicle.setSpeedMode(vehicle.id, 0)
-                        traci.vehicle.setSpeed(vehicle.id, vehicle.speed)
+                        backend.vehicle.setLaneChangeMode(vehicle.id, 256)
+                        backend.vehicle.setSpeedMode(vehicle.id, 0)
+                        backend.vehicle.setSpeed(vehicle.id, vehicle.speed)
 
                         # Use slot heading for precise placement
                         vehicle_length = vehicle.vehicle_type.length
@@ -180,12 +149,12 @@ if __name__ == "__main__":
 
                         edge_id = slot.lane.id.rsplit("_", 1)[0]
                         lane_index = int(slot.lane.id.rsplit("_", 1)[-1])
-                        traci.vehicle.moveToXY(
+                        backend.vehicle.moveToXY(
                             vehicle.id, edgeID=edge_id, laneIndex=lane_index,
                             x=x_front, y=y_front, angle=slot.heading, keepRoute=1
                         )
                     else:
-                        traci.vehicle.add(
+                        backend.vehicle.add(
                             vehID=vehicle.id,
                             routeID=vehicle.route.id,
                             typeID=vehicle.vehicle_type.id,
@@ -193,8 +162,8 @@ if __name__ == "__main__":
                             departSpeed="0",
                             departPos="0"
                         )
-                        traci.vehicle.setLaneChangeMode(vehicle.id, 256)
-                        traci.vehicle.setSpeedMode(vehicle.id, 0)
+                        backend.vehicle.setLaneChangeMode(vehicle.id, 256)
+                        backend.vehicle.setSpeedMode(vehicle.id, 0)
 
                     rendered_vehicles.add(vehicle.id)
                     vehicle_list.append(vehicle)
@@ -228,5 +197,5 @@ if __name__ == "__main__":
                 print("[ACTION] Execute lane change left (action 3)")
                 vehicle_controller.execute_slot_action(target_vehicle.current_slot, 3)
 
-    traci.close()
+    backend.close()
     print("[TEST] Test completed.")
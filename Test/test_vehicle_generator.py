@@ -4,7 +4,6 @@ import os
 import sys
 import time
 import random
-import traci
 import math
 from collections import defaultdict
 
@@ -16,8 +15,10 @@ sys.path.append(project_root)
 from Sumo.sumo_netxml_parser import NetXMLParser
 from Sumo.sumo_routexml_parser import RouteXMLParser
 from Tools.utils import generate_temp_cfg
+from Backend.factory import create_backend
 from Controller.slot_generator import SlotGenerator
 from Controller.slot_controller import SlotController
+from Controller.slot_renderer import SlotRenderer
 from Controller.vehicle_generator import VehicleGenerator
 from Controller.merge_controller import MergeController
 from Controller.vehicle_controller import VehicleController
@@ -43,8 +44,9 @@ if __name__ == "__main__":
     default_vtype = route_parser.get_default_vehicle_type()
 
     # Start SUMO
-    traci.start([SUMO_BINARY, "-c", CFG_FILE])
-    traci.simulationStep()
+    backend = create_backend("traci")
+    backend.start([SUMO_BINARY, "-c", CFG_FILE])
+    backend.simulationStep()
 
     # Initialize Slot system
     slot_generator = SlotGenerator()
@@ -54,24 +56,15 @@ if __name__ == "__main__":
     # Initialize Vehicle system
     vehicle_generator = VehicleGenerator(routes, default_vtype)
 
-    rendered_slots = set()
     rendered_vehicles = set()
     vehicle_list = []
 
     # Initial slot visualization
-    for fl in full_lanes:
-        for slot in fl.slots:
-            if slot.center:
-                x, y = slot.center
-                try:
-                    traci.poi.add(slot.id, x, y, color=(255, 0, 0), layer=5)
-                    traci.poi.setParameter(slot.id, "label", slot.id)
-                    rendered_slots.add(slot.id)
-                except:
-                    pass
+    renderer = SlotRenderer(poi_parameters={"imgWidth": "5", "imgHeight": "5"}, backend=backend)
+    renderer.draw(full_lanes)
 
     # Initialize vehicle controller
-    vehicle_controller = VehicleController(vehicle_list, route_groups)
+    vehicle_controller = VehicleController(vehicle_list, route_groups, backend=backend)
 
     # Initialize merge controller
     ramp_to_fulllane_map = {
@@ -79,14 +72,14 @@ if __name__ == "__main__":
         "-on_ramp1": "-e6_0"
     }
 
-    merge_controller = MergeController(full_lanes, ramp_to_fulllane_map, safety_gap=5.0)
+    merge_controller = MergeController(full_lanes, ramp_to_fulllane_map, safety_gap=5.0, backend=backend)
 
     print("[TEST] Start dynamically adding vehicles and updating slots")
     for step in range(5000):
-        traci.simulationStep()
+        backend.simulationStep()
 
-        # Advance slot and get removed ones
-        removed = slot_controller.step()
+        # Advance slots
+        slot_controller.step()
 
         # === Vehicle controller updates vehicle status in real time ===
         vehicle_controller.step()
@@ -94,32 +87,8 @@ if __name__ == "__main__":
         # === Merge controller checks for merges in real time ===
         merge_controller.step(vehicle_list)
 
-        # Update existing slot positions or add new slots
-        for fl in full_lanes:
-            for slot in fl.slots:
-                if slot.center:
-                    if slot.id in rendered_slots:
-                        try:
-                            traci.poi.setPosition(slot.id, *slot.center)
-                        except:
-                            pass
-                    else:
-                        try:
-                            traci.poi.add(slot.id, *slot.center, color=(255, 0, 0), layer=5)
-                            traci.poi.setParameter(slot.id, "label", slot.id)
-                            traci.poi.setParameter(slot.id, "imgWidth", "5")
-                            traci.poi.setParameter(slot.id, "imgHeight", "5")
-                            rendered_slots.add(slot.id)
-                        except Exception as e:
-                            print(f"[WARN] Failed to add new slot {slot.id}: {e}")
-
-        # Remove and regenerate slots
-        for old_slot, full_lane in removed:
-            try:
-                traci.poi.remove(old_slot.id)
-                rendered_slots.discard(old_slot.id)
-            except:
-                pass
+        # Draw new, moved and removed slots
+        renderer.update(full_lanes)
 
         # Add a vehicle every 30 steps (demo only)
         if step % 30 == 0:
@@ -162,7 +131,7 @@ if __name__ == "__main__":
                 try:
                     if vehicle.current_slot:
                         slot = vehicle.current_slot
-                        traci.vehicle.add(
+                        backend.vehicle.add(
                             vehID=vehicle.id,
                             routeID=vehicle.route.id,
                             typeID=vehicle.vehicle_type.id,
@@ -171,7 +140,7 @@ if __name__ == "__main__":
                             departLane=slot.lane.id.split("_")[-1]
                         )
                         # Disable lane changing
-                        traci.vehicle.setLaneChangeMode(vehicle.id, 256)
+                        backend.vehicle.setLaneChangeMode(vehicle.id, 256)
 
                         # Disable automatic acceleration
                         # Default (all checks enabled) -> [0 0 1 1 1 1 1] -> Speed mode = 31
@@ -181,8 +150,8 @@ if __name__ == "__main__":
                         # Run red light [0 0 0 0 1 1 1] = 7 (also requires setSpeed or slowDown)
                         # Force run red light even if someone is in intersection [0 1 0 0 1 1 1] = 39 (also requires setSpeed or slowDown)
 
-                        traci.vehicle.setSpeedMode(vehicle.id, 0)
-                        traci.vehicle.setSpeed(vehicle.id, vehicle.speed)
+                        backend.vehicle.setSpeedMode(vehicle.id, 0)
+                        backend.vehicle.setSpeed(vehicle.id, vehicle.speed)
 
                         # === Use slot.heading to accurately place the vehicle ===
                         vehicle_length = vehicle.vehicle_type.length
@@ -193,12 +162,12 @@ if __name__ == "__main__":
 
                         edge_id = slot.lane.id.rsplit("_", 1)[0]
                         lane_index = int(slot.lane.id.rsplit("_", 1)[-1])
-                        traci.vehicle.moveToXY(
+                        backend.vehicle.moveToXY(
                             vehicle.id, edgeID=edge_id, laneIndex=lane_index,
                             x=x_front, y=y_front, angle=slot.heading, keepRoute=1
                         )
                     else:
-                        traci.vehicle.add(
+                        backend.vehicle.add(
                             vehID=vehicle.id,
                             routeID=vehicle.route.id,
                             typeID=vehicle.vehicle_type.id,
@@ -206,8 +175,8 @@ if __name__ == "__main__":
                             departSpeed="0",
                             departPos="0"
                         )
-                        traci.vehicle.setLaneChangeMode(vehicle.id, 256)
-                        traci.vehicle.setSpeedMode(vehicle.id, 0)
+                        backend.vehicle.setLaneChangeMode(vehicle.id, 256)
+                        backend.vehicle.setSpeedMode(vehicle.id, 0)
 
                     rendered_vehicles.add(vehicle.id)
                     vehicle_list.append(vehicle)
@@ -216,5 +185,5 @@ if __name__ == "__main__":
                 except Exception as e:
                     print(f"[WARN] Failed to add {vehicle.id}: {e}")
 
-    traci.close()
+    backend.close()
     print("[TEST] Test completed")
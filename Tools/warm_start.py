@@ -0,0 +1,90 @@
+# Tools/warm_start.py
+
+import argparse
+import os
+import random
+import sys
+
+import numpy as np
+
+# Add the project root directory to sys.path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(current_dir, ".."))
+sys.path.append(project_root)
+
+from Config.config import default_config
+from Env.slot_based_env import SlotBasedEnv
+
+
+def _is_settled(env):
+    # Snapshot only between insertions: every added vehicle is driving and no placement is pending
+    return (env.time_step % env.spawn_interval == env.spawn_interval // 2
+            and not env.command_buffer.pending_moves
+            and all(env.registry.is_active(vehicle.id) for vehicle in env.vehicle_list))
+
+
+def generate_warm_start_snapshots(config, output_dir, warmup_steps=1000, num_snapshots=8, interval=300, seed=None):
+    """
+    Run the scenario once until traffic is at steady state and save snapshots that episodes can start from.
+
+    Each snapshot is a WorldSnapshot (slots and their occupancy, vehicles and their slot bindings,
+    generators, controllers) written as snapshot_<step>.pkl next to the simulator state file
+    snapshot_<step>.xml. Point the environment's "warm_start_dir" at output_dir and every reset()
+    starts from one of them at random. Snapshots can only be loaded by environments built from the
+    same net and route files, and by the backend family that wrote them (traci/libsumo share SUMO's
+    state format, inmemory/kinematic their own).
+
+    Args:
+        config (dict): SlotBasedEnv configuration of the scenario. GUI is forced off.
+        output_dir (str): Directory the snapshots are written to; created if missing.
+        warmup_steps (int, optional): Steps simulated before the first snapshot.
+        num_snapshots (int, optional): Number of snapshots to save.
+        interval (int, optional): Minimum steps between two snapshots, so they are not near-duplicates.
+        seed (int, optional): Seed of random and numpy for a reproducible set.
+
+    Returns:
+        List[str]: Paths of the saved snapshot files.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    if seed is not None:
+        random.seed(seed)
+        np.random.seed(seed)
+
+    env_config = dict(config)
+    env_config.update(use_gui=False, warm_reset=False, warm_start_dir=None)
+    env = SlotBasedEnv(env_config)
+    no_actions = {} if env_config.get("multi-agent", False) else []
+
+    paths = []
+    try:
+        env.reset()
+        next_step = warmup_steps
+        while len(paths) < num_snapshots:
+            env.step(no_actions)
+            if env.time_step < next_step or not _is_settled(env):
+                continue
+            stem = os.path.join(output_dir, f"snapshot_{env.time_step:06d}")
+            snapshot = env.take_snapshot(os.path.abspath(stem + ".xml"))
+            snapshot.save(stem + ".pkl")
+            paths.append(stem + ".pkl")
+            print(f"[WARM START] Saved {snapshot} with {len(env.vehicle_list)} vehicles")
+            next_step = env.time_step + interval
+    finally:
+        env.close()
+    return paths
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Save steady-state snapshots for SlotBasedEnv warm starts.")
+    parser.add_argument("output_dir", help="Directory the snapshots are written to")
+    parser.add_argument("--backend", default="traci", help="Simulator backend (default: traci)")
+    parser.add_argument("--warmup-steps", type=int, default=1000, help="Steps before the first snapshot")
+    parser.add_argument("--num-snapshots", type=int, default=8, help="Number of snapshots")
+    parser.add_argument("--interval", type=int, default=300, help="Minimum steps between snapshots")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed")
+    args = parser.parse_args()
+
+    scenario = dict(default_config)
+    scenario["backend"] = args.backend
+    generate_warm_start_snapshots(scenario, args.output_dir, warmup_steps=args.warmup_steps,
+                                  num_snapshots=args.num_snapshots, interval=args.interval, seed=args.seed)